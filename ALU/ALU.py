@@ -1,5 +1,6 @@
 import json
 import uuid
+from functools import reduce
 from typing import Dict, List, Optional
 
 class Port:
@@ -55,17 +56,18 @@ class Port:
         }
 
 class Gate:
+    # Every gate is a single reduction over a variable-length input list
     GATE_LOGIC = {
-        "AND": lambda a, b: a & b,
-        "OR": lambda a, b: a | b,
-        "XOR": lambda a, b: a ^ b,
-        "NOT": lambda a: 0 if a else 1,
-        "NAND": lambda a, b: 0 if (a & b) else 1,
-        "NOR": lambda a, b: 0 if (a | b) else 1,
-        "XNOR": lambda a, b: 0 if (a ^ b) else 1
+        "AND": lambda values: reduce(lambda a, b: a & b, values, 1),
+        "OR": lambda values: reduce(lambda a, b: a | b, values, 0),
+        "XOR": lambda values: reduce(lambda a, b: a ^ b, values, 0),
+        "NOT": lambda values: 0 if values[0] else 1,
+        "NAND": lambda values: 0 if reduce(lambda a, b: a & b, values, 1) else 1,
+        "NOR": lambda values: 0 if reduce(lambda a, b: a | b, values, 0) else 1,
+        "XNOR": lambda values: 0 if reduce(lambda a, b: a ^ b, values, 0) else 1
     }
 
-    def __init__(self, x, y, type):
+    def __init__(self, x, y, type, input_count: int = 2):
         self.uuid = str(uuid.uuid4())
         self.x = x
         self.y = y
@@ -73,31 +75,25 @@ class Gate:
         self.width = 100
         self.height = 50
         self.output = Port(self, "output", x=self.x + self.width, y=self.y + (self.height / 2))
-        self.inputs = []
-        
-        if type != "NOT":
-            self.inputs = [
-                Port(self, "input", x=self.x, y=self.y + (self.height / 4)),
-                Port(self, "input", x=self.x, y=self.y + (3 * self.height / 4))
-            ]
-        else:
-            self.inputs = [Port(self, "input", x=self.x, y=self.y + (self.height / 2))]
+
+        if type == "NOT":
+            input_count = 1
+        self.inputs = [
+            Port(self, "input", x=self.x, y=self.y + (2 * i + 1) * self.height / (2 * input_count))
+            for i in range(input_count)
+        ]
 
     def calculate(self):
-        if self.type == "NOT":
-            a = self.inputs[0].value
-            self.output.value = self.GATE_LOGIC[self.type](a)
-        else:
-            a = self.inputs[0].value if len(self.inputs) > 0 else 0
-            b = self.inputs[1].value if len(self.inputs) > 1 else 0
-            self.output.value = self.GATE_LOGIC[self.type](a, b)
+        values = [int(p.value) for p in self.inputs] or [0]
+        self.output.value = self.GATE_LOGIC[self.type](values)
 
     @classmethod
     def deserialize(cls, data: dict) -> 'Gate':
         gate = cls(
             x=data["x"],
             y=data["y"],
-            type=data["type"]
+            type=data["type"],
+            input_count=len(data["input"])
         )
         gate.output = Port.deserialize(data["output"], gate)
         gate.inputs = [Port.deserialize(p_data, gate) for p_data in data["input"]]
@@ -207,7 +203,8 @@ class ALU:
             visited.add(port)
             
             if port.type == "output":
-                port.gate.calculate()
+                if isinstance(port.gate, Gate):
+                    port.gate.calculate()
                 for conn in port.connected_to:
                     conn.value = port.value
                     propagate(conn)
@@ -297,7 +294,7 @@ class ALU:
             component_map[gate.uuid] = f"gate_{counter}"
             counter += 1
             code.append(
-                f"    {component_map[gate.uuid]} = Gate({gate.x}, {gate.y}, '{gate.type}')\n"
+                f"    {component_map[gate.uuid]} = Gate({gate.x}, {gate.y}, '{gate.type}', {len(gate.inputs)})\n"
                 f"    {component_map[gate.uuid]}.output.uuid = '{gate.output.uuid}'\n"
                 f"    {component_map[gate.uuid]}.inputs = []\n"
             )
@@ -0,0 +1,93 @@
+"""
+Benchmark the generated attribute codecs of eaglepy primitives on wire-heavy boards.
+
+    python benchmarks/attribute_codec.py [count ...] [--seed N]
+
+For each count this builds a ``<signals>`` section of that many board wires,
+spread over signals of a few dozen wires each like a routed board, then times
+parsing every wire and writing it back, both through ``Wire.CODEC`` and
+through one ``attributes.parse_or_default``/``set_attr`` call per attribute,
+as every primitive did before.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+try:
+    from lxml import etree
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+from taurus.eaglepy import attributes, constants, primitives  # noqa: E402
+
+Wire = primitives.Wire
+
+def board_wires(count, rng):
+    signals = etree.Element(constants.TAGS.SIGNALS)
+    signal = None
+    for i in range(count):
+        if i % 40 == 0:
+            signal = etree.SubElement(signals, constants.TAGS.SIGNAL, name=f"N${i // 40}")
+        x, y = rng.randrange(0, 4000) * 0.0254, rng.randrange(0, 4000) * 0.0254
+        wire = Wire(x, y, x + rng.choice((0, 1.27, 2.54)), y + rng.choice((0, 1.27)), 0.254, rng.choice((1, 16)))
+        if i % 10 == 0:
+            wire.curve = 90.0
+        wire.append_node(signal)
+    return [wire for signal in signals for wire in signal]
+
+def legacy_parse(n):
+    """Per-attribute parsing, as ``Wire.parse`` did before ``Wire.CODEC``."""
+    values = {}
+    for f in Wire.CODEC.fields:
+        if f.default is attributes.REQUIRED:
+            values[f.name] = attributes.parse(Wire, n, f.attr)
+        else:
+            values[f.name] = attributes.parse_or_default(Wire, n, f.attr, f.default)
+    return Wire(**values)
+
+def legacy_append_node(wire, parent):
+    """Per-attribute writing, as ``Wire.append_node`` did before ``Wire.CODEC``."""
+    n = etree.SubElement(parent, Wire.TAG_NAME)
+    for f in Wire.CODEC.fields:
+        default = None if f.default is attributes.REQUIRED else f.default
+        attributes.set_attr(wire, n, f.attr, getattr(wire, f.name), default)
+
+def codec_append_node(wire, parent):
+    wire.append_node(parent)
+
+def timed(function, items, *args):
+    start = time.perf_counter()
+    result = [function(item, *args) for item in items]
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("counts", nargs="*", type=int, default=[10_000, 100_000, 500_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'wires':>8} {'parse':>9} {'legacy':>9} {'write':>9} {'legacy':>9} {'speedup':>8}")
+    for count in args.counts:
+        nodes = board_wires(count, random.Random(args.seed))
+        wires, parse_time = timed(Wire.parse, nodes)
+        legacy_wires, legacy_parse_time = timed(legacy_parse, nodes)
+        assert [vars(w) == vars(l) for w, l in zip(wires, legacy_wires)] == [True] * count
+
+        out, legacy_out = etree.Element("out"), etree.Element("out")
+        _, write_time = timed(codec_append_node, wires, out)
+        _, legacy_write_time = timed(legacy_append_node, wires, legacy_out)
+        assert etree.tostring(out) == etree.tostring(legacy_out)
+
+        speedup = (legacy_parse_time + legacy_write_time) / (parse_time + write_time)
+        print(
+            f"{count:8} {parse_time:9.3f} {legacy_parse_time:9.3f} "
+            f"{write_time:9.3f} {legacy_write_time:9.3f} {speedup:7.2f}x"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark board generation on ripple-carry adders of increasing width.
+
+    python benchmarks/board.py [width ...]
+
+For each width this builds the same transistor-level adder as ``tracer.py``
+and times each step of its ``Board``: creating the elements, placing them,
+adding the signals and saving the ``.brd``, then the size of the file and the
+time to load it back.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from taurus.board import Board  # noqa: E402
+from taurus.eaglepy.eagle import Eagle  # noqa: E402
+from wire_up import build_adder  # noqa: E402
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("widths", nargs="*", type=int, default=[8, 32, 128])
+    args = parser.parse_args()
+
+    print(
+        f"{'bits':>5} {'parts':>7} {'signals':>8} {'init':>8} {'place':>8} "
+        f"{'wire_up':>8} {'save':>8} {'kB':>7} {'load':>8}"
+    )
+    for width in args.widths:
+        sch = build_adder(width)
+        board, init = timed(Board, sch)
+        _, place = timed(board.place)
+        _, wire_up = timed(board.wire_up)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "adder.brd")
+            _, save = timed(Eagle(drawing=board.drawing).save, path)
+            size = os.path.getsize(path)
+            _, load = timed(Eagle.load, path)
+        print(
+            f"{width:5} {len(board.elements):7} {len(board.eagle_board.signals):8} {init:8.4f} {place:8.4f} "
+            f"{wire_up:8.4f} {save:8.4f} {size / 1024:7.0f} {load:8.3f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark multi-sheet generation on ripple-carry adders of increasing width.
+
+    python benchmarks/sheets.py [width ...] [--max-instances N] [--blocks] [--processes N ...]
+
+For each width this builds the same transistor-level adder as ``tracer.py``,
+splits it with ``Schematic.partition``, then times ``Schematic.build`` and the
+save for each number of worker processes, with the wires cut between sheets.
+``--blocks`` keeps every full adder on one sheet.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from taurus.eaglepy.eagle import Eagle  # noqa: E402
+from wire_up import build_adder  # noqa: E402
+
+# Instances of one full adder in build_adder: two half adders and the OR gate
+FULL_ADDER_SIZE = 40
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("widths", nargs="*", type=int, default=[32, 128])
+    parser.add_argument("--max-instances", type=int, default=250)
+    parser.add_argument("--blocks", action="store_true", help="keep each full adder on one sheet")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    print(
+        f"{'bits':>5} {'parts':>7} {'sheets':>7} {'cut':>5} {'partition':>10} "
+        f"{'procs':>6} {'build':>8} {'save':>8}"
+    )
+    for width in args.widths:
+        for processes in args.processes:
+            sch = build_adder(width)
+            blocks = None
+            if args.blocks:
+                blocks = [
+                    sch.instances[i:i + FULL_ADDER_SIZE] for i in range(0, len(sch.instances), FULL_ADDER_SIZE)
+                ]
+            _, partition = timed(sch.partition, args.max_instances, blocks)
+            cut = sum(
+                target.sheet != instance.sheet
+                for instance in sch.instances for target, _ in instance.connections.values()
+            )
+            _, build = timed(sch.build, processes=processes)
+            with tempfile.TemporaryDirectory() as directory:
+                _, save = timed(Eagle(drawing=sch.drawing).save, os.path.join(directory, "adder.sch"))
+            print(
+                f"{width:5} {len(sch.instances):7} {len(sch.sheets):7} {cut:5} {partition:10.4f} "
+                f"{processes:6} {build:8.3f} {save:8.3f}"
+            )
+
+if __name__ == "__main__":
+    main()
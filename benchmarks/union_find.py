@@ -0,0 +1,57 @@
+"""
+Benchmark the ``UnionFind`` used by ``wire_up`` on millions of unions.
+
+    python benchmarks/union_find.py [count ...] [--seed N]
+
+Each count is timed on random unions over that many keys, on one long chain
+(the worst case for linking without rank) and on ``(part, pin)`` tuple keys.
+Flat time per operation across counts shows the near-constant amortized cost.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from taurus.schematic import UnionFind  # noqa: E402
+
+def random_pairs(count, rng):
+    return [(rng.randrange(count), rng.randrange(count)) for _ in range(count)]
+
+def chain_pairs(count, rng):
+    return [(i, i + 1) for i in range(count - 1)]
+
+def pin_pairs(count, rng):
+    keys = [(f"Q{i // 3}", "BCE"[i % 3]) for i in range(count)]
+    return [(keys[a], keys[b]) for a, b in random_pairs(count, rng)]
+
+WORKLOADS = {"random": random_pairs, "chain": chain_pairs, "pins": pin_pairs}
+
+def run(pairs):
+    uf = UnionFind()
+    start = time.perf_counter()
+    for x, y in pairs:
+        uf.union(x, y)
+    for x, _ in pairs:
+        uf.find(x)
+    elapsed = time.perf_counter() - start
+    return len(uf.groups()), elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("counts", nargs="*", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'workload':>8} {'unions':>9} {'sets':>9} {'seconds':>9} {'ns/op':>7}")
+    for count in args.counts:
+        for name, workload in WORKLOADS.items():
+            pairs = workload(count, random.Random(args.seed))
+            sets, elapsed = run(pairs)
+            print(f"{name:>8} {count:9} {sets:9} {elapsed:9.3f} {elapsed / (2 * len(pairs)) * 1e9:7.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark schematic routing on ripple-carry adders of increasing width.
+
+    python benchmarks/wire_up.py [width ...] [--tracks-only] [--no-route] [--no-coalesce] [--rows] [--processes N]
+
+For each width this builds the same transistor-level adder as ``tracer.py``,
+then times track assignment against the previous first-fit scan, and the whole
+``wire_up`` unless ``--tracks-only`` is given, with the number and total length
+of the wires it drew, the size of the saved ``.sch`` and the time to load it.
+Instances are laid out by ``Schematic.place`` first, unless ``--rows`` keeps
+the resistor and transistor rows.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from taurus import schematic  # noqa: E402
+from taurus.eaglepy.eagle import Eagle  # noqa: E402
+
+# (source, pin, target, pin) over the instances of one half adder, as in tracer.py
+HALF_ADDER_PARTS = "QQRQRQQRQRQQRQRQQR"
+HALF_ADDER_WIRES = [
+    (0, "C", 2, "1"), (0, "E", 1, "C"), (1, "E", 3, "B"), (3, "C", 4, "1"), (4, "2", 3, "E"),
+    (5, "C", 7, "1"), (5, "E", 6, "C"), (6, "E", 8, "B"), (8, "C", 9, "1"), (9, "2", 8, "E"),
+    (10, "C", 12, "1"), (10, "E", 11, "C"), (11, "E", 13, "B"), (13, "C", 14, "1"), (14, "2", 13, "E"),
+    (15, "C", 17, "1"), (15, "E", 16, "C"), (8, "C", 15, "B"), (13, "C", 16, "B"), (17, "2", 16, "E"),
+]
+
+def add(sch, prefix):
+    return sch.add_instance("BJT_", "NPN", "Q") if prefix == "Q" else sch.add_instance("R_", "RES", "R")
+
+def half_adder(sch):
+    parts = [add(sch, prefix) for prefix in HALF_ADDER_PARTS]
+    for source, pin, target, target_pin in HALF_ADDER_WIRES:
+        parts[source].wire(pin, parts[target], target_pin)
+    return {"carry": parts[3], "sum": parts[15], "a": parts[0], "b": parts[1]}
+
+def full_adder(sch):
+    ha1, ha2 = half_adder(sch), half_adder(sch)
+    q_or1, r_or1, q_or2, r_or2 = add(sch, "Q"), add(sch, "R"), add(sch, "Q"), add(sch, "R")
+    ha1["sum"].wire("C", ha2["a"], "B")
+    ha1["carry"].wire("C", q_or1, "B")
+    ha2["carry"].wire("C", q_or1, "B")
+    q_or1.wire("C", r_or1, "1")
+    r_or1.wire("2", q_or1, "E")
+    q_or2.wire("C", r_or2, "1")
+    r_or2.wire("2", q_or2, "E")
+    return {"carry_out": q_or2, "carry_in": ha2["b"]}
+
+def build_adder(width):
+    sch = schematic.Schematic()
+    sch.init_libraries("transistor-npn", "resistor-power")
+    sch.init_device(sch.init_device_set("BJT_", "Q"), "NPN")
+    sch.init_device(sch.init_device_set("R_", "R"), "RES")
+    adders = [full_adder(sch) for _ in range(width)]
+    for previous, adder in zip(adders, adders[1:]):
+        previous["carry_out"].wire("C", adder["carry_in"], "B")
+    return sch
+
+def horizontal_ranges(sch):
+    positions = {}
+    for instance in sch.instances:
+        inst = instance.eagle_instance
+        for pin_name, position in schematic.symbol_table(inst.gate.symbol).pin_positions(inst):
+            positions[(inst.part.name, pin_name)] = position
+    ranges = []
+    for instance in sch.instances:
+        for pin, (target, target_pin) in instance.connections.items():
+            start = positions[(instance.eagle_instance.part.name, pin)]
+            end = positions[(target.eagle_instance.part.name, target_pin)]
+            if start[0] != end[0]:
+                ranges.append((min(start[0], end[0]), max(start[0], end[0])))
+    return ranges
+
+def first_fit(ranges):
+    """The scan ``wire_up`` used before ``assign_tracks``."""
+    tracks = []
+    for x_range in sorted(ranges):
+        for track in tracks:
+            if not any(x_range[0] < t[1] and x_range[1] > t[0] for t in track):
+                track.append(x_range)
+                break
+        else:
+            tracks.append([x_range])
+    return len(tracks)
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def wire_totals(sch):
+    wires = [
+        item for net in sch.sheet.nets for segment in net.segments
+        for item in segment.items if isinstance(item, schematic.Wire)
+    ]
+    return len(wires), sum(abs(w.x2 - w.x1) + abs(w.y2 - w.y1) for w in wires)
+
+def saved_size_and_load_time(sch):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "adder.sch")
+        Eagle(drawing=sch.drawing).save(path)
+        _, load_time = timed(Eagle.load, path)
+        return os.path.getsize(path), load_time
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("widths", nargs="*", type=int, default=[4, 8, 16, 32, 64])
+    parser.add_argument("--tracks-only", action="store_true", help="skip timing the full wire_up")
+    parser.add_argument("--no-route", action="store_true", help="draw doglegs instead of routing")
+    parser.add_argument("--no-coalesce", action="store_true", help="keep overlapping wires as drawn")
+    parser.add_argument("--rows", action="store_true", help="keep the row layout instead of placing")
+    parser.add_argument("--processes", type=int, help="worker processes for routing")
+    args = parser.parse_args()
+
+    print(
+        f"{'bits':>5} {'parts':>7} {'ranges':>7} {'tracks':>7} {'heap':>10} {'scan':>10} "
+        f"{'place':>10} {'wire_up':>10} {'wires':>7} {'length':>10} {'kB':>7} {'load':>8}"
+    )
+    for width in args.widths:
+        sch = build_adder(width)
+        place = "-"
+        if not args.rows:
+            place = f"{timed(sch.place)[1]:.4f}"
+        ranges = horizontal_ranges(sch)
+        (_, count), heap_time = timed(schematic.assign_tracks, ranges)
+        scan_count, scan_time = timed(first_fit, ranges)
+        assert scan_count == count
+        wire_up = wires = length = size = load = "-"
+        if not args.tracks_only:
+            wire_up = timed(
+                sch.wire_up, route=not args.no_route, processes=args.processes, coalesce=not args.no_coalesce
+            )[1]
+            wire_up = f"{wire_up:.4f}"
+            wires, length = wire_totals(sch)
+            length = f"{length:.0f}"
+            size, load = saved_size_and_load_time(sch)
+            size, load = f"{size / 1024:.0f}", f"{load:.3f}"
+        print(
+            f"{width:5} {len(sch.instances):7} {len(ranges):7} {count:7} "
+            f"{heap_time:10.4f} {scan_time:10.4f} {place:>10} {wire_up:>10} {wires:>7} {length:>10} "
+            f"{size:>7} {load:>8}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Static timing and complexity report for a saved project.
+
+    python analyze.py [project.json] [--json] [--cones N] [--max-depth N]
+
+With ``--max-depth`` the command exits non-zero when any output is deeper,
+so it can guard design complexity in CI without running vectors.
+"""
+
+import argparse
+import json
+import sys
+
+from gates.Analysis import analyze, format_analysis
+from gates.Netlist import Netlist
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Static analysis of a Taurus project")
+    parser.add_argument("project", nargs="?", default="project.json")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--top", type=int, default=5, help="fan-out hot spots to list")
+    parser.add_argument("--cones", type=int, default=5, help="slowest outputs to count fan-in cones for")
+    parser.add_argument("--max-depth", type=int, help="fail when an output is deeper than this")
+    args = parser.parse_args(argv)
+
+    with open(args.project, "r") as file:
+        net = Netlist.from_project(json.load(file))
+    report = analyze(net, top=args.top, cones=args.cones)
+    print(json.dumps(report, indent=4) if args.json else format_analysis(report))
+
+    if args.max_depth is not None and report["depth"] > args.max_depth:
+        print(f"Logic depth {report['depth']} exceeds {args.max_depth}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Board (PCB) generation for generated schematics.
+
+Each part of a ``Schematic`` becomes an ``Element`` with the package of its
+device, laid out by the ``Placer`` from the same wiring as the schematic, and
+each net a ``Signal`` of ``Contact_Ref``s to the pads of its pins, left as
+airwires for EAGLE's autorouter. Signals are named like the schematic's nets,
+so EAGLE pairs the two files.
+"""
+
+from pathlib import Path
+
+from .eaglepy.eagle import (
+    Eagle, Drawing, Grid, Board as EagleBoard, Element, Library, Package, Connect, Signal
+)
+from .eaglepy import constants, default_layers
+from .eaglepy.primitives import Wire, Pad, SMD, Contact_Ref
+from .placer import Placer
+from .schematic import connection_graph, get_pins_from_symbol
+
+def default_package(name, pad_names, pitch=2.54, drill=0.8):
+    """
+    A through-hole ``Package`` with one round pad per name, in a row ``pitch``
+    apart around the origin, outlined on tPlace.
+    """
+    start = -(len(pad_names) - 1) * pitch / 2
+    items = [Pad(name=pad, x=start + i * pitch, y=0, drill=drill) for i, pad in enumerate(pad_names)]
+    x1, y1 = start - pitch / 2, -pitch / 2
+    x2, y2 = -x1, pitch / 2
+    corners = [(x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1)]
+    items += [
+        Wire(x1=xa, y1=ya, x2=xb, y2=yb, width=0.127, layer=constants.LAYERS.TPLACE)
+        for (xa, ya), (xb, yb) in zip(corners, corners[1:])
+    ]
+    return Package(name, items=items)
+
+def package_footprint(package):
+    """Bounding box of the pads, SMDs and wires of a package, relative to its origin."""
+    min_x, min_y, max_x, max_y = 0, 0, 0, 0
+    for item in package.items:
+        if isinstance(item, Pad):
+            r = (item.diameter or 2 * item.drill) / 2
+            boxes = [(item.x - r, item.y - r, item.x + r, item.y + r)]
+        elif isinstance(item, SMD):
+            dx, dy = (item.dy, item.dx) if item.rotation.angle % 180 == 90 else (item.dx, item.dy)
+            boxes = [(item.x - dx / 2, item.y - dy / 2, item.x + dx / 2, item.y + dy / 2)]
+        elif isinstance(item, Wire):
+            r = item.width / 2
+            boxes = [(x - r, y - r, x + r, y + r) for x, y in ((item.x1, item.y1), (item.x2, item.y2))]
+        else:
+            continue
+        for x1, y1, x2, y2 in boxes:
+            min_x, min_y, max_x, max_y = min(min_x, x1), min(min_y, y1), max(max_x, x2), max(max_y, y2)
+    return (min_x, min_y, max_x, max_y)
+
+class Board:
+    """
+    The board of a ``Schematic``: an ``Element`` for each of its parts, in
+    the order they were added, and a ``Signal`` for each net once
+    ``wire_up`` is called.
+
+    Devices without a package are given one from ``default_package``, with a
+    pad per pin named after it. It is added to the schematic's library as
+    well, so save the schematic after creating the board.
+
+    :param schematic: The schematic, with every instance added and wired.
+    """
+
+    def __init__(self, schematic):
+        self.schematic = schematic
+        self.grid = Grid(distance=0.05, unit_dist="inch", unit="inch", style="lines", multiple=1, display=False)
+        self.layers = default_layers.get_layers()
+        self.eagle_board = EagleBoard()
+        self.drawing = Drawing(grid=self.grid, layers=self.layers, document=self.eagle_board)
+        self.libraries = {}
+        self.pads = {}  # {part: {pin: [pad, ...]}}
+        self._device_pads = {}  # {id(device): {pin: [pad, ...]}}
+        self.elements = [self._add_element(instance.eagle_instance.part) for instance in schematic.instances]
+
+    def _add_element(self, part):
+        device = part.device
+        pads = self._device_pads.get(id(device))
+        if pads is None:
+            if device.package is None:
+                self._add_default_package(part)
+            pads = self._device_pads[id(device)] = {}
+            for connect in device.connects:
+                pads.setdefault(connect.pin, []).extend(connect.pad.split())
+
+        lib = self.libraries.get(part.library.name)
+        if lib is None:
+            lib = self.libraries[part.library.name] = Library(name=part.library.name)
+            self.eagle_board.libraries.append(lib)
+        if not lib.packages.has_name(device.package.name):
+            lib.packages.append(device.package)
+
+        value = part.value if part.value is not None else part.device_set.name + device.name
+        element = Element(name=part.name, library=lib, package=device.package, value=value, x=0, y=0)
+        self.eagle_board.elements.append(element)
+        self.pads[part.name] = pads
+        return element
+
+    def _add_default_package(self, part):
+        device_set, device = part.device_set, part.device
+        pins = [(gate.name, pin['name']) for gate in device_set.gates for pin in get_pins_from_symbol(gate.symbol)]
+        package = default_package(device_set.name + device.name, [pin for _, pin in pins])
+        part.library.packages.append(package)
+        device.package = package
+        device.connects = [Connect(gate, pin, pin) for gate, pin in pins]
+
+    def place(self, placer=None, margin=2.54):
+        """
+        Lay the elements out by connectivity, as ``Schematic.place`` does the
+        instances, and draw the board outline around them.
+
+        :param placer: A configured ``Placer``, or None for one on the 0.05
+            inch grid.
+        :param margin: Space between the elements and the board outline.
+        """
+        placer = placer or Placer(pitch=1.27, spacing=2.54)
+        footprints = [package_footprint(element.package) for element in self.elements]
+        positions = placer.place(footprints, *connection_graph(self.schematic.instances))
+        for element, (x, y) in zip(self.elements, positions):
+            element.x, element.y = x, y
+
+        self.eagle_board.plain_items = [
+            item for item in self.eagle_board.plain_items
+            if not (isinstance(item, Wire) and item.layer == constants.LAYERS.DIMENSION)
+        ]
+        if not positions:
+            return
+        x1 = min(x + f[0] for (x, _), f in zip(positions, footprints)) - margin
+        y1 = min(y + f[1] for (_, y), f in zip(positions, footprints)) - margin
+        x2 = max(x + f[2] for (x, _), f in zip(positions, footprints)) + margin
+        y2 = max(y + f[3] for (_, y), f in zip(positions, footprints)) + margin
+        corners = [(x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1)]
+        self.eagle_board.plain_items += [
+            Wire(x1=xa, y1=ya, x2=xb, y2=yb, width=0, layer=constants.LAYERS.DIMENSION)
+            for (xa, ya), (xb, yb) in zip(corners, corners[1:])
+        ]
+
+    def wire_up(self):
+        """
+        Add a ``Signal`` for each net of the schematic, with a ``Contact_Ref``
+        to every pad of its pins, replacing any signals added before.
+        """
+        self.eagle_board.signals.clear()
+        for name, pins in self.schematic.netlist().items():
+            contact_refs = []
+            for part, pin in pins:
+                pads = self.pads[part].get(pin)
+                if not pads:
+                    raise ValueError(f"Pin {pin} of {part} has no pad")
+                contact_refs.extend(Contact_Ref(element=part, pad=pad) for pad in pads)
+            self.eagle_board.signals.append(Signal(name, items=contact_refs))
+
+    def save(self, filename, snap_to_grid=False):
+        eagle = Eagle(drawing=self.drawing)
+        eagle.save(Path(filename), snap_to_grid=snap_to_grid)
+        print(f"Board saved to {filename}")
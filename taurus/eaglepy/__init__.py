@@ -3,5 +3,6 @@ from . import attributes
 from . import etree_utils
 from . import key_list
 from . import primitives
+from . import library_cache
 from . import eagle
 from . import default_layers
@@ -31,9 +31,20 @@ The following require more complex conversion:
 Note: one attribute name (from constants.ATTRIBUTES) may have different types depending
 on the parent object. 
 
+Floating-point values are written through ``FLOAT_FORMAT``, a ``Float_Format`` which rounds
+them to a fixed number of decimals, and can snap coordinates to a grid.
+
+Codecs
+------
+
+``parse``, ``parse_or_default`` and ``set_attr`` handle one attribute per call. A ``Codec``
+handles every attribute of an element in one call, from a list of ``Field`` objects and the
+``ATTR_MAP`` of its class, and is used by the primitives, of which there are many per file.
+
 """
 
 from . import * 
+from contextlib import contextmanager
 
 
 class Rotation:
@@ -149,7 +160,7 @@ class ATTR_FLOAT:
 
     @staticmethod
     def to_str(val):
-        return str(val)
+        return FLOAT_FORMAT.format(val)
     
 class ATTR_AUTO_FLOAT:
     @staticmethod
@@ -167,7 +178,7 @@ class ATTR_AUTO_FLOAT:
         if val == None:
             return None
         else:
-            return str(val)
+            return FLOAT_FORMAT.format(val)
     
 class ATTR_ROT:
     @staticmethod
@@ -215,7 +226,111 @@ class ATTR_ROT:
             
         out_str += 'R'
             
-        return out_str + str(val.angle)
+        return out_str + FLOAT_FORMAT.format(val.angle)
+
+# Attributes holding coordinates, which ``Float_Format`` may snap to a grid
+COORDINATES = frozenset([constants.ATTRIBUTES.X, constants.ATTRIBUTES.Y,
+                         constants.ATTRIBUTES.X1, constants.ATTRIBUTES.Y1,
+                         constants.ATTRIBUTES.X2, constants.ATTRIBUTES.Y2,
+                         constants.ATTRIBUTES.X3, constants.ATTRIBUTES.Y3])
+
+class Float_Format:
+    """
+    Converts floating-point values to the strings written to EAGLE files.
+    
+    Values are rounded to ``decimals`` places and trailing zeros are dropped, the way EAGLE
+    writes them, so a computed ``12.700000000000001`` is written as ``12.7`` and ``0.0`` as
+    ``0``. Inside ``snap_grid``, coordinates are first rounded to multiples of the grid.
+    
+    Drawings repeat the same few values many times, so converted strings are cached by value.
+    
+    :param decimals: The number of decimal places kept, or None to write ``str(val)``.
+    """
+    
+    CACHE_SIZE = 1 << 16
+    
+    def __init__(self, decimals = 6):
+        self._decimals = decimals
+        self.grid = None
+        self._cache = {}
+        self._coordinate_cache = {}
+        
+    @property
+    def decimals(self):
+        return self._decimals
+    
+    @decimals.setter
+    def decimals(self, decimals):
+        self._decimals = decimals
+        self._cache.clear()
+        self._coordinate_cache.clear()
+        
+    def format(self, val):
+        """
+        Returns the string for a floating-point value.
+        
+        :param val: The value to convert.
+        
+        :returns: The rounded value, without trailing zeros.
+        """
+        
+        s = self._cache.get(val)
+        if s is None:
+            s = self._round(val)
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[val] = s
+        return s
+    
+    def coordinate(self, val):
+        """
+        Returns the string for a coordinate, snapped to the grid if one is set.
+        
+        :param val: The coordinate to convert, in mm.
+        
+        :returns: The snapped and rounded coordinate, without trailing zeros.
+        """
+        
+        if self.grid is None:
+            return self.format(val)
+        s = self._coordinate_cache.get(val)
+        if s is None:
+            s = self._round(round(val / self.grid) * self.grid)
+            if len(self._coordinate_cache) >= self.CACHE_SIZE:
+                self._coordinate_cache.clear()
+            self._coordinate_cache[val] = s
+        return s
+    
+    @contextmanager
+    def snap_grid(self, grid):
+        """
+        Snap coordinates to ``grid`` within a ``with`` block.
+        
+        :param grid: The grid distance in mm, or None to leave coordinates as they are.
+        """
+        
+        previous = self.grid
+        self.grid = grid
+        self._coordinate_cache.clear()
+        try:
+            yield
+        finally:
+            self.grid = previous
+            self._coordinate_cache.clear()
+    
+    def _round(self, val):
+        if self._decimals is None:
+            return str(val)
+        try:
+            s = '%.*f' % (self._decimals, val)
+        except TypeError:
+            return str(val)
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+        return '0' if s == '-0' else s
+
+# The format used for every floating-point attribute written
+FLOAT_FORMAT = Float_Format()
 
 def parse(cls, n, attr):
     """
@@ -277,7 +392,10 @@ def set_attr(obj, n, attr, val, default = None):
     
     if attr in obj.ATTR_MAP:
         f = obj.ATTR_MAP[attr]
-        s = f.to_str(val)
+        if f is ATTR_FLOAT and attr in COORDINATES:
+            s = FLOAT_FORMAT.coordinate(val)
+        else:
+            s = f.to_str(val)
         if s != None:
             n.attrib[attr] = s
         return
@@ -285,3 +403,122 @@ def set_attr(obj, n, attr, val, default = None):
     if val != None:
         s = str(val)
         n.attrib[attr] = s
+
+# Marks a ``Field`` without a default, which every element must have
+REQUIRED = object()
+
+class Field:
+    """
+    One attribute of the elements handled by a ``Codec``.
+    
+    :param attr: The name of the attribute.
+    :param name: The name of the Python attribute and constructor argument, if not ``attr``.
+    :param default: The value used when the attribute is missing, or ``REQUIRED``. A class, such as
+        ``Rotation``, is called to create a new default for each element. 
+    :param omit_default: Whether to leave the attribute out when writing a value equal to ``default``.
+    """
+    
+    def __init__(self, attr, name = None, default = REQUIRED, omit_default = True):
+        self.attr = attr
+        self.name = name if name else attr
+        self.default = default
+        self.omit_default = omit_default
+
+# Conversions inlined by ``Codec`` instead of calling the ``ATTR_`` class
+_INLINE_PARSE = {ATTR_FLOAT: 'float', ATTR_INT: 'int'}
+
+class Codec:
+    """
+    Parses or writes all attributes of an element in one call, with the same results as calling
+    ``parse``, ``parse_or_default`` and ``set_attr`` for each attribute.
+    
+    Two functions are generated from the fields when the codec is created, with the conversion
+    for each ``ATTR_MAP`` type inlined where possible, so no map lookup, default test or
+    ``str()`` dispatch is repeated per attribute:
+    
+    * ``parse(n)`` returns a dictionary of the values of an ElementTree ``Element`` by field
+      name, suitable as constructor arguments. It raises a ``KeyError`` if a required attribute
+      is missing, or an ``Exception`` if a value is invalid.
+    * ``attrib(obj)`` returns a dictionary of the attribute strings of an object, in field
+      order, suitable for a new ``Element``.
+    
+    :param attr_map: The ``ATTR_MAP`` of the element class.
+    :param fields: A list of ``Field`` objects, in the order in which attributes are written.
+    """
+    
+    def __init__(self, attr_map, fields):
+        self.attr_map = attr_map
+        self.fields = fields
+        
+        namespace = {'check': self.check, 'fmt': FLOAT_FORMAT.format, 'coord': FLOAT_FORMAT.coordinate}
+        parse_lines = []
+        values = []
+        write_lines = []
+        
+        for i, f in enumerate(fields):
+            attr_type = attr_map.get(f.attr)
+            if attr_type is not None:
+                namespace['p{0}'.format(i)] = attr_type.parse
+                namespace['s{0}'.format(i)] = attr_type.to_str
+            
+            # Parse
+            if attr_type is None or attr_type is ATTR_STRING:
+                value = 'v'
+            elif attr_type in _INLINE_PARSE:
+                value = '{0}(v)'.format(_INLINE_PARSE[attr_type])
+            else:
+                value = 'p{0}(v)'.format(i)
+            parse_lines.append('v = get({0!r})'.format(f.attr))
+            if f.default is REQUIRED:
+                parse_lines.append('if v is None: raise KeyError({0!r})'.format(f.attr))
+                parse_lines.append('f{0} = {1}'.format(i, value))
+            else:
+                namespace['d{0}'.format(i)] = f.default
+                default = 'd{0}()' if isinstance(f.default, type) else 'd{0}'
+                parse_lines.append('f{0} = {1} if v is None else {2}'.format(i, default.format(i), value))
+            values.append('{0!r}: f{1}'.format(f.name, i))
+            
+            # Write
+            if attr_type is None:
+                lines = ['if v is not None:', '    a[{0!r}] = str(v)'.format(f.attr)]
+            elif attr_type is ATTR_STRING:
+                lines = ['if v is not None:', '    a[{0!r}] = v'.format(f.attr)]
+            elif attr_type is ATTR_FLOAT:
+                lines = ['a[{0!r}] = {1}(v)'.format(f.attr, 'coord' if f.attr in COORDINATES else 'fmt')]
+            elif attr_type is ATTR_INT:
+                lines = ['a[{0!r}] = str(v)'.format(f.attr)]
+            else:
+                lines = ['s = s{0}(v)'.format(i), 'if s is not None:', '    a[{0!r}] = s'.format(f.attr)]
+            
+            # As in set_attr, a default of None never leaves the attribute out
+            if f.omit_default and f.default is not REQUIRED and f.default is not None:
+                namespace['w{0}'.format(i)] = f.default() if isinstance(f.default, type) else f.default
+                lines = ['if v != w{0}:'.format(i)] + ['    ' + line for line in lines]
+            write_lines += ['v = obj.{0}'.format(f.name)] + lines
+        
+        source = '\n'.join(
+            ['def parse(n):', '    get = n.get', '    try:'] +
+            ['        ' + line for line in parse_lines] +
+            ['    except ValueError:', '        check(n)', '        raise',
+             '    return {' + ', '.join(values) + '}', '',
+             'def attrib(obj):', '    a = {}'] +
+            ['    ' + line for line in write_lines] +
+            ['    return a', ''])
+        exec(compile(source, '<codec>', 'exec'), namespace)
+        
+        self.parse = namespace['parse']
+        self.attrib = namespace['attrib']
+        
+    def check(self, n):
+        """
+        Parse each attribute through its ``ATTR_`` class, so a value rejected by an inlined
+        conversion raises the same ``Exception`` as ``attributes.parse``.
+        
+        :param n: An ElementTree ``Element`` object.
+        """
+        
+        for f in self.fields:
+            value = n.get(f.attr)
+            attr_type = self.attr_map.get(f.attr)
+            if value is not None and attr_type is not None:
+                attr_type.parse(value)
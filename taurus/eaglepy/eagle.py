@@ -10,8 +10,6 @@ A Python package for creating, modifying, and writing Cadsoft EAGLE files
 
 from . import * 
 
-import io as StringIO 
-
 # Attempt to use ``lxml``.
 # Otherwise, use ``xml``.
 try:
@@ -41,92 +39,49 @@ class Eagle:
         self.compatibility = compatibility
     
     @staticmethod
-    def load(file_name):
+    def load(file_name, lazy = ()):
         """
         Attempt to read an ``Eagle`` object from an XML file.
         
+        The file is read incrementally, see ``Loader``.
+        
         :param file_name: The name of the file. 
+        :param lazy: Sections to parse only when first accessed: ``nets``
+            (of each ``Sheet``) and/or ``signals`` (of a ``Board``).
         :throws: ``Exception`` if an error occurs while attempting to read the file.
         :returns: An ``Eagle`` object.
         
         """
         
-        # Parse the specified input file
-        dom = ElementTree.parse(file_name)
-        
-        if hasattr(dom, 'docinfo'):
-            xml_version = dom.docinfo.xml_version
-            encoding = dom.docinfo.encoding
-        else: # etree, not lxml
-            xml_version = '1.0'
-            encoding = 'utf-8'
-        
-        # Get the Eagle node
-        n_eagle = dom.getroot()
-        
-        if n_eagle.tag != constants.TAGS.EAGLE:
-            raise Exception('Invalid tag name for root node--expecting {0}; got {1}.'.format(constants.TAGS.EAGLE, n_eagle.tag))
-        
-        # Get the version of the Eagle node.
-        if n_eagle.attrib.has_key(constants.ATTRIBUTES.VERSION):
-            version = n_eagle.attrib[constants.ATTRIBUTES.VERSION]
-        else:
-            version = Eagle.DEFAULT_VERSION
-        
-        # Get the drawing element
-        # There should only be one drawing per document.
-        n_drawing_arr = n_eagle.findall(constants.TAGS.DRAWING)
-        
-        if len(n_drawing_arr) == 0:
-            raise Exception('Document did not contain a {0} node.'.format(constants.TAGS.DRAWING))
-        elif len(n_drawing_arr) > 1:
-            raise Exception('Document contained multiple ({0}) {1} nodes; only 1 is supported.'.format(len(n_drawing_arr), constants.TAGS.DRAWING))
-        
-        n_drawing = n_drawing_arr[0]
-        
-        # Parse the drawing
-        drawing = Drawing.parse(n_drawing)
-
-        # Parse the compatibility
-        compatibility = etree_utils.parse_grandchildren_of_class(n_eagle, Note)
-        
-        return Eagle(drawing, xml_version, encoding, version, compatibility)
+        return Loader(lazy).load(file_name)
 
-    def save(self, file_name):
+    def save(self, file_name, snap_to_grid = False):
         """
         Attempt to write the object to an XML file. 
         
+        The document is streamed to the file as it is generated; only one
+        library, part, instance or net is held as an ``Element`` at a time.
+        Floating-point values are written by ``attributes.FLOAT_FORMAT``.
+        
         :param file_name: The name of the file to write. 
+        :param snap_to_grid: Whether to snap the coordinates of sheets and the board
+            (but not of libraries) to the distance of the drawing's ``Grid``.
         :raises: An ``Exception`` if an error occurs while attempting to write the file.
         :returns: ``None``.
         
         """
-
-        # Create the tree by parsing a basic XML template. 
-        # (This is the only way to set the document type and XML version.)
-        io = StringIO.StringIO('<?xml version="' + self.xml_version + '" ?><!DOCTYPE eagle SYSTEM "eagle.dtd"><' + constants.TAGS.EAGLE + ' />')
-        tree = ElementTree.parse(io)
         
-        # Set the version
-        n = tree.getroot() # returns the <eagle /> element
-        n.attrib[constants.ATTRIBUTES.VERSION] = self.version
+        grid = None
+        if snap_to_grid and self.drawing.grid != None:
+            grid = constants.UNIT.to_default(self.drawing.grid.distance, self.drawing.grid.unit_dist)
         
-        # Add the drawing (the only childe lement)
-        self.drawing.append_node(n)
-        
-        # Add the compatibility
-        if len(self.compatibility) > 0:
-            n_compatibility = ElementTree.SubElement(n, constants.TAGS.COMPATIBILITY)
-            
-            for nn in self.compatibility:
-                nn.append_node(n_compatibility)
-        
-        # Save    
-        xml_str = ElementTree.tostring(tree, xml_declaration=True, encoding=self.encoding, pretty_print=True)
-        
-        # Ensure the file is written as a string
-        with open(file_name, 'w', encoding=self.encoding) as f:
-            f.write(xml_str.decode(self.encoding))  # Decode bytes to string    
+        with etree_utils.Stream_Writer(file_name, self.encoding, '<!DOCTYPE eagle SYSTEM "eagle.dtd">', grid) as xf:
+            with xf.element(constants.TAGS.EAGLE, {constants.ATTRIBUTES.VERSION: self.version}):
+                # Add the drawing (the only child element)
+                etree_utils.write_node(xf, self.drawing)
+                
+                # Add the compatibility
+                etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.COMPATIBILITY, self.compatibility, False)
 
 class Approved_Error:
     TAG_NAME = constants.TAGS.APPROVED
@@ -234,6 +189,10 @@ class Autorouter:
 class Board:
     TAG_NAME = constants.TAGS.BOARD
     
+    # May be left unparsed by ``Eagle.load(..., lazy=['signals'])``
+    # and is then saved from its XML unless read
+    signals = etree_utils.Lazy_Section()
+    
     def __init__(self, 
                  libraries = None, 
                  elements = None,
@@ -303,6 +262,26 @@ class Board:
         etree_utils.append_grandchildren_of_class_from_od(n, Element, self.elements)
         etree_utils.append_grandchildren_of_class_from_od(n, Signal, self.signals)
         etree_utils.append_grandchildren_of_class(n, Approved_Error, self.errors, False)     
+    
+    def write_node(self, xf):
+        with xf.element(constants.TAGS.BOARD):
+            with attributes.FLOAT_FORMAT.snap_grid(xf.grid):
+                etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.PLAIN, self.plain_items)
+            etree_utils.write_grandchildren_of_class(xf, Library, self.libraries)
+            etree_utils.write_grandchildren_of_class(xf, Global_Attribute, self.attributes)
+            etree_utils.write_grandchildren_of_class(xf, Variant_Def, self.variant_defs)
+            etree_utils.write_grandchildren_of_class(xf, Net_Class, self.classes)
+            
+            if self.design_rules != None:
+                etree_utils.write_node(xf, self.design_rules)
+            
+            if self.autorouter != None:
+                etree_utils.write_node(xf, self.autorouter)
+            
+            with attributes.FLOAT_FORMAT.snap_grid(xf.grid):
+                etree_utils.write_grandchildren_of_class(xf, Element, self.elements)
+                etree_utils.write_grandchildren_of_class(xf, Signal, Board.signals.peek(self))
+            etree_utils.write_grandchildren_of_class(xf, Approved_Error, self.errors, False)
 #         
 #     def get_package_dict(self):
 #         """
@@ -675,6 +654,18 @@ class Drawing:
               
         if self.document != None:
             self.document.append_node(n)
+    
+    def write_node(self, xf):
+        with xf.element(constants.TAGS.DRAWING):
+            etree_utils.write_grandchildren_of_class(xf, Setting, self.settings)
+            
+            if self.grid != None:
+                etree_utils.write_node(xf, self.grid)
+            
+            etree_utils.write_grandchildren_of_class(xf, Layer, self.layers)
+            
+            if self.document != None:
+                etree_utils.write_node(xf, self.document)
 
 class Element:
     TAG_NAME = constants.TAGS.ELEMENT
@@ -1002,6 +993,16 @@ class Library:
 
     @classmethod
     def parse(cls, n):
+        """
+        Parse a library, or restore it from ``library_cache.default_cache``
+        if a library with the same XML has been parsed before.
+        """
+        if library_cache.default_cache != None:
+            return library_cache.default_cache.get(n, cls.parse_xml)
+        return cls.parse_xml(n)
+    
+    @classmethod
+    def parse_xml(cls, n):
         name = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.NAME, None)
         description = etree_utils.parse_text(n, constants.TAGS.DESCRIPTION, None)
         
@@ -1382,6 +1383,21 @@ class Schematic:
         etree_utils.append_grandchildren_of_class_from_od(n, Part, self.parts)
         etree_utils.append_grandchildren_of_class(n, Sheet, self.sheets)
         etree_utils.append_grandchildren_of_class(n, Approved_Error, self.errors, False)
+    
+    def write_node(self, xf):
+        # Only the attributes are built here; the children are streamed
+        n = ElementTree.Element(constants.TAGS.SCHEMATIC)
+        attributes.set_attr(self, n, constants.ATTRIBUTES.XREF_LABEL, self.xref_label, self.DEFAULT_XREF_LABEL)
+        attributes.set_attr(self, n, constants.ATTRIBUTES.XREF_PART, self.xref_part, self.DEFAULT_XREF_PART)
+        
+        with xf.element(n.tag, dict(n.attrib)):
+            etree_utils.write_grandchildren_of_class(xf, Library, self.libraries)
+            etree_utils.write_grandchildren_of_class(xf, Global_Attribute, self.attributes)
+            etree_utils.write_grandchildren_of_class(xf, Variant_Def, self.variant_defs)
+            etree_utils.write_grandchildren_of_class(xf, Net_Class, self.classes)
+            etree_utils.write_grandchildren_of_class(xf, Part, self.parts)
+            etree_utils.write_grandchildren_of_class(xf, Sheet, self.sheets)
+            etree_utils.write_grandchildren_of_class(xf, Approved_Error, self.errors, False)
 #     
 #     def get_lib_dict(self):
 #         """
@@ -1595,7 +1611,7 @@ class Setting:
         
     @classmethod
     def parse(cls, n):
-        name = n.attrib.keys()[0]
+        name = next(iter(n.attrib))
         value = n.attrib[name]
         return Setting(name, value)
         
@@ -1611,6 +1627,10 @@ class Sheet:
     
     ATTR_MAP = {}
     
+    # May be left unparsed by ``Eagle.load(..., lazy=['nets'])``
+    # and is then saved from its XML unless read
+    nets = etree_utils.Lazy_Section()
+    
     def __init__(self, 
                  plain = None, 
                  instances = None, 
@@ -1643,6 +1663,16 @@ class Sheet:
         etree_utils.append_grandchildren_with_tag(n, constants.TAGS.INSTANCES, self.instances)
         etree_utils.append_grandchildren_with_tag_from_od(n, constants.TAGS.BUSSES, self.busses)
         etree_utils.append_grandchildren_with_tag_from_od(n, constants.TAGS.NETS, self.nets)
+    
+    def write_node(self, xf):
+        with xf.element(constants.TAGS.SHEET), attributes.FLOAT_FORMAT.snap_grid(xf.grid):
+            for d in self.descriptions:
+                etree_utils.write_node(xf, d)
+            
+            etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.PLAIN, self.plain)
+            etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.INSTANCES, self.instances)
+            etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.BUSSES, self.busses)
+            etree_utils.write_grandchildren_with_tag(xf, constants.TAGS.NETS, Sheet.nets.peek(self))
 
 class Signal:
     TAG_NAME = constants.TAGS.SIGNAL
@@ -1791,17 +1821,231 @@ class Variant_Def:
         n = ElementTree.SubElement(_n, self.TAG_NAME)
         attributes.set_attr(self, n, constants.ATTRIBUTES.NAME, self.name)
 
-
-
-
-
+class Loader:
+    """
+    Builds an ``Eagle`` object from ``iterparse`` events.
+    
+    Each setting, layer, library, part, sheet item, element or signal is
+    parsed with its class's ``parse`` as soon as its end tag has been read,
+    then cleared from the tree, so the DOM holds at most one of them at a
+    time. Sections named in ``lazy`` are kept as serialized XML and parsed
+    the first time they are accessed.
+    """
+    
+    LAZY_SECTIONS = (constants.TAGS.NETS, constants.TAGS.SIGNALS)
+    
+    def __init__(self, lazy = ()):
+        for section in lazy:
+            if section not in self.LAZY_SECTIONS:
+                raise Exception('Unsupported lazy section {0}; expecting one of {1}.'.format(section, ', '.join(self.LAZY_SECTIONS)))
+        
+        self.version = Eagle.DEFAULT_VERSION
+        self.settings = []
+        self.layers = []
+        self.grid = None
+        self.document = None
+        self.sheet = None
+        self.deferred = None
+        self.compatibility = []
+        
+        self.start_handlers = dict(START_HANDLERS)
+        self.end_handlers = dict(END_HANDLERS)
+        for section in lazy:
+            self.start_handlers.update(LAZY_HANDLERS[section][0])
+            self.end_handlers.update(LAZY_HANDLERS[section][1])
+    
+    def load(self, file_name):
+        context = ElementTree.iterparse(str(file_name), events = ('start', 'end'))
+        
+        path = [] # tag names from the root to the current element
+        stack = [] # the open elements
+        for event, n in context:
+            if event == 'start':
+                path.append(n.tag)
+                stack.append(n)
+                
+                if len(path) == 1 and n.tag != constants.TAGS.EAGLE:
+                    raise Exception('Invalid tag name for root node--expecting {0}; got {1}.'.format(constants.TAGS.EAGLE, n.tag))
+                
+                handler = self.start_handlers.get(tuple(path[-3:]))
+                if handler != None:
+                    handler(self, n)
+            else:
+                key = tuple(path[-3:])
+                handler = self.end_handlers.get(key) or self.end_handlers.get(key[:-1] + ('*',))
+                if handler != None:
+                    handler(self, n)
+                    # Done with this element; drop it so the tree stays small
+                    n.clear()
+                    if len(stack) > 1:
+                        stack[-2].remove(n)
+                path.pop()
+                stack.pop()
+        
+        root = getattr(context, 'root', None)
+        if hasattr(root, 'getroottree'):
+            xml_version = root.getroottree().docinfo.xml_version
+            encoding = root.getroottree().docinfo.encoding
+        else: # etree, not lxml
+            xml_version = '1.0'
+            encoding = 'utf-8'
         
-
-
-
+        if self.document == None:
+            raise Exception('File did not contain a board, schematic, or library.')
         
-
+        drawing = Drawing(settings = self.settings, 
+                          grid = self.grid, 
+                          layers = self.layers, 
+                          document = self.document)
         
+        return Eagle(drawing, xml_version, encoding, self.version, self.compatibility)
+    
+    # Start tags
+    
+    def start_eagle(self, n):
+        self.version = n.attrib.get(constants.ATTRIBUTES.VERSION, Eagle.DEFAULT_VERSION)
+    
+    def start_schematic(self, n):
+        self.document = Schematic(xref_label = attributes.parse_or_default(Schematic, n, constants.ATTRIBUTES.XREF_LABEL, Schematic.DEFAULT_XREF_LABEL),
+                                  xref_part = attributes.parse_or_default(Schematic, n, constants.ATTRIBUTES.XREF_PART, Schematic.DEFAULT_XREF_PART))
+    
+    def start_board(self, n):
+        self.document = Board()
+    
+    def start_sheet(self, n):
+        self.sheet = Sheet()
+    
+    def start_nets_lazy(self, n):
+        self.deferred = self.sheet.nets = etree_utils.Deferred_Section(Net)
+    
+    def start_signals_lazy(self, n):
+        self.deferred = self.document.signals = etree_utils.Deferred_Section(Signal)
+    
+    # End tags
+    
+    def end_setting(self, n):
+        self.settings.append(Setting.parse(n))
+    
+    def end_grid(self, n):
+        self.grid = Grid.parse(n)
+    
+    def end_layer(self, n):
+        self.layers.append(Layer.parse(n))
+    
+    def end_library_file(self, n):
+        self.document = Library.parse(n)
+    
+    def end_library(self, n):
+        self.document.libraries.append(Library.parse(n))
+    
+    def end_attribute(self, n):
+        self.document.attributes.append(Global_Attribute.parse(n))
+    
+    def end_variant_def(self, n):
+        self.document.variant_defs.append(Variant_Def.parse(n))
+    
+    def end_class(self, n):
+        self.document.classes.append(Net_Class.parse(n))
+    
+    def end_error(self, n):
+        self.document.errors.append(Approved_Error.parse(n))
+    
+    def end_part(self, n):
+        self.document.parts.append(Part.parse(n, self.document))
+    
+    def end_sheet(self, n):
+        self.document.sheets.append(self.sheet)
+        self.sheet = None
+    
+    def end_description(self, n):
+        self.sheet.descriptions.append(Description.parse(n))
+    
+    def end_sheet_plain(self, n):
+        item = primitives.parse_item(n)
+        if item != None:
+            self.sheet.plain.append(item)
+    
+    def end_instance(self, n):
+        self.sheet.instances.append(Instance.parse(n, self.document))
+    
+    def end_bus(self, n):
+        self.sheet.busses.append(Bus.parse(n))
+    
+    def end_net(self, n):
+        self.sheet.nets.append(Net.parse(n))
+    
+    def end_deferred(self, n):
+        self.deferred.append(n)
+    
+    def end_board_plain(self, n):
+        item = primitives.parse_item(n)
+        if item != None:
+            self.document.plain_items.append(item)
+    
+    def end_design_rules(self, n):
+        self.document.design_rules = Design_Rules.parse(n)
+    
+    def end_autorouter(self, n):
+        self.document.autorouter = Autorouter.parse(n)
+    
+    def end_element(self, n):
+        self.document.elements.append(Element.parse(n, self.document))
+    
+    def end_signal(self, n):
+        self.document.signals.append(Signal.parse(n))
+    
+    def end_note(self, n):
+        self.compatibility.append(Note.parse(n))
 
-   
+# Handlers keyed by the last (up to) three tag names of the path to an element.
+# A trailing '*' matches any tag.
+T = constants.TAGS
 
+START_HANDLERS = {
+    (T.EAGLE,): Loader.start_eagle,
+    (T.EAGLE, T.DRAWING, T.SCHEMATIC): Loader.start_schematic,
+    (T.EAGLE, T.DRAWING, T.BOARD): Loader.start_board,
+    (T.SCHEMATIC, T.SHEETS, T.SHEET): Loader.start_sheet,
+}
+
+END_HANDLERS = {
+    (T.DRAWING, T.SETTINGS, T.SETTING): Loader.end_setting,
+    (T.EAGLE, T.DRAWING, T.GRID): Loader.end_grid,
+    (T.DRAWING, T.LAYERS, T.LAYER): Loader.end_layer,
+    (T.EAGLE, T.DRAWING, T.LIBRARY): Loader.end_library_file,
+    (T.EAGLE, T.COMPATIBILITY, T.NOTE): Loader.end_note,
+    
+    (T.SCHEMATIC, T.LIBRARIES, T.LIBRARY): Loader.end_library,
+    (T.SCHEMATIC, T.ATTRIBUTES, T.ATTRIBUTE): Loader.end_attribute,
+    (T.SCHEMATIC, T.VARIANT_DEFS, T.VARIANT_DEF): Loader.end_variant_def,
+    (T.SCHEMATIC, T.CLASSES, T.CLASS): Loader.end_class,
+    (T.SCHEMATIC, T.PARTS, T.PART): Loader.end_part,
+    (T.SCHEMATIC, T.SHEETS, T.SHEET): Loader.end_sheet,
+    (T.SCHEMATIC, T.ERRORS, T.APPROVED): Loader.end_error,
+    (T.SHEETS, T.SHEET, T.DESCRIPTION): Loader.end_description,
+    (T.SHEET, T.PLAIN, '*'): Loader.end_sheet_plain,
+    (T.SHEET, T.INSTANCES, T.INSTANCE): Loader.end_instance,
+    (T.SHEET, T.BUSSES, T.BUS): Loader.end_bus,
+    (T.SHEET, T.NETS, T.NET): Loader.end_net,
+    
+    (T.BOARD, T.PLAIN, '*'): Loader.end_board_plain,
+    (T.BOARD, T.LIBRARIES, T.LIBRARY): Loader.end_library,
+    (T.BOARD, T.ATTRIBUTES, T.ATTRIBUTE): Loader.end_attribute,
+    (T.BOARD, T.VARIANT_DEFS, T.VARIANT_DEF): Loader.end_variant_def,
+    (T.BOARD, T.CLASSES, T.CLASS): Loader.end_class,
+    (T.DRAWING, T.BOARD, T.DESIGN_RULES): Loader.end_design_rules,
+    (T.DRAWING, T.BOARD, T.AUTOROUTER): Loader.end_autorouter,
+    (T.BOARD, T.ELEMENTS, T.ELEMENT): Loader.end_element,
+    (T.BOARD, T.SIGNALS, T.SIGNAL): Loader.end_signal,
+    (T.BOARD, T.ERRORS, T.APPROVED): Loader.end_error,
+}
+
+# (start, end) handlers replacing the above for each lazy section
+LAZY_HANDLERS = {
+    T.NETS: ({(T.SHEETS, T.SHEET, T.NETS): Loader.start_nets_lazy}, 
+             {(T.SHEET, T.NETS, T.NET): Loader.end_deferred}),
+    T.SIGNALS: ({(T.DRAWING, T.BOARD, T.SIGNALS): Loader.start_signals_lazy}, 
+                {(T.BOARD, T.SIGNALS, T.SIGNAL): Loader.end_deferred}),
+}
+
+del T
@@ -10,6 +10,10 @@ objects as XML data.
 ``append`` methods are used to convert objects into XML and append them to an existing
 ElementTree ``Element`` object.
 
+``write`` methods stream objects to a ``Stream_Writer``: container objects
+with a ``write_node`` method open their element and stream their children,
+any other object is built with ``append_node``, written, and dropped.
+
 For methods which accept classes as parameters, the class must have a 
 ``TAG_NAME`` property.
 
@@ -30,6 +34,264 @@ try:
 except:
     from xml.etree import ElementTree
 
+from contextlib import contextmanager
+from xml.sax.saxutils import quoteattr
+
+from . import key_list
+
+class Stream_Writer:
+    """
+    Writes an XML document to a file as it is generated, so only the element
+    being written is held in memory. Uses ``lxml``'s ``xmlfile`` when it is
+    available, and writes the markup directly otherwise. Output is indented
+    like ``tostring(..., pretty_print=True)``.
+    
+    ``grid`` is the distance, in mm, that sheet and board coordinates are
+    snapped to while written (see ``attributes.Float_Format``), or None.
+    
+    Use as a context manager::
+    
+        with Stream_Writer(file_name) as xf:
+            with xf.element('eagle', {'version': '6.5.0'}):
+                xf.write(n)
+    
+    """
+    
+    INDENT = '  '
+    
+    def __init__(self, file_name, encoding = 'utf-8', doctype = None, grid = None):
+        self.file_name = file_name
+        self.encoding = encoding
+        self.doctype = doctype
+        self.grid = grid
+        self.depth = 0
+        
+    def __enter__(self):
+        if hasattr(ElementTree, 'xmlfile'):
+            self._file = open(self.file_name, 'wb')
+            self._context = ElementTree.xmlfile(self._file, encoding = self.encoding)
+            self._xf = self._context.__enter__()
+            self._xf.write_declaration()
+            if self.doctype != None:
+                self._xf.write_doctype(self.doctype)
+        else:
+            self._file = open(self.file_name, 'w', encoding = self.encoding)
+            self._xf = None
+            self._file.write("<?xml version='1.0' encoding='{0}'?>\n".format(self.encoding))
+            if self.doctype != None:
+                self._file.write(self.doctype + '\n')
+        return self
+    
+    def __exit__(self, *exc):
+        try:
+            if self._xf != None:
+                self._context.__exit__(*exc)
+                self._file.write(b'\n')
+            else:
+                self._file.write('\n')
+        finally:
+            self._file.close()
+        return False
+    
+    def _text(self, text):
+        if self._xf != None:
+            self._xf.write(text)
+        else:
+            self._file.write(text)
+    
+    def _newline(self, closing = False):
+        # The root element starts right after the prolog's own newline
+        if self.depth > 0 or closing:
+            self._text('\n' + self.INDENT * self.depth)
+    
+    @contextmanager
+    def element(self, tag, attrib = None):
+        """
+        Open an element whose children are written inside the ``with`` block.
+        
+        :param tag: The tag name.
+        :param attrib: A dictionary of attributes, or None.
+        
+        """
+        self._newline()
+        attrib = attrib if attrib else {}
+        if self._xf != None:
+            with self._xf.element(tag, attrib):
+                self.depth += 1
+                yield self
+                self.depth -= 1
+                self._newline(True)
+        else:
+            self._file.write('<' + tag + ''.join(' {0}={1}'.format(k, quoteattr(v)) for k, v in attrib.items()) + '>')
+            self.depth += 1
+            yield self
+            self.depth -= 1
+            self._newline(True)
+            self._file.write('</' + tag + '>')
+    
+    def write(self, n):
+        """
+        Write a complete ``Element`` at the current position.
+        
+        :param n: The ``Element`` object. Its tail is dropped.
+        
+        """
+        n.tail = None
+        if len(n):
+            ElementTree.indent(n, space = self.INDENT, level = self.depth)
+        self._newline()
+        if self._xf != None:
+            self._xf.write(n)
+        else:
+            self._file.write(ElementTree.tostring(n, encoding = 'unicode'))
+
+class Deferred_Section:
+    """
+    The serialized XML of a section's children (e.g. each ``<net>``), kept
+    in place of their parsed objects until they are needed.
+    
+    A section that is written before it is parsed is copied to the output
+    as it is, without building its objects, unless the writer snaps to a grid:
+    then each child is parsed and written through its object, so its
+    coordinates are snapped like those of a parsed section.
+    
+    :param child_class: The class of the section's children.
+    :param chunks: The serialized children, e.g. from a worker process.
+    
+    """
+    
+    def __init__(self, child_class, chunks = None):
+        self.child_class = child_class
+        self.chunks = chunks if chunks else []
+        
+    def __len__(self):
+        return len(self.chunks)
+        
+    def append(self, n):
+        """
+        Keep the XML of child ``Element`` ``n``, without its tail.
+        """
+        n.tail = None
+        self.chunks.append(ElementTree.tostring(n))
+        
+    def append_object(self, obj):
+        """
+        Keep the XML of a ``child_class`` object, built by its ``append_node``.
+        """
+        scratch = ElementTree.Element('scratch')
+        obj.append_node(scratch)
+        for n in scratch:
+            self.append(n)
+        
+    def write(self, xf):
+        """
+        Stream the children to ``xf`` from their XML.
+        """
+        for xml in self.chunks:
+            n = ElementTree.fromstring(xml)
+            if xf.grid == None:
+                xf.write(n)
+                continue
+            c = self.child_class.parse(n)
+            if c != None:
+                write_node(xf, c)
+        
+    def parse(self):
+        """
+        Parse the children into a ``Key_List`` of ``child_class`` objects.
+        """
+        children = key_list.Key_List()
+        
+        for xml in self.chunks:
+            c = self.child_class.parse(ElementTree.fromstring(xml))
+            if c != None:
+                children.append(c)
+        
+        return children
+
+class Lazy_Section:
+    """
+    A class attribute holding a collection that may be assigned a
+    ``Deferred_Section``, which is parsed and replaced the first time the
+    attribute is read.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.name = '_' + name
+        
+    def __get__(self, obj, owner = None):
+        if obj == None:
+            return self
+        value = obj.__dict__[self.name]
+        if isinstance(value, Deferred_Section):
+            value = obj.__dict__[self.name] = value.parse()
+        return value
+    
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+    
+    def peek(self, obj):
+        """
+        Return the collection of ``obj``, leaving a ``Deferred_Section`` unparsed.
+        """
+        return obj.__dict__[self.name]
+
+def write_node(xf, obj):
+    """
+    Stream ``obj`` to ``xf``: through its ``write_node`` method if it has one,
+    otherwise by building its element with ``append_node`` and writing it.
+    
+    :param xf: The ``Stream_Writer``.
+    :param obj: The object to write.
+    
+    """
+    
+    if hasattr(obj, 'write_node'):
+        obj.write_node(xf)
+    else:
+        scratch = ElementTree.Element('scratch')
+        obj.append_node(scratch)
+        for n in scratch:
+            xf.write(n)
+
+def write_grandchildren_with_tag(xf, tag, children, add_node_if_empty = True):
+    """
+    Stream a single child node and a grandchild for each object in ``children``.
+    
+    :param xf: The ``Stream_Writer``.
+    :param tag: The name of the parent tag.
+    :param children: A list (or ``Key_List``) of grandchildren, or a ``Deferred_Section``.
+    :param add_node_if_empty: Whether to add the parent node if the list of grandchildren is empty.
+    
+    """
+    if len(children) == 0:
+        if add_node_if_empty:
+            xf.write(ElementTree.Element(tag))
+        return
+    
+    with xf.element(tag):
+        if isinstance(children, Deferred_Section):
+            children.write(xf)
+            return
+        
+        for c in children:
+            write_node(xf, c)
+
+def write_grandchildren_of_class(xf, child_class, children, add_node_if_empty = True):
+    """
+    Stream a single child node and a grandchild for each object in ``children``.
+    
+    The tag of the parent is set by the ``child_class.PARENT_TAG_NAME`` attribute.
+    
+    :param xf: The ``Stream_Writer``.
+    :param child_class: The class of the grandchild objects.
+    :param children: A list (or ``Key_List``) of grandchildren.
+    :param add_node_if_empty: Whether to add the parent node if the list of grandchildren is empty.
+    
+    """
+    
+    write_grandchildren_with_tag(xf, child_class.PARENT_TAG_NAME, children, add_node_if_empty)
+
 def append_text_node_if_not_none(parent, text, tag_name):
     """
     If ``text`` is not ``None``, add an ``Element`` whose ``text`` value is equal to ``text``.
@@ -262,7 +524,7 @@ def parse_children_using_function(parent, parse_function, tag = None):
     children = []
     
     if tag == None:
-        nodes = parent.getchildren()
+        nodes = list(parent)
     else:
         nodes = parent.findall(tag)
     
@@ -298,7 +560,7 @@ def parse_grandchildren_using_function(parent, child_tag, parse_function, tag =
             raise Exception('Node {0} does not contain required child node {1}.'.format(parent.tag, tag))
     else:
         if tag == None:
-            nodes = node.getchildren()
+            nodes = list(node)
         else:
             nodes = node.findall(tag)
              
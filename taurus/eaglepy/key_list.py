@@ -1,117 +1,208 @@
-import collections
+import collections.abc
+
+# Marks the slot of a removed object until the list is compacted
+_REMOVED = object()
 
 class Key_List:
+    """
+    An ordered collection of objects, accessed by their ``name`` or position.
+
+    Objects are kept in a list in insertion order, alongside a dictionary
+    from each name to its position, so lookups by name are O(1). Removing an
+    object leaves a marker in its slot, which is O(1); the list is compacted
+    once markers make up half of it, or when a positional lookup needs exact
+    positions.
+
+    Positional access is O(1) until the next removal. The first positional
+    lookup after a removal pays an O(n) compaction, so a loop that alternates
+    removals with positional lookups is quadratic; look objects up by name
+    or iterate in such loops instead.
+    """
+
     def __init__(self, items=None):
-        self.list = collections.OrderedDict()
+        self._names = []
+        self._items = []
+        self._index = {}  # {name: position}
+        self._removed = 0
         if items is not None:
             for i in items:
                 self.append(i)
 
     def append(self, obj):
         """
-        Add an object to the end of the list.
-        
+        Add an object to the end of the list. An object with the same name
+        is replaced in place.
+
         :param obj: The object to add.
         """
-        self.list[obj.name] = obj
+        position = self._index.get(obj.name)
+        if position is not None:
+            self._items[position] = obj
+        else:
+            self._index[obj.name] = len(self._items)
+            self._names.append(obj.name)
+            self._items.append(obj)
 
     def extend(self, array):
         for obj in array:
             self.append(obj)
- 
+
     def count(self):
         """
         Returns the number of items in the list.
-        
+
         :returns: The number of items in the list.
         """
-        return len(self.list)
+        return len(self._index)
 
     def __iter__(self):
         """
         Returns an iterator for the list values.
-        
+
         :returns: An iterator for the list values.
         """
-        return iter(self.list.values())  # Use .values() instead of .itervalues()
+        if not self._removed:
+            return iter(self._items)
+        return (obj for obj in self._items if obj is not _REMOVED)
 
     def clear(self):
         """
         Remove all items from the list.
         """
-        self.list.clear()
+        self._names.clear()
+        self._items.clear()
+        self._index.clear()
+        self._removed = 0
 
     def __getitem__(self, i):
         """
         Returns the object with the specified key.
-        
+
         :returns: The object with the specified key.
         """
-        return self.list[i]
+        return self._items[self._index[i]]
 
     def names(self):
         """
-        Returns a list of the names of all objects in the list, in the order in which they were added.
-        
-        :returns: A list of the names of all objects in the list.
+        Returns a read-only view of the names of all objects in the list, in
+        the order in which they were added.
+
+        :returns: A ``Key_List_View`` of the names of all objects in the list.
         """
-        return list(self.list.keys())  # Convert keys view to a list
+        return Key_List_View(self, names=True)
 
     def items(self):
         """
-        Returns a list of all items in the list.
-        
-        :returns: A list of all items in the list.
+        Returns a read-only view of all items in the list.
+
+        :returns: A ``Key_List_View`` of all items in the list.
         """
-        return list(self.list.values())  # Convert values view to a list
+        return Key_List_View(self)
 
     def iternames(self):
         """
         Returns an iterator for the object names.
-        
+
         :returns: An iterator for the object names.
         """
-        return iter(self.list.keys())  # Use .keys() instead of .iterkeys()
+        if not self._removed:
+            return iter(self._names)
+        return (name for name, obj in zip(self._names, self._items) if obj is not _REMOVED)
 
     def pop(self, name):
         """
         Remove and return the object with the specified name.
-        
+
         :param name: The name of the object to remove.
-        
+
         :returns: The object with the specified name.
         """
-        return self.list.pop(name)
+        position = self._index.pop(name)
+        obj = self._items[position]
+        self._items[position] = self._names[position] = _REMOVED
+        self._removed += 1
+        if self._removed * 2 > len(self._items):
+            self._compact()
+        return obj
 
     def remove(self, obj):
         """
         Remove the specified object.
-        
+
         :param obj: The object to remove.
         """
-        self.list.pop(obj.name)
+        self.pop(obj.name)
 
     def __len__(self):
         """
         Returns the number of items in the list.
-        
+
         :returns: The number of items in the list.
         """
-        return len(self.list)
+        return len(self._index)
 
     def has_name(self, name):
         """
         Returns a boolean value indicating whether an object with the
         specified name is contained within the list.
-        
+
         :returns: Whether the list contains an object with the specified name.
         """
-        return name in self.list  # Use `in` operator instead of .has_key()
+        return name in self._index
 
     def item_at_index(self, index):
         """
         Returns the list item at the specified index.
-        
+
         :returns: The list item at the specified index.
         """
-        return list(self.list.values())[index]  # Convert values view to a list and access by index
\ No newline at end of file
+        if self._removed:
+            self._compact()
+        return self._items[index]
+
+    def _compact(self):
+        """
+        Drop the slots of removed objects and renumber the positions.
+        """
+        self._names = [name for name in self._names if name is not _REMOVED]
+        self._items = [obj for obj in self._items if obj is not _REMOVED]
+        self._index = {name: position for position, name in enumerate(self._names)}
+        self._removed = 0
+
+class Key_List_View(collections.abc.Sequence):
+    """
+    A read-only sequence of the names or objects of a ``Key_List``, in order.
+    Nothing is copied, so the view follows later changes to the list.
+
+    :param key_list: The list to view.
+    :param names: Whether to view the names instead of the objects.
+    """
+
+    def __init__(self, key_list, names=False):
+        self._key_list = key_list
+        self._names = names
+
+    def __len__(self):
+        return len(self._key_list)
+
+    def __getitem__(self, index):
+        key_list = self._key_list
+        if key_list._removed:
+            key_list._compact()
+        return (key_list._names if self._names else key_list._items)[index]
+
+    def __iter__(self):
+        return self._key_list.iternames() if self._names else iter(self._key_list)
+
+    def __contains__(self, value):
+        if self._names:
+            return value in self._key_list._index
+        return super().__contains__(value)
+
+    def __eq__(self, other):
+        if not isinstance(other, collections.abc.Iterable):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
@@ -0,0 +1,133 @@
+"""
+Library Cache
+=============
+
+Parsed ``Library`` objects, keyed by a hash of the library's XML.
+
+Libraries are the heaviest part of an EAGLE file and are often identical
+across designs. ``Library.parse`` looks each ``<library>`` element up in
+``default_cache`` first, so a library already seen, in this process or
+(with a snapshot directory) in an earlier one, is restored from a pickle
+snapshot instead of being parsed again.
+
+Entries are stored pickled, and every lookup unpickles a fresh ``Library``,
+so callers may modify what they get back without affecting the cache. At
+most ``max_entries`` snapshots are held in memory, least recently used first
+out; an evicted library is read back from disk when there is a directory.
+
+Set ``EAGLEPY_LIBRARY_CACHE`` to a directory to keep snapshots on disk, or
+set ``default_cache`` to ``None`` to disable caching. Snapshots are loaded
+with ``pickle.loads``, so only point it at a directory you trust: anyone who
+can write there can run code in the process that loads a design.
+
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+try:
+    from lxml import etree as ElementTree
+except:
+    from xml.etree import ElementTree
+
+# Part of every key, so snapshots of an older layout are simply not found
+SNAPSHOT_VERSION = b'2'
+
+class Library_Cache:
+    """
+    :param directory: A directory for ``<hash>.pickle`` snapshots, or None to
+        cache in memory only.
+    :param max_entries: The number of snapshots kept in memory.
+    
+    """
+    
+    def __init__(self, directory = None, max_entries = 64):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.snapshots = OrderedDict() # {key: pickled Library}, least recently used first
+        self.hits = 0
+        self.misses = 0
+        
+    def key(self, n):
+        """
+        Return the content hash of the library ``Element`` ``n``.
+        """
+        tail = n.tail
+        n.tail = None
+        try:
+            xml = ElementTree.tostring(n)
+        finally:
+            n.tail = tail
+        return hashlib.sha256(SNAPSHOT_VERSION + xml).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+    
+    def _read(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+        
+    def _write(self, key, snapshot):
+        os.makedirs(self.directory, exist_ok = True)
+        # Write under a temporary name first so readers never see a partial file
+        temp_path = self._path(key) + '.{0}.tmp'.format(os.getpid())
+        with open(temp_path, 'wb') as f:
+            f.write(snapshot)
+        os.replace(temp_path, self._path(key))
+    
+    def _remember(self, key, snapshot):
+        self.snapshots[key] = snapshot
+        self.snapshots.move_to_end(key)
+        while len(self.snapshots) > self.max_entries:
+            self.snapshots.popitem(last = False)
+    
+    def get(self, n, parse):
+        """
+        Return the library for ``n``, calling ``parse(n)`` only if its content
+        has not been seen before.
+        
+        :param n: The ``<library>`` ``Element``.
+        :param parse: A function which parses ``n`` into a ``Library``.
+        
+        """
+        key = self.key(n)
+        snapshot = self.snapshots.get(key)
+        
+        if snapshot != None:
+            self.snapshots.move_to_end(key)
+        elif self.directory != None:
+            snapshot = self._read(key)
+            if snapshot != None:
+                self._remember(key, snapshot)
+        
+        if snapshot != None:
+            try:
+                library = pickle.loads(snapshot)
+                self.hits += 1
+                return library
+            except Exception:
+                pass # A broken snapshot is simply replaced
+        
+        self.misses += 1
+        library = parse(n)
+        snapshot = pickle.dumps(library, pickle.HIGHEST_PROTOCOL)
+        self._remember(key, snapshot)
+        if self.directory != None:
+            try:
+                self._write(key, snapshot)
+            except OSError:
+                pass # The in-memory entry still serves this process
+        return library
+    
+    def clear(self):
+        """
+        Forget the libraries cached in memory. Snapshots on disk are kept.
+        """
+        self.snapshots.clear()
+
+default_cache = Library_Cache(os.environ.get('EAGLEPY_LIBRARY_CACHE'))
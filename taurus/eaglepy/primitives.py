@@ -6,7 +6,8 @@ Primitives are the objects from which packages and symbols are comprised. Boards
 containing packages and symbols, respectively, may also contain symbols.
 
 Each primitive class contains an ``ATTR_MAP`` property, which is used to associate each attribute of that
-primitive with an attribute type.
+primitive with an attribute type, and a ``CODEC`` property built from it, which parses and writes all of the
+attributes at once (see ``attributes.Codec``).
 
 Each primitive class must contain the following:
 
@@ -50,6 +51,14 @@ class Circle:
                 constants.ATTRIBUTES.LAYER: attributes.ATTR_INT
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.RADIUS),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.WIDTH, default = DEFAULT_WIDTH, omit_default = False)
+        ])
+    
     def __init__(self, x, y, radius, layer, width = DEFAULT_WIDTH):
         self.x = x
         self.y = y
@@ -59,22 +68,10 @@ class Circle:
     
     @classmethod
     def parse(cls, n):
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        radius = attributes.parse(cls, n, constants.ATTRIBUTES.RADIUS)
-        width = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.WIDTH, cls.DEFAULT_WIDTH)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        
-        return Circle(x, y, radius, layer, width)
-        
+        return Circle(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.RADIUS, self.radius)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.WIDTH, self.width)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
     
 class Contact_Ref:
     TAG_NAME = constants.TAGS.CONTACT_REF
@@ -88,6 +85,13 @@ class Contact_Ref:
                 constants.ATTRIBUTES.ROUTE_TAG: attributes.ATTR_STRING
                 }
           
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.ELEMENT),
+        attributes.Field(constants.ATTRIBUTES.PAD),
+        attributes.Field(constants.ATTRIBUTES.ROUTE, default = DEFAULT_ROUTE),
+        attributes.Field(constants.ATTRIBUTES.ROUTE_TAG, 'route_tag', default = DEFAULT_ROUTE_TAG)
+        ])
+    
     def __init__(self, element, pad, route = DEFAULT_ROUTE, route_tag = DEFAULT_ROUTE_TAG):
         self.element = element
         self.pad = pad
@@ -96,20 +100,10 @@ class Contact_Ref:
         
     @classmethod
     def parse(cls, n):
-        element = attributes.parse(cls, n, constants.ATTRIBUTES.ELEMENT)
-        pad = attributes.parse(cls, n, constants.ATTRIBUTES.PAD)
-        route = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROUTE, cls.DEFAULT_ROUTE)
-        route_tag = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROUTE_TAG, cls.DEFAULT_ROUTE_TAG)
-        
-        return Contact_Ref(element, pad, route, route_tag)
-          
+        return Contact_Ref(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ELEMENT, self.element)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.PAD, self.pad)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROUTE, self.route, self.DEFAULT_ROUTE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROUTE_TAG, self.route_tag, self.DEFAULT_ROUTE_TAG)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
           
 """
 Descriptions are added to the enclosing tags, so this primitive is not used. 
@@ -148,6 +142,26 @@ class Dimension:
                 
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X1),
+        attributes.Field(constants.ATTRIBUTES.Y1),
+        attributes.Field(constants.ATTRIBUTES.X2),
+        attributes.Field(constants.ATTRIBUTES.Y2),
+        attributes.Field(constants.ATTRIBUTES.X3),
+        attributes.Field(constants.ATTRIBUTES.Y3),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.TEXT_SIZE, 'text_size', default = DEFAULT_TEXT_SIZE),
+        attributes.Field(constants.ATTRIBUTES.TEXT_RATIO, 'text_ratio', default = DEFAULT_TEXT_RATIO),
+        attributes.Field(constants.ATTRIBUTES.DIMENSION_TYPE, 'dimension_type', default = DEFAULT_DIMENSION_TYPE),
+        attributes.Field(constants.ATTRIBUTES.WIDTH, default = DEFAULT_WIDTH),
+        attributes.Field(constants.ATTRIBUTES.EXT_WIDTH, 'ext_width', default = DEFAULT_EXT_WIDTH),
+        attributes.Field(constants.ATTRIBUTES.EXT_LENGTH, 'ext_length', default = DEFAULT_EXT_LENGTH),
+        attributes.Field(constants.ATTRIBUTES.EXT_OFFSET, 'ext_offset', default = DEFAULT_EXT_OFFSET),
+        attributes.Field(constants.ATTRIBUTES.UNIT, default = DEFAULT_UNIT),
+        attributes.Field(constants.ATTRIBUTES.PRECISION, default = DEFAULT_PRECISION),
+        attributes.Field(constants.ATTRIBUTES.VISIBLE, 'unit_visible', default = DEFAULT_UNIT_VISIBLE)
+        ])
+    
     def __init__(self, x1, y1, x2, y2, x3, y3, layer, text_size = DEFAULT_TEXT_SIZE, text_ratio = DEFAULT_TEXT_RATIO,
                  dimension_type = DEFAULT_DIMENSION_TYPE, width = DEFAULT_WIDTH,
                  ext_width = DEFAULT_EXT_WIDTH, ext_length = DEFAULT_EXT_LENGTH,
@@ -173,46 +187,10 @@ class Dimension:
         
     @classmethod
     def parse(cls, n):
-        x1 = attributes.parse(cls, n, constants.ATTRIBUTES.X1)
-        y1 = attributes.parse(cls, n, constants.ATTRIBUTES.Y1)
-        x2 = attributes.parse(cls, n, constants.ATTRIBUTES.X2)
-        y2 = attributes.parse(cls, n, constants.ATTRIBUTES.Y2)
-        x3 = attributes.parse(cls, n, constants.ATTRIBUTES.X3)
-        y3 = attributes.parse(cls, n, constants.ATTRIBUTES.Y3)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        text_size = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.TEXT_SIZE, cls.DEFAULT_TEXT_SIZE)
-        text_ratio = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.TEXT_RATIO, cls.DEFAULT_TEXT_RATIO)
-        dimension_type = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.DIMENSION_TYPE, cls.DEFAULT_DIMENSION_TYPE)
-        width = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.WIDTH, cls.DEFAULT_WIDTH)
-        ext_width = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.EXT_WIDTH, cls.DEFAULT_EXT_WIDTH)
-        ext_length = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.EXT_LENGTH, cls.DEFAULT_EXT_LENGTH)
-        ext_offset = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.EXT_OFFSET, cls.DEFAULT_EXT_OFFSET)
-        unit = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.UNIT, cls.DEFAULT_UNIT)
-        precision = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.PRECISION, cls.DEFAULT_PRECISION)
-        unit_visible = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.VISIBLE, cls.DEFAULT_UNIT_VISIBLE)
-        
-        return Dimension(x1, y1, x2, y2, x3, y3, layer, text_size, text_ratio, dimension_type, width, ext_width, ext_length, ext_offset, unit, precision, unit_visible)
-        
+        return Dimension(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-     
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X1, self.x1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y1, self.y1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X2, self.x2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y2, self.y2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X3, self.x3)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y3, self.y3)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.TEXT_SIZE, self.text_size, self.DEFAULT_TEXT_SIZE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.TEXT_RATIO, self.text_ratio, self.DEFAULT_TEXT_RATIO)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DIMENSION_TYPE, self.dimension_type, self.DEFAULT_DIMENSION_TYPE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.WIDTH, self.width, self.DEFAULT_WIDTH)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.EXT_WIDTH, self.ext_width, self.DEFAULT_EXT_WIDTH)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.EXT_LENGTH, self.ext_length, self.DEFAULT_EXT_LENGTH)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.EXT_OFFSET, self.ext_offset, self.DEFAULT_EXT_OFFSET)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.UNIT, self.unit, self.DEFAULT_UNIT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.PRECISION, self.precision, self.DEFAULT_PRECISION)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.VISIBLE, self.unit_visible, self.DEFAULT_UNIT_VISIBLE)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
      
          
 class Frame:
@@ -239,6 +217,20 @@ class Frame:
                 
                 }
           
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X1),
+        attributes.Field(constants.ATTRIBUTES.Y1),
+        attributes.Field(constants.ATTRIBUTES.X2),
+        attributes.Field(constants.ATTRIBUTES.Y2),
+        attributes.Field(constants.ATTRIBUTES.ROWS, default = DEFAULT_ROWS, omit_default = False),
+        attributes.Field(constants.ATTRIBUTES.COLUMNS, default = DEFAULT_COLUMNS, omit_default = False),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.BORDER.TOP, 'border_top', default = DEFAULT_BORDER_TOP),
+        attributes.Field(constants.ATTRIBUTES.BORDER.LEFT, 'border_left', default = DEFAULT_BORDER_LEFT),
+        attributes.Field(constants.ATTRIBUTES.BORDER.BOTTOM, 'border_bottom', default = DEFAULT_BORDER_BOTTOM),
+        attributes.Field(constants.ATTRIBUTES.BORDER.RIGHT, 'border_right', default = DEFAULT_BORDER_RIGHT)
+        ])
+    
     def __init__(self, x1, y1, x2, y2, layer, rows = DEFAULT_ROWS, columns = DEFAULT_COLUMNS, border_left = DEFAULT_BORDER_LEFT,
                  border_top = DEFAULT_BORDER_TOP, border_right = DEFAULT_BORDER_RIGHT, border_bottom = DEFAULT_BORDER_BOTTOM):
         self.x1 = x1
@@ -257,36 +249,10 @@ class Frame:
 
     @classmethod
     def parse(cls, n):
-        x1 = attributes.parse(cls, n, constants.ATTRIBUTES.X1)
-        y1 = attributes.parse(cls, n, constants.ATTRIBUTES.Y1)
-        x2 = attributes.parse(cls, n, constants.ATTRIBUTES.X2)
-        y2 = attributes.parse(cls, n, constants.ATTRIBUTES.Y2)
-        rows = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROWS, cls.DEFAULT_ROWS)
-        columns = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.COLUMNS, cls.DEFAULT_COLUMNS)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        
-        border_top = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.BORDER.TOP, cls.DEFAULT_BORDER_TOP)
-        border_left = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.BORDER.LEFT, cls.DEFAULT_BORDER_LEFT)
-        border_bottom = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.BORDER.BOTTOM, cls.DEFAULT_BORDER_BOTTOM)
-        border_right = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.BORDER.RIGHT, cls.DEFAULT_BORDER_RIGHT)
-        
-        return Frame(x1, y1, x2, y2, layer, rows, columns, border_left, border_top, border_right, border_bottom)
-          
+        return Frame(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X1, self.x1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y1, self.y1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X2, self.x2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y2, self.y2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROWS, self.rows)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.COLUMNS, self.columns)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.BORDER.TOP, self.border_top, self.DEFAULT_BORDER_TOP)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.BORDER.LEFT, self.border_left, self.DEFAULT_BORDER_LEFT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.BORDER.BOTTOM, self.border_bottom, self.DEFAULT_BORDER_BOTTOM)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.BORDER.RIGHT, self.border_right, self.DEFAULT_BORDER_RIGHT)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 class Hole:
     TAG_NAME = constants.TAGS.HOLE
@@ -296,6 +262,12 @@ class Hole:
                 constants.ATTRIBUTES.DRILL: attributes.ATTR_FLOAT
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.DRILL)
+        ])
+    
     def __init__(self, x, y, drill):
         self.x = x
         self.y = y
@@ -303,18 +275,10 @@ class Hole:
         
     @classmethod
     def parse(cls, n):
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        drill = attributes.parse(cls, n, constants.ATTRIBUTES.DRILL)
-        
-        return Hole(x, y, drill)
+        return Hole(**cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DRILL, self.drill)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
    
 class Junction:
     TAG_NAME = constants.TAGS.JUNCTION
@@ -322,22 +286,21 @@ class Junction:
     ATTR_MAP = {constants.ATTRIBUTES.X: attributes.ATTR_FLOAT,
                 constants.ATTRIBUTES.Y: attributes.ATTR_FLOAT}
         
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y)
+        ])
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         
     @classmethod
     def parse(cls, n):
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        
-        return Junction(x, y)
+        return Junction(**cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 class Label:
     TAG_NAME = constants.TAGS.LABEL
@@ -356,6 +319,17 @@ class Label:
                 constants.ATTRIBUTES.RATIO: attributes.ATTR_INT
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.SIZE),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.XREF, default = DEFAULT_XREF),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.FONT, default = DEFAULT_FONT),
+        attributes.Field(constants.ATTRIBUTES.RATIO, default = DEFAULT_RATIO)
+        ])
+    
     def __init__(self, x, y, size, layer, xref, rotation = attributes.Rotation(0), font = DEFAULT_FONT, ratio = DEFAULT_RATIO):
         self.x = x
         self.y = y
@@ -368,28 +342,10 @@ class Label:
         
     @classmethod
     def parse(cls, n):
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        size = attributes.parse(cls, n, constants.ATTRIBUTES.SIZE)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        xref = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.XREF, cls.DEFAULT_XREF)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation(0))
-        font = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.FONT, cls.DEFAULT_FONT)
-        ratio = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.RATIO, cls.DEFAULT_RATIO)
-        
-        return Label(x, y, size, layer, xref, rotation, font, ratio)
-        
+        return Label(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SIZE, self.size)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.XREF, self.xref, self.DEFAULT_XREF)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation(0))
-        attributes.set_attr(self, n, constants.ATTRIBUTES.FONT, self.font, self.DEFAULT_FONT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.RATIO, self.ratio, self.DEFAULT_RATIO)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 class Pad:
     TAG_NAME = constants.TAGS.PAD
@@ -410,6 +366,19 @@ class Pad:
                 constants.ATTRIBUTES.STOP: attributes.ATTR_BOOL,
                 constants.ATTRIBUTES.THERMALS: attributes.ATTR_BOOL}
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.NAME),
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.DRILL),
+        attributes.Field(constants.ATTRIBUTES.DIAMETER, default = None),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.SHAPE, default = DEFAULT_SHAPE),
+        attributes.Field(constants.ATTRIBUTES.FIRST, default = DEFAULT_FIRST),
+        attributes.Field(constants.ATTRIBUTES.STOP, default = DEFAULT_STOP),
+        attributes.Field(constants.ATTRIBUTES.THERMALS, default = DEFAULT_THERMALS)
+        ])
+    
     def __init__(self, name, x, y, drill, diameter = None, rotation = attributes.Rotation(), shape = DEFAULT_SHAPE, first = DEFAULT_FIRST, stop = DEFAULT_STOP, thermals = DEFAULT_THERMALS):
         self.name = name
         self.x = x
@@ -424,32 +393,10 @@ class Pad:
     
     @classmethod
     def parse(cls, n):
-        name = attributes.parse(cls, n, constants.ATTRIBUTES.NAME)
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        drill = attributes.parse(cls, n, constants.ATTRIBUTES.DRILL)
-        diameter = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.DIAMETER, None)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation())
-        shape = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.SHAPE, cls.DEFAULT_SHAPE)
-        first = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.FIRST, cls.DEFAULT_FIRST)
-        stop = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.STOP, cls.DEFAULT_STOP)
-        thermals = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.THERMALS, cls.DEFAULT_THERMALS)
-        
-        return Pad(name, x, y, drill, diameter, rotation, shape, first, stop, thermals)
+        return Pad(**cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.NAME, self.name)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DRILL, self.drill)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DIAMETER, self.diameter)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation())
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SHAPE, self.shape, self.DEFAULT_SHAPE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.FIRST, self.first, self.DEFAULT_FIRST)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.STOP, self.stop, self.DEFAULT_STOP)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.THERMALS, self.thermals, self.DEFAULT_THERMALS)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 class Pin:
     TAG_NAME = constants.TAGS.PIN
@@ -471,6 +418,18 @@ class Pin:
                 constants.ATTRIBUTES.FUNCTION: attributes.ATTR_STRING
                 }
 
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.NAME),
+        attributes.Field(constants.ATTRIBUTES.VISIBLE, default = DEFAULT_VISIBLE),
+        attributes.Field(constants.ATTRIBUTES.SWAP_LEVEL, 'swap_level', default = DEFAULT_SWAP_LEVEL),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.LENGTH, default = DEFAULT_LENGTH),
+        attributes.Field(constants.ATTRIBUTES.DIRECTION, default = DEFAULT_DIRECTION),
+        attributes.Field(constants.ATTRIBUTES.FUNCTION, default = DEFAULT_FUNCTION)
+        ])
+    
     def __init__(self, name, 
                  x, 
                  y, 
@@ -492,30 +451,10 @@ class Pin:
         
     @classmethod
     def parse(cls, n):
-        name = attributes.parse(cls, n, constants.ATTRIBUTES.NAME)
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        visible = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.VISIBLE, cls.DEFAULT_VISIBLE)
-        swap_level = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.SWAP_LEVEL, cls.DEFAULT_SWAP_LEVEL)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation())
-        length = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.LENGTH, cls.DEFAULT_LENGTH)
-        direction = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.DIRECTION, cls.DEFAULT_DIRECTION)
-        function = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.FUNCTION, cls.DEFAULT_FUNCTION)
-        
-        return Pin(name, x, y, visible, swap_level, rotation, length, direction, function)
-        
+        return Pin(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.NAME, self.name)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.VISIBLE, self.visible, self.DEFAULT_VISIBLE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SWAP_LEVEL, self.swap_level, self.DEFAULT_SWAP_LEVEL)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation())
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LENGTH, self.length, self.DEFAULT_LENGTH)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DIRECTION, self.direction, self.DEFAULT_DIRECTION)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.FUNCTION, self.function, self.DEFAULT_FUNCTION)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
 
 class Pin_Ref:
     TAG_NAME = constants.TAGS.PIN_REF
@@ -525,6 +464,12 @@ class Pin_Ref:
                 constants.ATTRIBUTES.PIN: attributes.ATTR_STRING
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.PART),
+        attributes.Field(constants.ATTRIBUTES.GATE),
+        attributes.Field(constants.ATTRIBUTES.PIN)
+        ])
+    
     def __init__(self, part, gate, pin):
         self.part = part
         self.gate = gate
@@ -532,18 +477,10 @@ class Pin_Ref:
         
     @classmethod
     def parse(cls, n):
-        part = attributes.parse(cls, n, constants.ATTRIBUTES.PART)
-        gate = attributes.parse(cls, n, constants.ATTRIBUTES.GATE)
-        pin = attributes.parse(cls, n, constants.ATTRIBUTES.PIN)
-
-        return Pin_Ref(part, gate, pin)
-
+        return Pin_Ref(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-
-        attributes.set_attr(self, n, constants.ATTRIBUTES.PART, self.part)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.GATE, self.gate)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.PIN, self.pin)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 
 class Polygon:
@@ -568,6 +505,17 @@ class Polygon:
                 constants.ATTRIBUTES.ORPHANS: attributes.ATTR_BOOL,
                 constants.ATTRIBUTES.THERMALS: attributes.ATTR_BOOL}
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.WIDTH, default = DEFAULT_WIDTH, omit_default = False),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.RANK, default = DEFAULT_RANK),
+        attributes.Field(constants.ATTRIBUTES.SPACING, default = DEFAULT_SPACING),
+        attributes.Field(constants.ATTRIBUTES.POUR, default = DEFAULT_POUR),
+        attributes.Field(constants.ATTRIBUTES.ISOLATE, default = DEFAULT_ISOLATE),
+        attributes.Field(constants.ATTRIBUTES.ORPHANS, default = DEFAULT_ORPHANS),
+        attributes.Field(constants.ATTRIBUTES.THERMALS, default = DEFAULT_THERMALS)
+        ])
+    
     def __init__(self, layer, points = [], width = DEFAULT_WIDTH, rank = DEFAULT_RANK, spacing = DEFAULT_SPACING, pour = DEFAULT_POUR, isolate = DEFAULT_ISOLATE,
                  orphans = DEFAULT_ORPHANS, thermals = DEFAULT_THERMALS):
         self.layer = layer
@@ -582,15 +530,6 @@ class Polygon:
         
     @classmethod
     def parse(cls, n):
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        width = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.WIDTH, cls.DEFAULT_WIDTH)
-        rank = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.RANK, cls.DEFAULT_RANK)
-        spacing = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.SPACING, cls.DEFAULT_SPACING)
-        pour = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.POUR, cls.DEFAULT_POUR)
-        isolate = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ISOLATE, cls.DEFAULT_ISOLATE)
-        orphans = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ORPHANS, cls.DEFAULT_ORPHANS)
-        thermals = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.THERMALS, cls.DEFAULT_THERMALS)
-        
         # Get the points
         n_vertex_arr = n.findall(constants.TAGS.VERTEX)
         points = []
@@ -601,20 +540,10 @@ class Polygon:
             curve = attributes.parse_or_default(cls, nv, constants.ATTRIBUTES.CURVE, 0)
             points.append((x, y, curve))
         
-        return Polygon(layer, points = points, width = width, rank = rank, spacing = spacing, pour = pour, isolate = isolate,
-                       orphans = orphans, thermals = thermals)
+        return Polygon(points = points, **cls.CODEC.parse(n))
             
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.WIDTH, self.width)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.RANK, self.rank, self.DEFAULT_RANK)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SPACING, self.spacing, self.DEFAULT_SPACING)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.POUR, self.pour, self.DEFAULT_POUR)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ISOLATE, self.isolate, self.DEFAULT_ISOLATE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ORPHANS, self.orphans, self.DEFAULT_ORPHANS)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.THERMALS, self.thermals, self.DEFAULT_THERMALS)
+        n = ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
         for p in self.points:
             n_vertex = ElementTree.SubElement(n, constants.TAGS.VERTEX)
@@ -633,6 +562,15 @@ class Rectangle:
                 constants.ATTRIBUTES.ROTATION: attributes.ATTR_ROT
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X1),
+        attributes.Field(constants.ATTRIBUTES.Y1),
+        attributes.Field(constants.ATTRIBUTES.X2),
+        attributes.Field(constants.ATTRIBUTES.Y2),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation)
+        ])
+    
     def __init__(self, x1, y1, x2, y2, layer, rotation = attributes.Rotation(0)):
         self.x1 = x1
         self.y1 = y1
@@ -643,24 +581,10 @@ class Rectangle:
         
     @classmethod
     def parse(cls, n):
-        x1 = attributes.parse(cls, n, constants.ATTRIBUTES.X1)
-        y1 = attributes.parse(cls, n, constants.ATTRIBUTES.Y1)
-        x2 = attributes.parse(cls, n, constants.ATTRIBUTES.X2)
-        y2 = attributes.parse(cls, n, constants.ATTRIBUTES.Y2)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation(0))
-        
-        return Rectangle(x1, y1, x2, y2, layer, rotation)
+        return Rectangle(**cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X1, self.x1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y1, self.y1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X2, self.x2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y2, self.y2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation(0))
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         
 class SMD:
     TAG_NAME = constants.TAGS.SMD
@@ -685,6 +609,21 @@ class SMD:
                 constants.ATTRIBUTES.THERMALS: attributes.ATTR_BOOL
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.NAME),
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.DX),
+        attributes.Field(constants.ATTRIBUTES.DY),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.ROUNDNESS, default = DEFAULT_ROUNDNESS),
+        attributes.Field(constants.ATTRIBUTES.CREAM, default = DEFAULT_CREAM),
+        attributes.Field(constants.ATTRIBUTES.FIRST, default = DEFAULT_FIRST),
+        attributes.Field(constants.ATTRIBUTES.STOP, default = DEFAULT_STOP),
+        attributes.Field(constants.ATTRIBUTES.THERMALS, default = DEFAULT_THERMALS)
+        ])
+    
     def __init__(self, name, x, y, dx, dy, layer, rotation = attributes.Rotation(), roundness = DEFAULT_ROUNDNESS, cream = DEFAULT_CREAM, first = DEFAULT_FIRST, stop = DEFAULT_STOP, thermals = DEFAULT_THERMALS):
         self.name = name
         self.x = x 
@@ -701,36 +640,10 @@ class SMD:
         
     @classmethod
     def parse(cls, n):
-        name = attributes.parse(cls, n, constants.ATTRIBUTES.NAME)
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        dx = attributes.parse(cls, n, constants.ATTRIBUTES.DX)
-        dy = attributes.parse(cls, n, constants.ATTRIBUTES.DY)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation())
-        roundness = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROUNDNESS, cls.DEFAULT_ROUNDNESS)
-        cream = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.CREAM, cls.DEFAULT_CREAM)
-        first = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.FIRST, cls.DEFAULT_FIRST)
-        stop = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.STOP, cls.DEFAULT_STOP)
-        thermals = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.THERMALS, cls.DEFAULT_THERMALS)
-        
-        return SMD(name, x, y, dx, dy, layer, rotation, roundness, cream, first, stop, thermals)
-
+        return SMD(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.NAME, self.name)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DX, self.dx)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DY, self.dy)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation())
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROUNDNESS, self.roundness, self.DEFAULT_ROUNDNESS)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.CREAM, self.cream, self.DEFAULT_CREAM)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.FIRST, self.first, self.DEFAULT_FIRST)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.STOP, self.stop, self.DEFAULT_STOP)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.THERMALS, self.thermals, self.DEFAULT_THERMALS)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
 
 class Text:
     TAG_NAME = constants.TAGS.TEXT
@@ -754,6 +667,19 @@ class Text:
                 constants.ATTRIBUTES.SPIN: attributes.ATTR_BOOL
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.SIZE),
+        attributes.Field(constants.ATTRIBUTES.FONT, default = DEFAULT_FONT),
+        attributes.Field(constants.ATTRIBUTES.ALIGN, default = DEFAULT_ALIGN),
+        attributes.Field(constants.ATTRIBUTES.RATIO, default = DEFAULT_RATIO),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.DISTANCE, default = DEFAULT_DISTANCE),
+        attributes.Field(constants.ATTRIBUTES.SPIN, default = DEFAULT_SPIN)
+        ])
+    
     def __init__(self, value, 
                  x, 
                  y, 
@@ -779,36 +705,11 @@ class Text:
         
     @classmethod
     def parse(cls, n):
-        
-        value = n.text
-        
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        size = attributes.parse(cls, n, constants.ATTRIBUTES.SIZE)
-        align = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ALIGN, cls.DEFAULT_ALIGN)
-        font = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.FONT, cls.DEFAULT_FONT)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation())
-        ratio = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.RATIO, cls.DEFAULT_RATIO)
-        distance = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.DISTANCE, cls.DEFAULT_DISTANCE)
-        spin = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.SPIN, cls.DEFAULT_SPIN)
-        
-        return Text(value, x, y, layer, size, align, font, rotation, ratio, distance, spin)
+        return Text(n.text, **cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
+        n = ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
         n.text = self.value
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SIZE, self.size)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.FONT, self.font, self.DEFAULT_FONT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ALIGN, self.align, self.DEFAULT_ALIGN)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.RATIO, self.ratio, self.DEFAULT_RATIO)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation(0))
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DISTANCE, self.distance, self.DEFAULT_DISTANCE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SPIN, self.spin, self.DEFAULT_SPIN)
 
   
 class Via:
@@ -828,6 +729,17 @@ class Via:
                 constants.ATTRIBUTES.SHAPE: attributes.ATTR_STRING
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X),
+        attributes.Field(constants.ATTRIBUTES.Y),
+        attributes.Field(constants.ATTRIBUTES.DRILL),
+        attributes.Field(constants.ATTRIBUTES.DIAMETER, default = None),
+        attributes.Field(constants.ATTRIBUTES.ROTATION, 'rotation', default = attributes.Rotation),
+        attributes.Field(constants.ATTRIBUTES.EXTENT, default = DEFAULT_EXTENT),
+        attributes.Field(constants.ATTRIBUTES.ALWAYS_STOP, 'always_stop', default = DEFAULT_ALWAYS_STOP),
+        attributes.Field(constants.ATTRIBUTES.SHAPE, default = DEFAULT_SHAPE)
+        ])
+    
     def __init__(self, x, y, drill, diameter = None, rotation = attributes.Rotation(), extent = DEFAULT_EXTENT, always_stop = DEFAULT_ALWAYS_STOP, shape = DEFAULT_SHAPE):
         self.x = x
         self.y = y
@@ -840,28 +752,10 @@ class Via:
         
     @classmethod
     def parse(cls, n):
-        x = attributes.parse(cls, n, constants.ATTRIBUTES.X)
-        y = attributes.parse(cls, n, constants.ATTRIBUTES.Y)
-        drill = attributes.parse(cls, n, constants.ATTRIBUTES.DRILL)
-        diameter = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.DIAMETER, None)
-        rotation = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ROTATION, attributes.Rotation(0))
-        extent = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.EXTENT, cls.DEFAULT_EXTENT)
-        always_stop = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.ALWAYS_STOP, cls.DEFAULT_ALWAYS_STOP)
-        shape = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.SHAPE, cls.DEFAULT_SHAPE)
-        
-        return Via(x, y, drill, diameter, rotation, extent, always_stop, shape)
+        return Via(**cls.CODEC.parse(n))
     
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X, self.x)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y, self.y)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DRILL, self.drill)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.DIAMETER, self.diameter)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ROTATION, self.rotation, attributes.Rotation(0))
-        attributes.set_attr(self, n, constants.ATTRIBUTES.EXTENT, self.extent, self.DEFAULT_EXTENT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.ALWAYS_STOP, self.always_stop, self.DEFAULT_ALWAYS_STOP)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.SHAPE, self.shape, self.DEFAULT_SHAPE)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
 
 class Wire:
     TAG_NAME = constants.TAGS.WIRE
@@ -883,6 +777,19 @@ class Wire:
                 constants.ATTRIBUTES.CAP: attributes.ATTR_STRING
                 }
     
+    CODEC = attributes.Codec(ATTR_MAP, [
+        attributes.Field(constants.ATTRIBUTES.X1),
+        attributes.Field(constants.ATTRIBUTES.Y1),
+        attributes.Field(constants.ATTRIBUTES.X2),
+        attributes.Field(constants.ATTRIBUTES.Y2),
+        attributes.Field(constants.ATTRIBUTES.WIDTH),
+        attributes.Field(constants.ATTRIBUTES.LAYER),
+        attributes.Field(constants.ATTRIBUTES.CURVE, default = DEFAULT_CURVE),
+        attributes.Field(constants.ATTRIBUTES.EXTENT, default = DEFAULT_EXTENT),
+        attributes.Field(constants.ATTRIBUTES.STYLE, default = DEFAULT_STYLE),
+        attributes.Field(constants.ATTRIBUTES.CAP, default = DEFAULT_CAP)
+        ])
+    
     def __init__(self, x1, y1, x2, y2, width = 0.1, layer=constants.LAYERS.NETS, curve = DEFAULT_CURVE, extent = DEFAULT_EXTENT, style = DEFAULT_STYLE, cap = DEFAULT_CAP):
         self.x1 = x1
         self.y1 = y1
@@ -897,32 +804,10 @@ class Wire:
 
     @classmethod
     def parse(cls, n):
-        x1 = attributes.parse(cls, n, constants.ATTRIBUTES.X1)
-        y1 = attributes.parse(cls, n, constants.ATTRIBUTES.Y1)
-        x2 = attributes.parse(cls, n, constants.ATTRIBUTES.X2)
-        y2 = attributes.parse(cls, n, constants.ATTRIBUTES.Y2)
-        width = attributes.parse(cls, n, constants.ATTRIBUTES.WIDTH)
-        layer = attributes.parse(cls, n, constants.ATTRIBUTES.LAYER)
-        curve = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.CURVE, cls.DEFAULT_CURVE)
-        extent = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.EXTENT, cls.DEFAULT_EXTENT)
-        style = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.STYLE, cls.DEFAULT_STYLE)
-        cap = attributes.parse_or_default(cls, n, constants.ATTRIBUTES.CAP, cls.DEFAULT_CAP)
-
-        return Wire(x1, y1, x2, y2, width, layer, curve, extent, style, cap)
-
+        return Wire(**cls.CODEC.parse(n))
+    
     def append_node(self, _n):
-        n = ElementTree.SubElement(_n, self.TAG_NAME)
-        
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X1, self.x1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y1, self.y1)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.X2, self.x2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.Y2, self.y2)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.WIDTH, self.width)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.LAYER, self.layer)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.CURVE, self.curve, self.DEFAULT_CURVE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.EXTENT, self.extent, self.DEFAULT_EXTENT)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.STYLE, self.style, self.DEFAULT_STYLE)
-        attributes.set_attr(self, n, constants.ATTRIBUTES.CAP, self.cap, self.DEFAULT_CAP)
+        ElementTree.SubElement(_n, self.TAG_NAME, self.CODEC.attrib(self))
 
 def parse_item(n):
     """
@@ -934,7 +819,7 @@ def parse_item(n):
     
     """
     
-    if ITEM_MAP.has_key(n.tag) == False:
+    if n.tag not in ITEM_MAP:
         print("Warning--unsupported tag {0}.".format(n.tag))
         return None
 
@@ -0,0 +1,104 @@
+"""
+Static analysis of a ``Netlist``: logic depth, critical path and fan-out,
+computed in one pass over the levelized graph.
+
+Fan-in cone sizes are exact but cost a walk over the cone each, so they are
+only counted for the ``cones`` outputs with the latest arrival. The report
+stays O(cones * n) on large designs instead of keeping a cone per node.
+"""
+
+from gates.Netlist import CONST, INPUT
+from gates.Timing import arrival_times, trace_path
+
+
+def _label(net, node):
+    return f"{net.ops[node]}:{net.names[node][:8]}"
+
+
+def cone_size(net, node, seen, stamp):
+    """Count the gates in the fan-in cone of ``node``, marking ``seen`` with ``stamp``."""
+    count = 0
+    stack = [node]
+    seen[node] = stamp
+    while stack:
+        node = stack.pop()
+        if net.ops[node] not in (CONST, INPUT):
+            count += 1
+        for literal in net.fanins[node]:
+            child = literal >> 1
+            if seen[child] != stamp:
+                seen[child] = stamp
+                stack.append(child)
+    return count
+
+
+def analyze(net, delays=None, top=5, cones=5):
+    """
+    Return a report dictionary for ``net``.
+
+    :param delays: Optional per-type delay overrides, see ``Timing.DELAYS``.
+    :param top: Number of fan-out hot spots to list.
+    :param cones: Number of outputs, latest arrival first, whose fan-in cone is
+        counted. The others report a cone of None.
+    """
+    order, levels, loop_heads = net.levelize()
+    arrival, previous = arrival_times(net, delays)
+
+    fanout = [0] * len(net.ops)
+    for fanins in net.fanins:
+        for literal in fanins:
+            fanout[literal >> 1] += 1
+
+    counted = sorted(
+        range(len(net.outputs)), key=lambda index: arrival[net.outputs[index] >> 1], reverse=True
+    )[:cones]
+    seen = [-1] * len(net.ops)
+    cone = {index: cone_size(net, net.outputs[index] >> 1, seen, index) for index in counted}
+
+    outputs = []
+    for index, literal in enumerate(net.outputs):
+        node = literal >> 1
+        path = trace_path(previous, node)
+        outputs.append({
+            "output": index,
+            "depth": levels[node],
+            "arrival": arrival[node],
+            "cone": cone.get(index),
+            "path": [_label(net, node) for node in path],
+        })
+
+    hot_spots = sorted(
+        (node for node in range(1, len(net.ops)) if fanout[node]),
+        key=lambda node: fanout[node],
+        reverse=True,
+    )[:top]
+    return {
+        "gates": net.gate_count(),
+        "inputs": len(net.inputs),
+        "loops": len(loop_heads),
+        "depth": max((output["depth"] for output in outputs), default=0),
+        "outputs": outputs,
+        "fanout": [{"node": _label(net, node), "fanout": fanout[node]} for node in hot_spots],
+    }
+
+
+def format_analysis(report):
+    lines = [
+        f"{report['gates']} gates, {report['inputs']} inputs, {len(report['outputs'])} outputs, "
+        f"depth {report['depth']}, {report['loops']} feedback loops",
+        "",
+        "Outputs:",
+    ]
+    for output in report["outputs"]:
+        line = f"  #{output['output']}: depth {output['depth']}, arrival {output['arrival']}"
+        if output["cone"] is not None:
+            line += f", cone {output['cone']} gates"
+        lines.append(line)
+    critical = max(report["outputs"], key=lambda output: output["arrival"], default=None)
+    if critical:
+        lines += ["", f"Critical path (output #{critical['output']}, {critical['arrival']}):"]
+        lines.append("  " + " -> ".join(critical["path"]))
+    if report["fanout"]:
+        lines += ["", "Fan-out hot spots:"]
+        lines += [f"  {spot['node']}: {spot['fanout']}" for spot in report["fanout"]]
+    return "\n".join(lines)
@@ -1,36 +1,59 @@
 import pygame
+from functools import reduce
+from operator import and_, or_, xor
+from gates import Macros
 from gates.Ports import Port
 from utils.popup import Popup
 from utils.colors import COLORS
 
+GATE_TYPES = ["AND", "OR", "NOT", "NAND", "NOR", "XOR", "XNOR", "SPLIT", "MERGE", *Macros.MACRO_TYPES]
+FIXED_INPUTS = {"NOT": 1, "SPLIT": 1, **Macros.FIXED_INPUTS}
+INVERTING = ("NOT", "NAND", "NOR", "XNOR")
+INPUT_COUNTS = [2, 3, 4, 8, 16, 32]
+BUS_WIDTHS = [1, 4, 8, 16, 32]
+
 class Gate:
-    def __init__(self, x, y, images, type) -> None:
+    def __init__(self, x, y, images, type, inputs=2, bits=1, offset=0) -> None:
         self.x = x  # Original x position
         self.y = y  # Original y position
         self.type = type
+        self.bits = bits  # Word width of bitwise gates and macro-cells, bus width taken by SPLIT
+        self.offset = offset  # Bit extracted by SPLIT
+        self.clock = 0  # Last clock level seen by REG
+        inputs = FIXED_INPUTS.get(type, inputs)
+        if type == "MUX":
+            inputs = max(inputs, 3)
         self.width = images[self.type].get_width()
-        self.height = images[self.type].get_height()
+        self.base_height = images[self.type].get_height()
+        self.height = self.base_height * max(2, inputs) / 2  # Wide gates grow taller
         self.output = Port(x + self.width, y + (self.height / 2), self, "output")
+        self.input = [Port(x, self.input_y(i, inputs), self) for i in range(inputs)]
+        self.apply_widths()
 
-        if type != "NOT":
-            self.input = [Port(x, y + (self.height / 4), self), Port(x, y + (3 * self.height / 4), self)]
-        else:
-            self.input = [Port(x, y + (self.height / 2), self)]
+    def input_y(self, index, count):
+        # Evenly spaced; matches the original 1/4 and 3/4 layout for two inputs
+        return self.y + (2 * index + 1) * self.height / (2 * count)
 
     def serialize(self):
         return {
             "x": self.x,
             "y": self.y,
             "type": self.type,
+            "bits": self.bits,
+            "offset": self.offset,
             "output": self.output.serialize(),
             "input": [port.serialize() for port in self.input]
         }
 
     @staticmethod
     def deserialize(data, images):
-        gate = Gate(data["x"], data["y"], images, data["type"])
+        gate = Gate(
+            data["x"], data["y"], images, data["type"], len(data["input"]),
+            data.get("bits", 1), data.get("offset", 0),
+        )
         gate.output = Port.deserialize(data["output"], gate)
         gate.input = [Port.deserialize(port_data, gate) for port_data in data["input"]]
+        gate.apply_widths(disconnect=False)
 
         gate.move(gate.x, gate.y) # temporary serialization patch
         return gate
@@ -60,9 +83,15 @@ class Gate:
                         color,
                         (scaled_connected_x, scaled_connected_y),
                         (scaled_port_x, scaled_port_y),
-                        int(5 * zoom),
+                        int((9 if port.bits > 1 else 5) * zoom),  # Buses are drawn thicker
                     )
 
+        # Label buses with their width and current word
+        if self.output.bits > 1 or self.type == "SPLIT":
+            label = f"[{self.offset}]" if self.type == "SPLIT" else f"{self.output.bits}b {self.output.value:#x}"
+            text = font.render(label, 1, COLORS["BLACK"])
+            screen.blit(text, (scaled_x, scaled_y - text.get_height()))
+
         # Draw output port
         pygame.draw.circle(
             screen,
@@ -72,24 +101,11 @@ class Gate:
         )
 
         # Draw input ports
-        if self.type != "NOT":
-            pygame.draw.circle(
-                screen,
-                COLORS["INPUT"],
-                (int(self.input[0].x * zoom + offset[0]), int(self.input[0].y * zoom + offset[1])),
-                int(5 * zoom),
-            )
+        for port in self.input:
             pygame.draw.circle(
                 screen,
                 COLORS["INPUT"],
-                (int(self.input[1].x * zoom + offset[0]), int(self.input[1].y * zoom + offset[1])),
-                int(5 * zoom),
-            )
-        else:
-            pygame.draw.circle(
-                screen,
-                COLORS["INPUT"],
-                (int(self.input[0].x * zoom + offset[0]), int(self.input[0].y * zoom + offset[1])),
+                (int(port.x * zoom + offset[0]), int(port.y * zoom + offset[1])),
                 int(5 * zoom),
             )
 
@@ -97,32 +113,81 @@ class Gate:
         # Update the original position
         self.x = x - (self.width / 2)
         self.y = y - (self.height / 2)
+        self.place_ports()
+
+    def place_ports(self):
         self.output.set_pos(self.x + self.width, self.y + (self.height / 2))
-        if self.type != "NOT":
-            self.input[0].set_pos(self.x, self.y + (self.height / 4))
-            self.input[1].set_pos(self.x, self.y + (3 * self.height / 4))
-        else:
-            self.input[0].set_pos(self.x, self.y + (self.height / 2))
+        for i, port in enumerate(self.input):
+            port.set_pos(self.x, self.input_y(i, len(self.input)))
 
     def calculate(self, update=False):
         if update:
             for input in self.input:
                 input.value = input.connected_from.value if input.connected_from else 0
+        values = [int(input.value) for input in self.input]
+        mask = (1 << self.output.bits) - 1
+        # N-ary gates evaluate as a single word-wide reduction over all inputs
         match self.type:
-            case "AND":
-                self.output.value = self.input[0].value and self.input[1].value
-            case "OR":
-                self.output.value = self.input[0].value or self.input[1].value
+            case "AND" | "NAND":
+                value = reduce(and_, values, mask)
+            case "OR" | "NOR":
+                value = reduce(or_, values, 0)
+            case "XOR" | "XNOR":
+                value = reduce(xor, values, 0)
             case "NOT":
-                self.output.value = not self.input[0].value
-            case "NAND":
-                self.output.value = not (self.input[0].value and self.input[1].value)
-            case "NOR":
-                self.output.value = not (self.input[0].value or self.input[1].value)
-            case "XOR":
-                self.output.value = self.input[0].value ^ self.input[1].value
-            case "XNOR":
-                self.output.value = not (self.input[0].value ^ self.input[1].value)
+                value = values[0]
+            case "SPLIT":
+                value = (values[0] >> self.offset) & 1
+            case "MERGE":
+                value = sum((bit & 1) << i for i, bit in enumerate(values))
+            case "REG":
+                # Load on the rising clock edge, hold otherwise
+                value = values[0] if values[1] and not self.clock else self.output.value
+                self.clock = values[1]
+            case _:
+                value = Macros.evaluate(self.type, values)
+        if self.type in INVERTING:
+            value ^= mask
+        self.output.value = value
+
+    def port_widths(self):
+        """Return the (input, output) bus widths implied by the gate type."""
+        count = len(self.input)
+        match self.type:
+            case "SPLIT":
+                return [self.bits], 1
+            case "MERGE":
+                return [1] * count, count
+        if self.type in Macros.MACRO_TYPES:
+            return Macros.port_widths(self.type, self.bits, count)
+        return [self.bits] * count, self.bits
+
+    def apply_widths(self, disconnect=True):
+        input_bits, output_bits = self.port_widths()
+        for port, bits in [(self.output, output_bits)] + list(zip(self.input, input_bits)):
+            port.bits = bits
+            if not disconnect:
+                continue
+            # Drop connections that no longer carry a matching width
+            if port.connected_from and port.connected_from.bits not in (0, bits):
+                port.connected_from.connected_to.remove(port)
+                port.connected_from = None
+            for target in [p for p in port.connected_to if p.bits not in (0, bits)]:
+                target.connected_from = None
+                port.connected_to.remove(target)
+
+    def set_bits(self, bits):
+        if self.type == "DEC":
+            bits = min(bits, Macros.MAX_DECODER_BITS)
+        if self.type != "MERGE":
+            self.bits = bits
+            self.offset = min(self.offset, bits - 1)
+            self.apply_widths()
+        return "remove"
+
+    def next_offset(self):
+        self.offset = (self.offset + 1) % self.bits
+        return "remove"
 
     def remove(self):
         for port in self.get_ports():
@@ -141,21 +206,47 @@ class Gate:
 
     def convert(self, type, images):
         if self.type != type:
-            if self.type == "NOT" or type == "NOT":
-                for input in self.input:
-                    if input.connected_from:
-                        input.connected_from.connected_to.remove(input)
-                    input.connected_from = None
-            if type == "NOT":
-                self.input = [Port(self.x, self.y + (self.height / 2), self)]
-            elif self.type == "NOT":
-                self.input = [
-                    Port(self.x, self.y + (self.height / 4), self),
-                    Port(self.x, self.y + (3 * self.height / 4), self),
-                ]
+            if type in FIXED_INPUTS:
+                count = FIXED_INPUTS[type]
+            elif self.type in FIXED_INPUTS:
+                count = 2
+            else:
+                count = len(self.input)
+            if type == "MUX":
+                count = max(count, 3)  # Select and at least two data inputs
+            if type == "DEC":
+                self.bits = min(self.bits, Macros.MAX_DECODER_BITS)
             self.type = type
+            # Take the new type's geometry, keeping the gate centred
+            center_x = self.x + self.width / 2
+            self.width = images[type].get_width()
+            self.base_height = images[type].get_height()
+            self.x = center_x - self.width / 2
+            self.resize_inputs(count)
         return "remove"
 
+    def set_input_count(self, count):
+        if self.type == "MUX":
+            self.resize_inputs(count + 1)  # Data inputs plus the select
+        elif self.type not in FIXED_INPUTS:
+            self.resize_inputs(count)
+        return "remove"
+
+    def resize_inputs(self, count):
+        if count < len(self.input):
+            for input in self.input[count:]:
+                if input.connected_from:
+                    input.connected_from.connected_to.remove(input)
+                input.connected_from = None
+            del self.input[count:]
+        else:
+            self.input.extend(Port(self.x, self.y, self) for _ in range(count - len(self.input)))
+        center_y = self.y + self.height / 2
+        self.height = self.base_height * max(2, count) / 2
+        self.y = center_y - self.height / 2
+        self.place_ports()
+        self.apply_widths()
+
     def mouse_hovered(self, zoom=1.0, offset=(0, 0)):
         x, y = pygame.mouse.get_pos()
         scaled_x = int(self.x * zoom + offset[0])
@@ -203,32 +294,40 @@ class Gate:
                 if l:
                     selected_gate = self
                 if r:
-                    popup = Popup(
-                        x,
-                        y,
-                        screen,
-                        [
-                            ("Delete", lambda: self),
-                            (
-                                "Convert_To",
-                                lambda: Popup(
-                                    x,
-                                    y,
-                                    screen,
-                                    [
-                                        ("AND", lambda: self.convert("AND", images)),
-                                        ("OR", lambda: self.convert("OR", images)),
-                                        ("NOT", lambda: self.convert("NOT", images)),
-                                        ("NAND", lambda: self.convert("NAND", images)),
-                                        ("NOR", lambda: self.convert("NOR", images)),
-                                        ("XOR", lambda: self.convert("XOR", images)),
-                                        ("XNOR", lambda: self.convert("XNOR", images)),
-                                    ],
-                                ),
+                    options = [
+                        ("Delete", lambda: self),
+                        (
+                            "Convert_To",
+                            lambda: Popup(
+                                x,
+                                y,
+                                screen,
+                                [(type, lambda type=type: self.convert(type, images)) for type in GATE_TYPES],
                             ),
-                            ("Remove_All_Connection", lambda: self.remove()),
-                        ],
-                    )
+                        ),
+                        (
+                            "Inputs",
+                            lambda: Popup(
+                                x,
+                                y,
+                                screen,
+                                [(str(n), lambda n=n: self.set_input_count(n)) for n in INPUT_COUNTS],
+                            ),
+                        ),
+                        (
+                            "Bits",
+                            lambda: Popup(
+                                x,
+                                y,
+                                screen,
+                                [(str(n), lambda n=n: self.set_bits(n)) for n in BUS_WIDTHS],
+                            ),
+                        ),
+                        ("Remove_All_Connection", lambda: self.remove()),
+                    ]
+                    if self.type == "SPLIT":
+                        options.insert(-1, ("Next_Bit", lambda: self.next_offset()))
+                    popup = Popup(x, y, screen, options)
 
         if event.type == pygame.MOUSEBUTTONUP:
             if selected_port:
@@ -0,0 +1,146 @@
+"""
+Word-level macro-cells.
+
+Each cell is evaluated natively with integer arithmetic, both by ``Gate`` and by
+the compiled ``Netlist``, so an n-bit adder costs one addition per evaluation
+instead of n full adders. ``lower`` builds the equivalent primitive gates, which
+``Netlist.expand`` uses when a gate-level view is needed for export. Adders
+lower to carry-lookahead blocks of ``LOOKAHEAD_BITS`` with the block carries
+rippled between them, or to a plain ripple-carry chain.
+
+The cells live in the simulator only: ``ALU/ALU.py`` keeps its own
+primitive-gate model and neither builds nor reads macro-cells.
+
+Port layout, with ``bits`` the operand width:
+
+* ADD: ``a``, ``b``, carry in -> ``bits + 1`` (carry out is the MSB)
+* CMP: ``a``, ``b`` -> 3 bits, ``lt | eq << 1 | gt << 2``
+* MUX: select, data 0..n-1 -> ``bits``
+* DEC: select -> ``1 << bits`` one-hot
+* REG: ``d``, clock -> ``bits``, loaded on the rising clock edge
+"""
+
+MACRO_TYPES = ("ADD", "CMP", "MUX", "DEC", "REG")
+SEQUENTIAL = ("REG",)
+FIXED_INPUTS = {"ADD": 3, "CMP": 2, "DEC": 1, "REG": 2}
+MAX_DECODER_BITS = 8  # A decoder's output grows as 2 ** bits
+LOOKAHEAD_BITS = 4  # Width of a carry-lookahead block in lowered adders
+
+
+def select_bits(data_count):
+    return max(1, (data_count - 1).bit_length())
+
+
+def port_widths(type, bits, inputs):
+    """Return ``(input widths, output width)`` for a macro-cell with ``inputs`` ports."""
+    match type:
+        case "ADD":
+            return [bits, bits, 1], bits + 1
+        case "CMP":
+            return [bits, bits], 3
+        case "MUX":
+            data = inputs - 1
+            return [select_bits(data)] + [bits] * data, bits
+        case "DEC":
+            return [bits], 1 << bits
+        case "REG":
+            return [bits, 1], bits
+    raise ValueError(f"Unsupported macro-cell {type}")
+
+
+def evaluate(type, values):
+    """Evaluate a combinational macro-cell over its integer input values."""
+    match type:
+        case "ADD":
+            return values[0] + values[1] + (values[2] & 1)
+        case "CMP":
+            a, b = values
+            return (a < b) | (a == b) << 1 | (a > b) << 2
+        case "MUX":
+            select, data = values[0], values[1:]
+            return data[select] if select < len(data) else 0
+        case "DEC":
+            return 1 << values[0]
+    raise ValueError(f"Unsupported macro-cell {type}")
+
+
+def expression(type, args):
+    """Python source for a combinational macro-cell, used by ``Netlist.compile``."""
+    match type:
+        case "ADD":
+            return f"{args[0]} + {args[1]} + ({args[2]} & 1)"
+        case "CMP":
+            a, b = args
+            return f"({a} < {b}) | ({a} == {b}) << 1 | ({a} > {b}) << 2"
+        case "MUX":
+            # Pad to the full select range so out of range selects read 0
+            data = args[1:] + ["0"] * ((1 << select_bits(len(args) - 1)) - len(args) + 1)
+            return f"({', '.join(data)},)[{args[0]}]"
+        case "DEC":
+            return f"1 << {args[0]}"
+    raise ValueError(f"Unsupported macro-cell {type}")
+
+
+def lower(net, type, fanins, bits, carry="lookahead"):
+    """
+    Build the primitive gates of one macro-cell in ``net``.
+
+    :param fanins: Literals driving the cell's inputs.
+    :param bits: Operand width of the cell.
+    :param carry: ``"lookahead"`` or ``"ripple"``, how an adder's carries are built.
+
+    Returns the literals of the output bits, LSB first.
+    """
+    widths, out_bits = port_widths(type, bits, len(fanins))
+
+    def split(literal, bits):
+        return [net.add_node("SPLIT", [literal], None, 1, i) << 1 for i in range(bits)]
+
+    def gate(op, *args):
+        return net.add_node(op, list(args)) << 1
+
+    def decode(select, count):
+        # One AND per value of the select lines
+        return [
+            gate("AND", *[s ^ (((k >> i) & 1) ^ 1) for i, s in enumerate(select)])
+            for k in range(count)
+        ]
+
+    match type:
+        case "ADD":
+            a, b, c = split(fanins[0], bits), split(fanins[1], bits), fanins[2]
+            propagate = [gate("XOR", a_i, b_i) for a_i, b_i in zip(a, b)]
+            generate = [gate("AND", a_i, b_i) for a_i, b_i in zip(a, b)]
+            block = LOOKAHEAD_BITS if carry == "lookahead" else 1
+            out = []
+            for start in range(0, bits, block):
+                c_in = c
+                for i in range(start, min(start + block, bits)):
+                    out.append(gate("XOR", propagate[i], c))
+                    # c[i+1] = g[i] | p[i]g[i-1] | ... | p[i]..p[start]c_in, two levels deep
+                    terms = [generate[i]]
+                    for j in range(i - 1, start - 1, -1):
+                        terms.append(gate("AND", *propagate[j + 1:i + 1], generate[j]))
+                    terms.append(gate("AND", *propagate[start:i + 1], c_in))
+                    c = gate("OR", *terms)
+            return out + [c]
+        case "CMP":
+            a, b = split(fanins[0], bits), split(fanins[1], bits)
+            lt, gt, eq = [], [], []
+            # Walk from the MSB; a bit decides only if every higher bit is equal
+            for a_i, b_i in reversed(list(zip(a, b))):
+                lt.append(gate("AND", a_i ^ 1, b_i, *eq))
+                gt.append(gate("AND", a_i, b_i ^ 1, *eq))
+                eq.append(gate("XOR", a_i, b_i) ^ 1)
+            return [gate("OR", *lt), gate("AND", *eq), gate("OR", *gt)]
+        case "MUX":
+            select = split(fanins[0], widths[0])
+            lines = decode(select, len(fanins) - 1)
+            data = [split(literal, out_bits) for literal in fanins[1:]]
+            return [
+                gate("OR", *[gate("AND", line, bits[i]) for line, bits in zip(lines, data)])
+                for i in range(out_bits)
+            ]
+        case "DEC":
+            return decode(split(fanins[0], bits), out_bits)
+    raise ValueError(f"Unsupported macro-cell {type}")
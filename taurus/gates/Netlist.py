@@ -0,0 +1,326 @@
+"""
+Flat, levelized view of a circuit.
+
+Every gate becomes a node addressed by an integer id and every wire becomes a
+literal: ``node << 1 | inverted``. Node 0 is the constant ``0``, so literal 0
+is all zeros and literal 1 is all ones. Each node carries a bus width; values
+are Python ints and inversion complements within that width. The netlist is
+compiled to a straight-line Python function, which is what the simulator
+evaluates each frame instead of walking the ``Port`` graph.
+
+Registers (see ``gates.Macros``) are state: their fanins are not ordering
+edges, and they load after the combinational logic has settled.
+"""
+
+from gates.Macros import MACRO_TYPES, SEQUENTIAL, expression, lower, port_widths
+
+CONST = "CONST"
+INPUT = "INPUT"
+GATE_TYPES = ("AND", "OR", "NOT", "NAND", "NOR", "XOR", "XNOR", "SPLIT", "MERGE") + MACRO_TYPES
+
+
+def lit(node, inverted=0):
+    return (node << 1) | inverted
+
+
+def lit_node(literal):
+    return literal >> 1
+
+
+def lit_inverted(literal):
+    return literal & 1
+
+
+def gate_inputs(gate):
+    # The GUI gates keep their ports in ``input``, the ALU model in ``inputs``
+    return gate.inputs if hasattr(gate, "inputs") else gate.input
+
+
+class Netlist:
+    def __init__(self) -> None:
+        self.ops = [CONST]
+        self.fanins = [[]]
+        self.names = ["0"]
+        self.widths = [1]
+        self.params = [None]  # Bit offset for SPLIT, operand width for macro-cells
+        self.inputs = []  # node ids of the primary inputs, in source order
+        self.outputs = []  # literal driving each primary output, in source order
+        self.output_bits = []
+        self.gate_lits = {}  # source gate -> literal of its output
+        self.values = [0]
+        self.clocks = [0]  # Last clock level seen by each REG
+        self._evaluate = None
+        self._levels = None
+
+    def add_node(self, op, fanins, name=None, width=1, param=None):
+        node = len(self.ops)
+        self.ops.append(op)
+        self.fanins.append(fanins)
+        self.names.append(name if name is not None else f"n{node}")
+        self.widths.append(width)
+        self.params.append(param)
+        self.values.append(0)
+        self.clocks.append(0)
+        self._evaluate = None
+        self._levels = None
+        return node
+
+    def add_input(self, name=None):
+        node = self.add_node(INPUT, [], name)
+        self.inputs.append(node)
+        return lit(node)
+
+    def gate_count(self):
+        return sum(1 for op in self.ops if op not in (CONST, INPUT))
+
+    @classmethod
+    def from_circuit(cls, inputs, outputs, gates):
+        """Build a netlist from live ``Input``/``Output``/``Gate`` objects."""
+        net = cls()
+        port_lit = {}
+        for obj in inputs:
+            port_lit[obj.port] = net.add_input(obj.port.uuid)
+        # Allocate every gate before wiring so feedback loops resolve
+        for gate in gates:
+            if gate.type in MACRO_TYPES:
+                param = getattr(gate, "bits", 1)
+            else:
+                param = getattr(gate, "offset", 0)
+            node = net.add_node(gate.type, [], gate.output.uuid, getattr(gate.output, "bits", 1), param)
+            port_lit[gate.output] = lit(node)
+            # Carry over state so registers and latches survive a recompile
+            net.values[node] = int(gate.output.value)
+            net.clocks[node] = getattr(gate, "clock", 0)
+        for gate in gates:
+            node = lit_node(port_lit[gate.output])
+            net.fanins[node] = [
+                port_lit.get(port.connected_from, 0) for port in gate_inputs(gate)
+            ]
+            net.gate_lits[gate] = lit(node)
+        for output in outputs:
+            source = output.port.connected_from
+            net.outputs.append(port_lit.get(source, 0))
+            net.output_bits.append(getattr(source, "bits", 1) or 1)
+        return net
+
+    @classmethod
+    def from_project(cls, data):
+        """Build a netlist from a project dictionary as written by ``save_project``."""
+        net = cls()
+        port_lit = {}
+        for input_data in data["inputs"]:
+            port = input_data["port"]
+            port_lit[port["uuid"]] = net.add_input(port["uuid"])
+        bits = {}
+        for gate_data in data["gates"]:
+            port = gate_data["output"]
+            bits[port["uuid"]] = port.get("bits", 1)
+            if gate_data["type"] in MACRO_TYPES:
+                param = gate_data.get("bits", 1)
+            else:
+                param = gate_data.get("offset", 0)
+            node = net.add_node(gate_data["type"], [], port["uuid"], bits[port["uuid"]], param)
+            port_lit[port["uuid"]] = lit(node)
+            net.values[node] = int(port.get("value", 0))
+        for gate_data in data["gates"]:
+            node = lit_node(port_lit[gate_data["output"]["uuid"]])
+            net.fanins[node] = [
+                port_lit.get(port["connected_from"], 0) for port in gate_data["input"]
+            ]
+        for output_data in data["outputs"]:
+            source = output_data["port"]["connected_from"]
+            net.outputs.append(port_lit.get(source, 0))
+            net.output_bits.append(bits.get(source, 1))
+        return net
+
+    def levelize(self):
+        """
+        Order the gate nodes so every node follows its fanins.
+
+        Returns ``(order, levels, loop_heads)``. Feedback edges are cut at the
+        node they re-enter (a loop head), which then reads its value from the
+        previous evaluation, like the old recursive DFS did. Registers are
+        sources, like inputs, and are left out of ``order``.
+        """
+        if self._levels is not None:
+            return self._levels
+
+        count = len(self.ops)
+        state = [0] * count  # 0 unseen, 1 on the stack, 2 done
+        levels = [0] * count
+        order = []
+        loop_heads = set()
+        roots = [lit_node(literal) for literal in self.outputs]
+        roots.extend(range(count))
+        for root in roots:
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, 0)]
+            while stack:
+                node, i = stack[-1]
+                fanins = self.fanins[node] if self.ops[node] not in SEQUENTIAL else ()
+                if i < len(fanins):
+                    stack[-1] = (node, i + 1)
+                    child = fanins[i] >> 1
+                    if state[child] == 0:
+                        state[child] = 1
+                        stack.append((child, 0))
+                    elif state[child] == 1:
+                        loop_heads.add(child)
+                    continue
+                stack.pop()
+                state[node] = 2
+                if self.ops[node] in (CONST, INPUT) + SEQUENTIAL:
+                    continue
+                level = 0
+                for literal in fanins:
+                    child = literal >> 1
+                    if state[child] == 2 and levels[child] > level:
+                        level = levels[child]
+                levels[node] = level + 1
+                order.append(node)
+
+        self._levels = (order, levels, loop_heads)
+        return self._levels
+
+    def _lit_expr(self, literal, bits):
+        # ``bits`` sizes the constant; other nodes invert within their own width
+        node = literal >> 1
+        if node == 0:
+            return str((1 << bits) - 1 if literal & 1 else 0)
+        if literal & 1:
+            return f"(v[{node}] ^ {(1 << self.widths[node]) - 1})"
+        return f"v[{node}]"
+
+    def fanin_widths(self, node):
+        """Bus width expected on each input of ``node``."""
+        op = self.ops[node]
+        count = len(self.fanins[node])
+        if op in MACRO_TYPES:
+            return port_widths(op, self.params[node], count)[0]
+        if op == "SPLIT":
+            return [self.params[node] + 1] * count  # Enough to reach the extracted bit
+        if op == "MERGE":
+            return [1] * count
+        return [self.widths[node]] * count
+
+    def _node_expr(self, node):
+        op = self.ops[node]
+        fanins = self.fanins[node]
+        mask = (1 << self.widths[node]) - 1
+        args = [
+            self._lit_expr(literal, bits) for literal, bits in zip(fanins, self.fanin_widths(node))
+        ]
+        if op == "SPLIT":
+            return f"({args[0] if args else 0} >> {self.params[node]}) & 1"
+        if op == "MERGE":
+            return " | ".join(f"({arg} << {i})" if i else arg for i, arg in enumerate(args)) or "0"
+        if op in MACRO_TYPES:
+            return expression(op, args)
+        if op in ("AND", "NAND"):
+            expr = " & ".join(args) if args else str(mask)
+        elif op in ("OR", "NOR"):
+            expr = " | ".join(args) if args else "0"
+        elif op in ("XOR", "XNOR"):
+            expr = " ^ ".join(args) if args else "0"
+        elif op == "NOT":
+            expr = args[0] if args else "0"
+        else:
+            raise ValueError(f"Unsupported gate type {op}")
+        if op in ("NOT", "NAND", "NOR", "XNOR"):
+            return f"({expr}) ^ {mask}"
+        return expr
+
+    def compile(self):
+        order, _, _ = self.levelize()
+        registers = [node for node, op in enumerate(self.ops) if op in SEQUENTIAL]
+        indent = "        " if registers else "    "
+        lines = ["def evaluate(v, c):"]
+        if registers:
+            # Settle, clock the registers together, and settle once more if any loaded
+            lines += ["    while True:"]
+        for node in order:
+            lines.append(f"{indent}v[{node}] = {self._node_expr(node)}")
+        if registers:
+            lines.append(f"{indent}changed = False")
+            for node in registers:
+                d, clock = (self.fanins[node] + [0, 0])[:2]
+                lines.append(f"{indent}d{node} = {self._lit_expr(d, self.widths[node])}")
+                lines.append(f"{indent}k{node} = {self._lit_expr(clock, 1)}")
+            for node in registers:
+                lines.append(f"{indent}if k{node} and not c[{node}] and v[{node}] != d{node}:")
+                lines.append(f"{indent}    v[{node}] = d{node}")
+                lines.append(f"{indent}    changed = True")
+                lines.append(f"{indent}c[{node}] = k{node}")
+            lines.append(f"{indent}if not changed:")
+            lines.append(f"{indent}    return v")
+        else:
+            lines.append("    return v")
+        namespace = {}
+        exec(compile("\n".join(lines), "<netlist>", "exec"), namespace)
+        self._evaluate = namespace["evaluate"]
+        return self._evaluate
+
+    def set_inputs(self, values):
+        for node, value in zip(self.inputs, values):
+            self.values[node] = 1 if value else 0
+
+    def evaluate(self, values=None):
+        if values is not None:
+            self.set_inputs(values)
+        if self._evaluate is None:
+            self.compile()
+        self._evaluate(self.values, self.clocks)
+        return [self.value(literal, bits) for literal, bits in zip(self.outputs, self.output_bits)]
+
+    def value(self, literal, bits=1):
+        node = literal >> 1
+        if literal & 1:
+            # Complement within the node's width; the constant takes the caller's
+            return self.values[node] ^ ((1 << (self.widths[node] if node else bits)) - 1)
+        return self.values[node]
+
+    def expand(self, carry="lookahead"):
+        """
+        Return a copy with ADD/CMP/MUX/DEC lowered to primitive gates.
+        ``carry`` picks the adder structure, see ``Macros.lower``.
+
+        Buses are taken apart with SPLIT and each macro-cell's result is packed
+        back with a MERGE, so the surrounding nodes are unchanged. REG is kept
+        as the storage element. Run ``optimize`` on the result to share the
+        bit slices and fold constants.
+        """
+        new = Netlist()
+        remap = {0: 0}
+        for node in self.inputs:
+            remap[node] = new.add_input(self.names[node])
+
+        # Allocate every node first so feedback and registers resolve; a
+        # macro-cell becomes the MERGE that collects its output bits.
+        for node in range(1, len(self.ops)):
+            op = self.ops[node]
+            if op in (CONST, INPUT):
+                continue
+            if op in MACRO_TYPES and op not in SEQUENTIAL:
+                op = "MERGE"
+            new_node = new.add_node(op, [], self.names[node], self.widths[node], self.params[node])
+            new.values[new_node] = self.values[node]
+            new.clocks[new_node] = self.clocks[node]
+            remap[node] = lit(new_node)
+
+        for node in range(1, len(self.ops)):
+            op = self.ops[node]
+            if op in (CONST, INPUT):
+                continue
+            fanins = [remap[literal >> 1] ^ (literal & 1) for literal in self.fanins[node]]
+            if op in MACRO_TYPES and op not in SEQUENTIAL:
+                fanins = lower(new, op, fanins, self.params[node], carry)
+            new.fanins[lit_node(remap[node])] = fanins
+
+        new.outputs = [remap[literal >> 1] ^ (literal & 1) for literal in self.outputs]
+        new.output_bits = list(self.output_bits)
+        new.gate_lits = {
+            gate: remap[literal >> 1] ^ (literal & 1) for gate, literal in self.gate_lits.items()
+        }
+        return new
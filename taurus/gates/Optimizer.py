@@ -0,0 +1,225 @@
+"""
+Logic optimization over a ``Netlist``.
+
+``optimize`` rebuilds the netlist in topological order and applies, node by node:
+
+* constant propagation from tied inputs (unconnected gate inputs read 0, and
+  primary inputs can be tied with ``constants``),
+* inverter folding: NOT gates become inverted literals, so NOT(NOT(x)) is x,
+* canonicalization of NAND/NOR/XNOR to AND/OR/XOR driving an inverted literal,
+* structural hashing, so identical gates over identical literals are merged,
+* bus plumbing: a SPLIT of a MERGE reads the merged bit directly, and
+  inversion is pushed through SPLIT onto its output literal,
+
+and finally sweeps every node with no path to a primary output. Macro-cells
+are only merged structurally; registers are never merged since they hold state.
+"""
+
+from gates.Macros import MACRO_TYPES, SEQUENTIAL
+from gates.Netlist import Netlist, CONST, INPUT, lit, lit_node
+
+CANONICAL = {
+    "AND": ("AND", 0),
+    "OR": ("OR", 0),
+    "XOR": ("XOR", 0),
+    "NAND": ("AND", 1),
+    "NOR": ("OR", 1),
+    "XNOR": ("XOR", 1),
+}
+
+
+def _simplify(op, fanins, stats):
+    """Return ``(op, fanins, inverted)``, or ``(None, literal, 0)`` when the gate folds away."""
+    if op == "XOR":
+        inverted = 0
+        odd = set()
+        for literal in fanins:
+            inverted ^= literal & 1
+            node = literal & ~1
+            if node == 0:
+                continue
+            if node in odd:
+                odd.remove(node)
+            else:
+                odd.add(node)
+        if len(odd) < 2:
+            stats["constants"] += 1
+            return None, (odd.pop() if odd else 0) ^ inverted, 0
+        return op, sorted(odd), inverted
+
+    # AND/OR: 'absorbing' forces the result, 'identity' is dropped
+    absorbing, identity = (0, 1) if op == "AND" else (1, 0)
+    kept = set()
+    for literal in fanins:
+        if literal == identity:
+            continue
+        if literal == absorbing or (literal ^ 1) in kept:
+            stats["constants"] += 1
+            return None, absorbing, 0
+        kept.add(literal)
+    if len(kept) < 2:
+        stats["constants"] += 1
+        return None, kept.pop() if kept else identity, 0
+    return op, sorted(kept), 0
+
+
+def optimize(net, constants=None, strash=True, sweep=True):
+    """
+    Return an optimized copy of ``net``.
+
+    :param constants: Optional ``{input_index: value}`` tying primary inputs to 0 or 1.
+    :param strash: Merge structurally identical gates.
+    :param sweep: Remove gates that cannot reach a primary output.
+
+    The returned netlist carries a ``report`` dictionary with the before/after
+    gate counts and how many gates each rewrite removed.
+    """
+    constants = constants or {}
+    order, _, loop_heads = net.levelize()
+    stats = {"constants": 0, "inverters": 0, "merged": 0, "dead": 0}
+
+    new = Netlist()
+    remap = {0: 0}
+    for index, node in enumerate(net.inputs):
+        if index in constants:
+            remap[node] = 1 if constants[index] else 0
+            new.add_input(net.names[node])  # keep input positions stable
+        else:
+            remap[node] = new.add_input(net.names[node])
+
+    # Nodes closing a feedback loop and registers are referenced before they
+    # are built, so they keep their own node and original operator.
+    registers = [node for node, op in enumerate(net.ops) if op in SEQUENTIAL]
+    for node in sorted(loop_heads.union(registers)):
+        new_node = new.add_node(
+            net.ops[node], [], net.names[node], net.widths[node], net.params[node]
+        )
+        new.values[new_node] = net.values[node]
+        new.clocks[new_node] = net.clocks[node]
+        remap[node] = lit(new_node)
+
+    table = {}
+    for node in order:
+        fanins = [remap[literal >> 1] ^ (literal & 1) for literal in net.fanins[node]]
+        if node in loop_heads:
+            new.fanins[lit_node(remap[node])] = fanins
+            continue
+
+        op = net.ops[node]
+        if op == "NOT":
+            stats["inverters"] += 1
+            remap[node] = (fanins[0] if fanins else 0) ^ 1
+            continue
+        if op == "SPLIT":
+            source = fanins[0] if fanins else 0
+            offset = net.params[node]
+            inverted = source & 1
+            source ^= inverted
+            if source == 0:
+                stats["constants"] += 1
+                remap[node] = inverted
+                continue
+            if new.ops[source >> 1] == "MERGE" and offset < len(new.fanins[source >> 1]):
+                stats["constants"] += 1
+                remap[node] = new.fanins[source >> 1][offset] ^ inverted
+                continue
+            fanins = [source]
+            key = (op, offset, source)
+        elif op == "MERGE":
+            inverted = 0
+            if all(literal == fanins[0] for literal in fanins) and fanins[0] in (0, 1):
+                stats["constants"] += 1
+                remap[node] = fanins[0]
+                continue
+            key = (op, tuple(fanins))
+        elif op in MACRO_TYPES:
+            inverted = 0
+            key = (op, net.params[node], tuple(fanins))
+        else:
+            op, inverted = CANONICAL[op]
+            op, fanins, extra = _simplify(op, fanins, stats)
+            if op is None:
+                remap[node] = fanins ^ inverted
+                continue
+            inverted ^= extra
+            key = (op, net.widths[node], tuple(fanins))
+
+        if strash and key in table:
+            stats["merged"] += 1
+            remap[node] = table[key] ^ inverted
+            continue
+        literal = lit(new.add_node(
+            op, fanins, net.names[node], net.widths[node], net.params[node]
+        ))
+        table[key] = literal
+        remap[node] = literal ^ inverted
+
+    for node in registers:
+        new.fanins[lit_node(remap[node])] = [
+            remap[literal >> 1] ^ (literal & 1) for literal in net.fanins[node]
+        ]
+
+    new.outputs = [remap[literal >> 1] ^ (literal & 1) for literal in net.outputs]
+    new.output_bits = list(net.output_bits)
+    new.gate_lits = {
+        gate: remap[literal >> 1] ^ (literal & 1) for gate, literal in net.gate_lits.items()
+    }
+
+    if sweep:
+        new = _sweep(new, stats)
+
+    new.report = {"before": net.gate_count(), "after": new.gate_count()}
+    new.report.update(stats)
+    return new
+
+
+def _sweep(net, stats):
+    live = [False] * len(net.ops)
+    live[0] = True
+    for node in net.inputs:
+        live[node] = True
+    stack = [literal >> 1 for literal in net.outputs]
+    while stack:
+        node = stack.pop()
+        if live[node]:
+            continue
+        live[node] = True
+        stack.extend(literal >> 1 for literal in net.fanins[node])
+
+    swept = Netlist()
+    renumber = {0: 0}
+    for node in net.inputs:
+        renumber[node] = lit_node(swept.add_input(net.names[node]))
+    for node in range(1, len(net.ops)):
+        if net.ops[node] == INPUT:
+            continue
+        if live[node]:
+            renumber[node] = swept.add_node(
+                net.ops[node], None, net.names[node], net.widths[node], net.params[node]
+            )
+            swept.values[renumber[node]] = net.values[node]
+            swept.clocks[renumber[node]] = net.clocks[node]
+        else:
+            stats["dead"] += 1
+    for node, new_node in renumber.items():
+        if net.ops[node] not in (CONST, INPUT):
+            swept.fanins[new_node] = [
+                lit(renumber[literal >> 1], literal & 1) for literal in net.fanins[node]
+            ]
+
+    swept.outputs = [lit(renumber[literal >> 1], literal & 1) for literal in net.outputs]
+    swept.output_bits = list(net.output_bits)
+    swept.gate_lits = {
+        gate: lit(renumber[literal >> 1], literal & 1)
+        for gate, literal in net.gate_lits.items()
+        if literal >> 1 in renumber
+    }
+    return swept
+
+
+def format_report(report):
+    return (
+        f"{report['before']} -> {report['after']} gates "
+        f"({report['constants']} folded, {report['inverters']} inverters, "
+        f"{report['merged']} merged, {report['dead']} dead)"
+    )
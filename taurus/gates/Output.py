@@ -7,7 +7,7 @@ class Output:
     def __init__(self, x, y) -> None:
         self.x = x  # Original x position
         self.y = y  # Original y position
-        self.port = Port(x - 20 - 30, y, self, "input")
+        self.port = Port(x - 20 - 30, y, self, "input", bits=0)  # Displays buses as integers
         self.input = self.port
         self.color = COLORS["INPUT"]
 
@@ -24,6 +24,7 @@ class Output:
         output = Output(data["x"], data["y"])
         output.color = COLORS["INPUT"]
         output.port = Port.deserialize(data["port"], output)
+        output.port.bits = 0
         output.move(output.x, output.y) # temporary serialization patch
         return output
     
@@ -2,7 +2,7 @@ import pygame
 import uuid
 
 class Port:
-    def __init__(self, x, y, gate, type="input", width=20, height=20) -> None:
+    def __init__(self, x, y, gate, type="input", width=20, height=20, bits=1) -> None:
         self.uuid = str(uuid.uuid4())
         self.x = x  # Original x position
         self.y = y  # Original y position
@@ -13,6 +13,7 @@ class Port:
         self.connected_from = None
         self.width = width  # Width of the port (default: 20)
         self.height = height  # Height of the port (default: 20)
+        self.bits = bits  # Bus width carried by the port (0 accepts any width)
 
     def serialize(self):
         return {
@@ -21,13 +22,14 @@ class Port:
             "y": self.y,
             "type": self.type,
             "value": self.value,
+            "bits": self.bits,
             "connected_to": [port.uuid for port in self.connected_to],
             "connected_from": self.connected_from.uuid if self.connected_from is not None else None
         }
 
     @classmethod
     def deserialize(cls, data, gate):
-        port = cls(data["x"], data["y"], gate, data["type"])
+        port = cls(data["x"], data["y"], gate, data["type"], bits=data.get("bits", 1))
         port.uuid = data["uuid"]
         port.value = data["value"]
         port.serial_to = data["connected_to"]
@@ -78,8 +80,11 @@ class Port:
     def connect(self, port):
         """
         Connect this port to another port.
-        Ensures proper connection based on port types (input/output).
+        Ensures proper connection based on port types (input/output)
+        and matching bus widths.
         """
+        if self.bits and port.bits and self.bits != port.bits:
+            return False
         if self.type != port.type:
             if self.type == "input":
                 if self.connected_from:
@@ -0,0 +1,217 @@
+"""
+Gate-level timing over a ``Netlist``.
+
+``TimedSimulator`` is an event-driven simulator with per-type inertial delays.
+Events live in a time wheel: one bucket per time step, sized to the longest
+delay, so scheduling is a list append and no event is ever re-sorted. Each
+time step applies all of its events first and then evaluates every affected
+gate once. A node holds at most one pending event; rescheduling it bumps the
+node's token, which cancels the earlier event, so pulses shorter than a gate's
+delay are swallowed. A node that changes more than once while settling a
+single input change is recorded as a glitch.
+
+``arrival_times`` and ``critical_path`` do the static counterpart in one pass
+over the levelized graph.
+"""
+
+from gates.Macros import SEQUENTIAL
+from gates.Netlist import CONST, INPUT
+
+# Propagation delay of each node type, in simulator time units
+DELAYS = {
+    "NOT": 1,
+    "NAND": 1,
+    "NOR": 1,
+    "AND": 2,
+    "OR": 2,
+    "XOR": 3,
+    "XNOR": 3,
+    "SPLIT": 0,
+    "MERGE": 0,
+    "ADD": 8,
+    "CMP": 6,
+    "MUX": 3,
+    "DEC": 2,
+    "REG": 2,  # Clock to output
+}
+
+
+def node_delays(net, delays=None):
+    delays = {**DELAYS, **(delays or {})}
+    return [delays.get(op, 0) for op in net.ops]
+
+
+def arrival_times(net, delays=None):
+    """
+    Return ``(arrival, previous)`` for every node.
+
+    ``arrival[node]`` is the latest time the node can change after the inputs
+    do, and ``previous[node]`` the fanin that sets it, or None at a source.
+    Inputs arrive at 0 and registers at their clock-to-output delay. Feedback
+    edges into a loop head are ignored, so ``previous`` never forms a cycle.
+    """
+    delay = node_delays(net, delays)
+    order, _, _ = net.levelize()
+    arrival = [0] * len(net.ops)
+    previous = [None] * len(net.ops)
+    position = [-1] * len(net.ops)  # Sources stay at -1 and always count
+    for index, node in enumerate(order):
+        position[node] = index
+    for node, op in enumerate(net.ops):
+        if op in SEQUENTIAL:
+            arrival[node] = delay[node]
+    for node in order:
+        latest = None
+        for literal in net.fanins[node]:
+            child = literal >> 1
+            if position[child] >= position[node]:
+                continue  # Back edge of a feedback loop
+            if latest is None or arrival[child] > arrival[latest]:
+                latest = child
+        arrival[node] = (arrival[latest] if latest is not None else 0) + delay[node]
+        previous[node] = latest
+    return arrival, previous
+
+
+def trace_path(previous, node):
+    """Follow ``previous`` back from ``node``; return the nodes from source to ``node``."""
+    path = [node]
+    seen = {node}
+    while previous[path[-1]] is not None and previous[path[-1]] not in seen:
+        path.append(previous[path[-1]])
+        seen.add(path[-1])
+    path.reverse()
+    return path
+
+
+def critical_path(net, delays=None):
+    """Return ``(delay, nodes)`` for the slowest primary output, nodes from source to output."""
+    arrival, previous = arrival_times(net, delays)
+    if not net.outputs:
+        return 0, []
+    node = max((literal >> 1 for literal in net.outputs), key=lambda node: arrival[node])
+    return arrival[node], trace_path(previous, node)
+
+
+class TimedSimulator:
+    def __init__(self, net, delays=None) -> None:
+        self.net = net
+        self.delays = node_delays(net, delays)
+        size = 1
+        while size <= max(self.delays):
+            size <<= 1
+        self.mask = size - 1
+        self.wheel = [[] for _ in range(size)]
+        self.pending = 0
+        self.time = 0
+        self.events = 0
+        # Runs on the netlist's own state, so ``net.value`` reads the timed values
+        self.values = net.values
+        self.clocks = net.clocks
+        self.fanouts = [[] for _ in net.ops]
+        for node, fanins in enumerate(net.fanins):
+            for child in {literal >> 1 for literal in fanins}:
+                self.fanouts[child].append(node)
+        self.functions = self._compile()
+        self.tokens = [0] * len(net.ops)  # Only the event carrying the node's token is live
+        self.scheduled = [None] * len(net.ops)  # Value of the node's live event, if any
+        self.epoch = 0
+        self.changed_in = [-1] * len(net.ops)  # Epoch of each node's last change
+        self.glitches = []  # (time, node) of every extra transition
+
+        # Settle the initial state through the same delays
+        order, _, _ = net.levelize()
+        for node in order:
+            self._schedule(node, self.functions[node](self.values), self.delays[node])
+
+    def _compile(self):
+        net = self.net
+        lines = ["def build():", "    return ["]
+        for node, op in enumerate(net.ops):
+            if op in (CONST, INPUT):
+                lines.append("        None,")
+            elif op in SEQUENTIAL:
+                d, clock = (net.fanins[node] + [0, 0])[:2]
+                lines.append(
+                    f"        lambda v: ({net._lit_expr(d, net.widths[node])}, {net._lit_expr(clock, 1)}),"
+                )
+            else:
+                lines.append(f"        lambda v: {net._node_expr(node)},")
+        lines.append("    ]")
+        namespace = {}
+        exec(compile("\n".join(lines), "<timing>", "exec"), namespace)
+        return namespace["build"]()
+
+    def _schedule(self, node, value, delay):
+        """Drive ``node`` towards ``value`` after ``delay``, replacing any pending event."""
+        scheduled = self.scheduled[node]
+        if scheduled is None:
+            if value == self.values[node]:
+                return
+        elif scheduled == value:
+            return  # Already on its way
+        self.tokens[node] += 1
+        if value == self.values[node]:
+            # The pending change is undone before it lands: drop it
+            self.scheduled[node] = None
+            return
+        self.scheduled[node] = value
+        self.wheel[(self.time + delay) & self.mask].append((node, value, self.tokens[node]))
+        self.pending += 1
+
+    def set_inputs(self, values):
+        """Apply new input values at the current time."""
+        self.epoch += 1
+        for node, value in zip(self.net.inputs, values):
+            self._schedule(node, 1 if value else 0, 0)
+
+    def run(self, until=None, max_events=None):
+        """
+        Process events until the circuit settles, time ``until`` is reached or
+        ``max_events`` have been handled. Returns the number of events handled.
+        """
+        wheel, mask, schedule = self.wheel, self.mask, self._schedule
+        values, clocks, functions = self.values, self.clocks, self.functions
+        delays, fanouts, ops = self.delays, self.fanouts, self.net.ops
+        tokens, scheduled = self.tokens, self.scheduled
+        changed_in, glitches, epoch = self.changed_in, self.glitches, self.epoch
+        handled = 0
+        while self.pending:
+            time = self.time
+            if until is not None and time >= until:
+                break
+            if max_events is not None and handled >= max_events:
+                break
+            slot = time & mask
+            # Zero-delay events land back in this slot and run as another pass
+            while wheel[slot]:
+                bucket = wheel[slot]
+                wheel[slot] = []
+                self.pending -= len(bucket)
+                dirty = set()
+                for node, value, token in bucket:
+                    if token != tokens[node]:
+                        continue  # Cancelled by a later schedule
+                    scheduled[node] = None
+                    handled += 1
+                    if values[node] == value:
+                        continue
+                    values[node] = value
+                    if changed_in[node] == epoch:
+                        glitches.append((time, node))
+                    changed_in[node] = epoch
+                    dirty.update(fanouts[node])
+                # Every affected gate sees the whole step's inputs at once
+                for target in dirty:
+                    if ops[target] in SEQUENTIAL:
+                        d, clock = functions[target](values)
+                        if clock and not clocks[target]:
+                            schedule(target, d, delays[target])
+                        clocks[target] = clock
+                    else:
+                        schedule(target, functions[target](values), delays[target])
+            self.time = time + 1
+        if until is not None and not self.pending:
+            self.time = max(self.time, until)
+        self.events += handled
+        return handled
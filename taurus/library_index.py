@@ -0,0 +1,208 @@
+"""
+Library lookup for the schematic generator.
+
+``LibraryResolver`` maps library names to ``.lbr`` files over a search path,
+and ``LibraryIndex`` keeps the symbols and device sets parsed from each file,
+keyed by path and modification time, so every library is parsed once per
+change. Both are built lazily: the name map on the first lookup, and a
+library's index the first time one of its symbols is needed. Call
+``LibraryResolver.prebuild`` to do all of that up front, e.g. before forking
+workers or to fill a ``$TAURUS_LBR_CACHE`` file that later runs load instead
+of parsing.
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+
+from .eaglepy import attributes
+from .eaglepy.eagle import Symbol as EagleSymbol
+from .eaglepy.primitives import Wire, Pin
+
+RC_PATTERN = re.compile(r'Lbr\.Managed\.(\d+)\.path\s*=\s*"(.+)"')
+EAGLE_RC_PATH = os.path.expanduser("~/Library/Application Support/Eagle/lbr/libraries.rc")
+BUNDLED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lbr")
+LBR_PATH_ENV = "TAURUS_LBR_PATH"  # os.pathsep separated directories of .lbr files
+RC_ENV = "EAGLE_LIBRARIES_RC"
+CACHE_ENV = "TAURUS_LBR_CACHE"
+
+class LibraryIndex:
+    """
+    Parsed ``libraries.rc`` files and per-``.lbr`` symbol indexes.
+
+    Entries are keyed by file path and modification time, so each file is read
+    once per change. The index holds plain data only and can be persisted to
+    ``cache_file`` (JSON) to skip parsing across runs.
+    """
+
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file
+        self.rc_files = {}  # {path: {"mtime": ..., "paths": {id: lbr_path}}}
+        self.libraries = {}  # {path: {"mtime": ..., "symbols": {...}, "device_sets": {...}}}
+        self.dirty = False
+        if cache_file and os.path.exists(cache_file):
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return  # A stale or broken cache is simply rebuilt
+        self.rc_files = data.get("rc_files", {})
+        self.libraries = data.get("libraries", {})
+
+    def save(self):
+        if not self.cache_file or not self.dirty:
+            return
+        with open(self.cache_file, 'w') as f:
+            json.dump({"rc_files": self.rc_files, "libraries": self.libraries}, f)
+        self.dirty = False
+
+    def rc_paths(self, rc_path):
+        mtime = os.path.getmtime(rc_path)
+        entry = self.rc_files.get(rc_path)
+        if entry is None or entry["mtime"] != mtime:
+            paths = {}
+            with open(rc_path, 'r') as f:
+                for line in f:
+                    m = RC_PATTERN.match(line)
+                    if m:
+                        paths[m.group(1)] = m.group(2)
+            entry = self.rc_files[rc_path] = {"mtime": mtime, "paths": paths}
+            self.dirty = True
+        return entry["paths"]
+
+    def library(self, lbr_path):
+        mtime = os.path.getmtime(lbr_path)
+        entry = self.libraries.get(lbr_path)
+        if entry is None or entry["mtime"] != mtime:
+            entry = self.libraries[lbr_path] = {"mtime": mtime, **self._index(lbr_path)}
+            self.dirty = True
+        return entry
+
+    def _index(self, lbr_path):
+        root = ET.parse(lbr_path).getroot()
+        symbols = {}
+        for symbol_elem in root.iter("symbol"):
+            name = symbol_elem.attrib.get("name")
+            if name in symbols:
+                continue  # The first definition wins, as with a linear search
+            symbols[name] = {
+                "wires": [
+                    [float(w.attrib["x1"]), float(w.attrib["y1"]), float(w.attrib["x2"]),
+                     float(w.attrib["y2"]), float(w.attrib["width"]), int(w.attrib["layer"])]
+                    for w in symbol_elem.iter("wire")
+                ],
+                "pins": [
+                    {
+                        "name": p.attrib["name"],
+                        "x": float(p.attrib["x"]),
+                        "y": float(p.attrib["y"]),
+                        "visible": p.attrib.get("visible", "off"),
+                        "length": p.attrib.get("length", "short"),
+                        "direction": p.attrib.get("direction", "pas"),
+                        "rot": p.attrib.get("rot", "R0"),
+                    }
+                    for p in symbol_elem.iter("pin")
+                ],
+            }
+        device_sets = {
+            ds.attrib.get("name"): [gate.attrib.get("symbol") for gate in ds.iter("gate")]
+            for ds in root.iter("deviceset")
+        }
+        return {"symbols": symbols, "device_sets": device_sets}
+
+    def symbol(self, lbr_path, symbol_name):
+        """Build a fresh ``Symbol`` from the index, or None if the library has no such symbol."""
+        data = self.library(lbr_path)["symbols"].get(symbol_name)
+        if data is None:
+            return None
+        items = [
+            Wire(x1=x1, y1=y1, x2=x2, y2=y2, width=width, layer=layer)
+            for x1, y1, x2, y2, width, layer in data["wires"]
+        ]
+        items.extend(
+            Pin(
+                name=p["name"], x=p["x"], y=p["y"], visible=p["visible"], length=p["length"],
+                direction=p["direction"], rotation=attributes.ATTR_ROT.parse(p["rot"])
+            )
+            for p in data["pins"]
+        )
+        return EagleSymbol(name=symbol_name, items=items)
+
+class LibraryResolver:
+    """
+    Maps library names to ``.lbr`` paths.
+
+    Sources are searched in order: ``directories``, the directories in
+    ``$TAURUS_LBR_PATH``, EAGLE's ``libraries.rc`` (``$EAGLE_LIBRARIES_RC`` or
+    the default macOS location, when present) and the libraries bundled with
+    taurus. The first library with a given name wins. The name map is built
+    once, so resolving is a dictionary lookup.
+    """
+
+    def __init__(self, directories=(), rc_files=None, bundled=True, index=None):
+        self.index = index or default_index
+        self.directories = list(directories)
+        self.directories += [d for d in os.environ.get(LBR_PATH_ENV, "").split(os.pathsep) if d]
+        if rc_files is None:
+            rc_files = [os.environ.get(RC_ENV, EAGLE_RC_PATH)]
+        self.rc_files = list(rc_files)
+        self.bundled = bundled
+        self._paths = None
+        self._resolved = {}
+
+    def paths(self):
+        """Return ``{name: path}`` over every source, names lower-cased."""
+        if self._paths is None:
+            paths = {}
+            found = []
+            for directory in self.directories:
+                found += self._scan(directory)
+            for rc_path in self.rc_files:
+                if os.path.exists(rc_path):
+                    found += self.index.rc_paths(rc_path).values()
+            if self.bundled:
+                found += self._scan(BUNDLED_DIR)
+            for path in found:
+                paths.setdefault(os.path.splitext(os.path.basename(path))[0].lower(), path)
+            self._paths = paths
+        return self._paths
+
+    @staticmethod
+    def _scan(directory):
+        if not os.path.isdir(directory):
+            return []
+        return [
+            os.path.join(directory, entry) for entry in sorted(os.listdir(directory))
+            if entry.lower().endswith(".lbr")
+        ]
+
+    def prebuild(self):
+        """
+        Build the name map and index every library it finds now, instead of
+        on first use. Returns the number of libraries indexed.
+        """
+        paths = self.paths()
+        for path in paths.values():
+            self.index.library(path)
+        self.index.save()  # No-op unless the index persists to disk
+        return len(paths)
+
+    def resolve(self, name):
+        key = name.lower()
+        if key not in self._resolved:
+            paths = self.paths()
+            # Exact library name first, then any path containing it like EAGLE's rc lookup
+            self._resolved[key] = paths.get(key) or next(
+                (path for path in paths.values() if key in path.lower()), None
+            )
+        if self._resolved[key] is None:
+            raise ValueError(f"Library {name} not found")
+        return self._resolved[key]
+
+# Shared by every Schematic in the process
+default_index = LibraryIndex(os.environ.get(CACHE_ENV))
+default_resolver = LibraryResolver()
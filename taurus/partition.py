@@ -0,0 +1,111 @@
+"""
+Min-cut partitioning of generated schematics into sheets.
+
+The graph of wired instances is split by recursive bisection. Each bisection
+takes the nodes breadth-first from one far from the rest, so the first side
+grows as a connected region, and cuts that order where the first side holds
+its share of the weight. A few greedy passes then move nodes across the cut
+whenever that cuts fewer wires, as long as both sides stay within the allowed
+imbalance. Every pass is linear in the edges, so a bisection is too.
+"""
+
+from collections import deque
+
+def partition_graph(weights, edges, parts, imbalance=0.1, passes=4):
+    """
+    Return the part, from 0 to ``parts - 1``, of each node.
+
+    :param weights: Weight of each node, e.g. the instances in a block.
+    :param edges: ``(i, j)`` pairs of wired nodes, one per wire.
+    :param parts: Number of parts.
+    :param imbalance: How far, as a fraction, a part may exceed its share of
+        the weight to cut fewer wires.
+    :param passes: Refinement passes per bisection, 0 keeps the cut as grown.
+    """
+    count = len(weights)
+    neighbours = [{} for _ in range(count)]
+    for i, j in edges:
+        if i != j:
+            neighbours[i][j] = neighbours[i].get(j, 0) + 1
+            neighbours[j][i] = neighbours[j].get(i, 0) + 1
+
+    result = [0] * count
+    side = [-1] * count  # Side of each node in the current bisection, -1 outside it
+    stack = [(list(range(count)), parts, 0)]
+    while stack:
+        nodes, k, first = stack.pop()
+        if k <= 1 or len(nodes) <= 1:
+            for i in nodes:
+                result[i] = first
+            continue
+        left_parts = k // 2
+        left, right = _bisect(nodes, weights, neighbours, side, left_parts / k, imbalance, passes)
+        stack.append((right, k - left_parts, first + left_parts))
+        stack.append((left, left_parts, first))
+    return result
+
+def _search(start, neighbours, side):
+    """The nodes reachable from ``start`` inside the bisection, breadth-first."""
+    component = [start]
+    reached = {start}
+    queue = deque([start])
+    while queue:
+        for j in neighbours[queue.popleft()]:
+            if side[j] >= 0 and j not in reached:
+                reached.add(j)
+                component.append(j)
+                queue.append(j)
+    return component
+
+def _bisect(nodes, weights, neighbours, side, fraction, imbalance, passes):
+    """Split ``nodes`` into two lists, the first with ``fraction`` of their weight."""
+    for i in nodes:
+        side[i] = 1
+
+    # Component by component, each from the far end of a first search
+    order = []
+    seen = set()
+    for root in nodes:
+        if root not in seen:
+            component = _search(_search(root, neighbours, side)[-1], neighbours, side)
+            seen.update(component)
+            order.extend(component)
+
+    total = sum(weights[i] for i in nodes)
+    target = total * fraction
+    left_weight = 0
+    for i in order:
+        w = weights[i]
+        if left_weight and left_weight + w - target > target - left_weight:
+            break
+        side[i] = 0
+        left_weight += w
+
+    max_left = target * (1 + imbalance)
+    max_right = (total - target) * (1 + imbalance)
+    for _ in range(passes):
+        moved = False
+        for i in order:
+            own = side[i]
+            internal = external = 0
+            for j, n in neighbours[i].items():
+                if side[j] == own:
+                    internal += n
+                elif side[j] >= 0:
+                    external += n
+            if external <= internal:
+                continue
+            new_left = left_weight - weights[i] if own == 0 else left_weight + weights[i]
+            if not 0 < new_left < total or new_left > max_left or total - new_left > max_right:
+                continue
+            side[i] = 1 - own
+            left_weight = new_left
+            moved = True
+        if not moved:
+            break
+
+    left = [i for i in nodes if side[i] == 0]
+    right = [i for i in nodes if side[i] == 1]
+    for i in nodes:
+        side[i] = -1
+    return left, right
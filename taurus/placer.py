@@ -0,0 +1,136 @@
+"""
+Connectivity-aware placement for generated schematics.
+
+Instances are taken cluster by cluster, each in breadth-first order over the
+wires, and laid along a Hilbert curve over a grid of equal slots, so parts
+that are close in that order end up close in both directions. A few passes
+then pull each instance towards its neighbours, swapping slots through a
+hash of the occupied slots whenever that shortens the wiring.
+"""
+
+import math
+from collections import deque
+
+def hilbert_point(order, d):
+    """Return the ``(x, y)`` of step ``d`` on a Hilbert curve over a ``2**order`` square."""
+    x = y = 0
+    s = 1
+    while s < 1 << order:
+        rx = 1 & (d // 2)
+        ry = 1 & (d ^ rx)
+        if ry == 0:
+            if rx == 1:
+                x, y = s - 1 - x, s - 1 - y
+            x, y = y, x
+        x += s * rx
+        y += s * ry
+        d //= 4
+        s *= 2
+    return x, y
+
+class Placer:
+    """
+    :param pitch: Grid the instance origins are snapped to, so pins stay on it.
+    :param spacing: Free space between neighbouring footprints.
+    :param iterations: Refinement passes, 0 keeps the curve order as is.
+    """
+
+    def __init__(self, pitch=2.54, spacing=5.08, iterations=4):
+        self.pitch = pitch
+        self.spacing = spacing
+        self.iterations = iterations
+
+    def place(self, footprints, edges, clusters=None):
+        """
+        Return an ``(x, y)`` origin for each instance.
+
+        :param footprints: ``(min_x, min_y, max_x, max_y)`` of each instance
+            around its own origin, pins included.
+        :param edges: ``(i, j)`` pairs of connected instances.
+        :param clusters: Lists of instance indices placed together, e.g. the
+            groups of a ``UnionFind``. Defaults to one cluster.
+        """
+        count = len(footprints)
+        if not count:
+            return []
+        neighbours = [[] for _ in range(count)]
+        for i, j in edges:
+            if i != j:
+                neighbours[i].append(j)
+                neighbours[j].append(i)
+        if clusters is None:
+            clusters = [range(count)]
+
+        # Clusters largest first, each in breadth-first order from its first member
+        order = []
+        seen = [False] * count
+        for cluster in sorted(clusters, key=len, reverse=True):
+            for root in cluster:
+                if seen[root]:
+                    continue
+                seen[root] = True
+                queue = deque([root])
+                while queue:
+                    i = queue.popleft()
+                    order.append(i)
+                    for j in neighbours[i]:
+                        if not seen[j]:
+                            seen[j] = True
+                            queue.append(j)
+
+        curve_order = max(0, math.ceil(math.log2(math.ceil(math.sqrt(count)))))
+        slots = [None] * count
+        occupied = {}
+        for d, i in enumerate(order):
+            slots[i] = hilbert_point(curve_order, d)
+            occupied[slots[i]] = i
+
+        for _ in range(self.iterations):
+            if not self._refine(slots, occupied, neighbours):
+                break
+
+        # Equal slots, large enough for any footprint, with origins on the pitch
+        pitch = self.pitch
+        snap = lambda value: math.ceil(value / pitch - 1e-9) * pitch
+        width = snap(max(f[2] - f[0] for f in footprints) + self.spacing)
+        height = snap(max(f[3] - f[1] for f in footprints) + self.spacing)
+        offset_x = snap(-min(f[0] for f in footprints))
+        offset_y = snap(-min(f[1] for f in footprints))
+        return [(offset_x + col * width, offset_y + row * height) for col, row in slots]
+
+    @staticmethod
+    def _cost(i, slot, slots, neighbours):
+        x, y = slot
+        return sum(abs(x - slots[j][0]) + abs(y - slots[j][1]) for j in neighbours[i])
+
+    def _refine(self, slots, occupied, neighbours):
+        """Move or swap each instance towards its neighbours' centroid; return whether anything moved."""
+        moved = False
+        cost = self._cost
+        for i, adjacent in enumerate(neighbours):
+            if not adjacent:
+                continue
+            target = (
+                round(sum(slots[j][0] for j in adjacent) / len(adjacent)),
+                round(sum(slots[j][1] for j in adjacent) / len(adjacent)),
+            )
+            current = slots[i]
+            if target == current:
+                continue
+            other = occupied.get(target)
+            before = cost(i, current, slots, neighbours)
+            if other is not None:
+                before += cost(other, target, slots, neighbours)
+                slots[i], slots[other] = target, current
+                after = cost(i, target, slots, neighbours) + cost(other, current, slots, neighbours)
+                if after < before:
+                    occupied[target], occupied[current] = i, other
+                    moved = True
+                else:
+                    slots[i], slots[other] = current, target
+            elif cost(i, target, slots, neighbours) < before:
+                slots[i] = target
+                del occupied[current]
+                occupied[target] = i
+                moved = True
+        return moved
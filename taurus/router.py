@@ -0,0 +1,182 @@
+"""
+Obstacle-aware orthogonal routing for generated schematics.
+
+The sheet is seen as a grid of ``pitch`` sized cells. Instance bounding boxes
+are rasterized into a spatial hash, and each connection is routed with A*
+over the cells inside a window around its end points, so a query only looks
+at the obstacles near it. Nets are routed independently against the
+instances, which is what lets ``route_nets`` spread them over processes.
+"""
+
+import heapq
+import math
+import multiprocessing
+from collections import defaultdict
+
+STEPS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+class ObstacleIndex:
+    """
+    Rectangles of blocked cells, bucketed by ``bucket`` x ``bucket`` cells so
+    a lookup only tests the few rectangles sharing its bucket.
+    """
+
+    def __init__(self, rects=(), bucket=16):
+        self.bucket = bucket
+        self.buckets = defaultdict(list)
+        for rect in rects:
+            self.add(rect)
+
+    def add(self, rect):
+        x0, y0, x1, y1 = rect
+        b = self.bucket
+        for bx in range(x0 // b, x1 // b + 1):
+            for by in range(y0 // b, y1 // b + 1):
+                self.buckets[(bx, by)].append(rect)
+
+    def blocked(self, x, y):
+        for x0, y0, x1, y1 in self.buckets.get((x // self.bucket, y // self.bucket), ()):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                return True
+        return False
+
+def simplify(points):
+    """Drop repeated points and the middle of straight runs from an orthogonal polyline."""
+    result = []
+    for point in points:
+        if result and point == result[-1]:
+            continue
+        if len(result) >= 2:
+            (ax, ay), (bx, by) = result[-2], result[-1]
+            if (ax == bx == point[0]) or (ay == by == point[1]):
+                result[-1] = point
+                continue
+        result.append(point)
+    return result
+
+class GridRouter:
+    """
+    Route two-point connections around rectangular obstacles.
+
+    :param obstacles: ``(min_x, min_y, max_x, max_y)`` boxes in sheet units,
+        e.g. from ``compute_instance_bbox``.
+    :param pitch: Grid spacing in sheet units.
+    :param clearance: Extra space kept around each obstacle.
+    :param margin: Cells the search window extends beyond the end points.
+    :param bend_cost: Cost of a turn, in cells, to prefer straight runs.
+    :param max_expansions: Cells A* may expand per attempt before giving up.
+    """
+
+    def __init__(self, obstacles, pitch=2.54, clearance=0.5, margin=8, bend_cost=2, max_expansions=100000):
+        self.pitch = pitch
+        self.margin = margin
+        self.bend_cost = bend_cost
+        self.max_expansions = max_expansions
+        self.index = ObstacleIndex()
+        for min_x, min_y, max_x, max_y in obstacles:
+            x0 = math.ceil((min_x - clearance) / pitch)
+            y0 = math.ceil((min_y - clearance) / pitch)
+            x1 = math.floor((max_x + clearance) / pitch)
+            y1 = math.floor((max_y + clearance) / pitch)
+            if x0 <= x1 and y0 <= y1:
+                self.index.add((x0, y0, x1, y1))
+
+    def cell(self, point):
+        return (round(point[0] / self.pitch), round(point[1] / self.pitch))
+
+    def route(self, start, end):
+        """
+        Return the points of an orthogonal polyline from ``start`` to ``end``,
+        or None when no path was found. The window around the end points is
+        widened a few times before giving up.
+        """
+        source, target = self.cell(start), self.cell(end)
+        margin = self.margin
+        for _ in range(3):
+            cells = self._search(source, target, margin)
+            if cells is not None:
+                pitch = self.pitch
+                # Short stubs join the exact pin positions to the grid
+                points = [start, (source[0] * pitch, start[1])]
+                points += [(x * pitch, y * pitch) for x, y in cells]
+                points += [(target[0] * pitch, end[1]), end]
+                return simplify(points)
+            margin *= 4
+        return None
+
+    def route_net(self, connections):
+        """Route each ``(start, end)`` pair of a net, see ``route``."""
+        return [self.route(start, end) for start, end in connections]
+
+    def _search(self, source, target, margin):
+        if source == target:
+            return [source]
+        min_x = min(source[0], target[0]) - margin
+        max_x = max(source[0], target[0]) + margin
+        min_y = min(source[1], target[1]) - margin
+        max_y = max(source[1], target[1]) + margin
+        tx, ty = target
+        blocked = self.index.blocked
+        bend_cost = self.bend_cost
+
+        # States are (cell, direction) so turns can be charged
+        start = (source, -1)
+        cost = {start: 0}
+        previous = {start: None}
+        # Ties on f go to the state nearest the target, which keeps the
+        # search close to a straight line across open space
+        h = abs(source[0] - tx) + abs(source[1] - ty)
+        heap = [(h, h, 0, source, -1)]
+        expansions = 0
+        while heap:
+            _, _, g, cell, direction = heapq.heappop(heap)
+            if g > cost[(cell, direction)]:
+                continue
+            if cell == target:
+                path = []
+                state = (cell, direction)
+                while state is not None:
+                    path.append(state[0])
+                    state = previous[state]
+                path.reverse()
+                return path
+            expansions += 1
+            if expansions > self.max_expansions:
+                return None
+            x, y = cell
+            for step, (dx, dy) in enumerate(STEPS):
+                nx, ny = x + dx, y + dy
+                if not (min_x <= nx <= max_x and min_y <= ny <= max_y):
+                    continue
+                next_cell = (nx, ny)
+                if next_cell != target and blocked(nx, ny):
+                    continue
+                ng = g + 1 + (bend_cost if direction not in (-1, step) else 0)
+                state = (next_cell, step)
+                if ng < cost.get(state, ng + 1):
+                    cost[state] = ng
+                    previous[state] = (cell, direction)
+                    h = abs(nx - tx) + abs(ny - ty)
+                    heapq.heappush(heap, (ng + h, h, ng, next_cell, step))
+        return None
+
+_worker_router = None
+
+def _init_worker(router):
+    global _worker_router
+    _worker_router = router
+
+def _route_net(connections):
+    return _worker_router.route_net(connections)
+
+def route_nets(router, nets, processes=None):
+    """
+    Route every net, a list of ``(start, end)`` pairs, and return the paths in
+    the same shape. With ``processes`` above one the nets are shared out to a
+    pool of workers, each holding its own copy of the router.
+    """
+    if not processes or processes <= 1 or len(nets) < 2:
+        return [router.route_net(connections) for connections in nets]
+    chunksize = max(1, len(nets) // (processes * 4))
+    with multiprocessing.Pool(processes, _init_worker, (router,)) as pool:
+        return pool.map(_route_net, nets, chunksize)
@@ -1,7 +1,8 @@
 import xml.etree.ElementTree as ET
-import os
-import re
+import heapq
 import math
+import multiprocessing
+from itertools import product
 from collections import defaultdict
 from pathlib import Path
 from .eaglepy.eagle import (
@@ -9,8 +10,19 @@ from .eaglepy.eagle import (
     Part as EaglePart, Library, Device_Set, Device, Connect, Symbol as EagleSymbol, 
     Segment, Instance as EagleInstance, Gate
 )
-from .eaglepy import default_layers
-from .eaglepy.primitives import Wire, Text, Pin, Rectangle, Circle, Pin_Ref as PinRef
+from .eaglepy import constants, default_layers, etree_utils
+from .eaglepy.primitives import Wire, Text, Pin, Rectangle, Circle, Junction, Label, Pin_Ref as PinRef
+from .library_index import LibraryResolver, default_index, default_resolver
+from .partition import partition_graph
+from .placer import Placer
+from .router import GridRouter, route_nets
+
+# Use NumPy to batch pin positions when it is available.
+# Otherwise, compute them instance by instance.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class Instance:
     def __init__(self, eagle_instance, schematic, part_name, device_set, prefix):
@@ -20,6 +32,7 @@ class Instance:
         self.device_set = device_set
         self.part = part_name
         self.prefix = prefix
+        self.sheet = 0  # Index into Schematic.sheets
 
     def wire(self, pin_name, target_instance, target_pin):
         self.connections[pin_name] = (target_instance, target_pin)
@@ -41,41 +54,65 @@ def get_pins_from_symbol(symbol):
             })
     return pins
 
-def compute_absolute_position(instance_x, instance_y, rotation, pin_x, pin_y):
-    rotation_str = str(rotation)
-    if rotation_str == 'R0':
-        return (instance_x + pin_x, instance_y + pin_y)
-    elif rotation_str == 'R90':
-        return (instance_x + pin_y, instance_y - pin_x)
-    elif rotation_str == 'R180':
-        return (instance_x - pin_x, instance_y - pin_y)
-    elif rotation_str == 'R270':
-        return (instance_x - pin_y, instance_y + pin_x)
+def rotation_matrix(rotation):
+    """
+    Return ``(a, b, c, d)`` of the 2x2 matrix for an EAGLE rotation: mirror
+    in x, then turn counter-clockwise by the angle. Quarter turns are exact.
+    """
+    angle = rotation.angle % 360
+    if angle % 90 == 0:
+        cos, sin = ((1, 0), (0, 1), (-1, 0), (0, -1))[int(angle) // 90]
     else:
-        return (instance_x + pin_x, instance_y + pin_y)
+        cos, sin = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+    mirror = -1 if rotation.mirrored else 1
+    return (mirror * cos, -sin, mirror * sin, cos)
+
+def compute_absolute_position(instance_x, instance_y, rotation, pin_x, pin_y):
+    a, b, c, d = rotation_matrix(rotation)
+    return (instance_x + a * pin_x + b * pin_y, instance_y + c * pin_x + d * pin_y)
+
+class RowLayout:
+    """
+    Resistors on the first row and transistors on the second, in the order
+    they are placed. A placed instance never moves, so the bounds are kept as
+    running min/max and placing an instance is O(1).
+    """
+
+    def __init__(self, x_spacing=20, y_spacing=20, padding=5):
+        self.x_spacing = x_spacing
+        self.padding = padding
+        self.cursors = {"R": [padding, padding], "Q": [padding, padding + y_spacing * 2]}
+        self.min_x = self.min_y = float('inf')
+        self.max_x = self.max_y = -float('inf')
+
+    def place(self, instance):
+        cursor = self.cursors.get(instance.part.name[:1])
+        if cursor:
+            instance.x, instance.y = cursor
+            cursor[0] += self.x_spacing * 2
+        self.include(instance)
+
+    def include(self, instance):
+        self.min_x = min(self.min_x, instance.x)
+        self.min_y = min(self.min_y, instance.y)
+        self.max_x = max(self.max_x, instance.x)
+        self.max_y = max(self.max_y, instance.y)
+
+    def bounds(self):
+        if self.min_x > self.max_x:
+            return {"width": self.padding*2, "height": self.padding*2, "x": -self.padding, "y": -self.padding}
+        return {
+            "width": self.max_x - self.min_x + self.padding*2,
+            "height": self.max_y - self.min_y + self.padding*2,
+            "x": self.min_x - self.padding,
+            "y": self.min_y - self.padding
+        }
 
 def organize_components(instances, x_spacing=20, y_spacing=20, padding=5):
-    resistors = [i for i in instances if i.part.name.startswith("R")]
-    transistors = [i for i in instances if i.part.name.startswith("Q")]
-    
-    x, y = padding, padding
-    for res in resistors:
-        res.x, res.y = x, y
-        x += x_spacing * 2
-    
-    x, y = padding, y + y_spacing * 2
-    for trans in transistors:
-        trans.x, trans.y = x, y
-        x += x_spacing * 2
-    
-    all_x = [i.x for i in instances]
-    all_y = [i.y for i in instances]
-    return {
-        "width": max(all_x) - min(all_x) + padding*2,
-        "height": max(all_y) - min(all_y) + padding*2,
-        "x": min(all_x) - padding,
-        "y": min(all_y) - padding
-    }
+    layout = RowLayout(x_spacing, y_spacing, padding)
+    for instance in instances:
+        layout.place(instance)
+    return layout.bounds()
 
 def compute_symbol_bbox(symbol):
     min_x, min_y, max_x, max_y = float('inf'), float('inf'), -float('inf'), -float('inf')
@@ -93,99 +130,475 @@ def compute_symbol_bbox(symbol):
     return (min_x, min_y, max_x, max_y)
 
 def compute_instance_bbox(instance):
-    symbol = instance.gate.symbol
-    sym_min_x, sym_min_y, sym_max_x, sym_max_y = compute_symbol_bbox(symbol)
-    rotation = math.radians(instance.rotation.angle)
-    cos_rot, sin_rot = math.cos(rotation), math.sin(rotation)
-    corners = [
-        (sym_min_x, sym_min_y), (sym_min_x, sym_max_y),
-        (sym_max_x, sym_max_y), (sym_max_x, sym_min_y)
-    ]
-    rotated_corners = [
-        (cx * cos_rot - cy * sin_rot, cx * sin_rot + cy * cos_rot)
-        for cx, cy in corners
-    ]
-    translated_corners = [(rx + instance.x, ry + instance.y) for rx, ry in rotated_corners]
-    min_x = min(c[0] for c in translated_corners)
-    min_y = min(c[1] for c in translated_corners)
-    max_x = max(c[0] for c in translated_corners)
-    max_y = max(c[1] for c in translated_corners)
+    return symbol_table(instance.gate.symbol).instance_bbox(instance)
+
+def _rotated_bbox(bbox, rotation, x=0, y=0):
+    a, b, c, d = rotation_matrix(rotation)
+    corners = [(a * cx + b * cy, c * cx + d * cy) for cx in bbox[::2] for cy in bbox[1::2]]
+    return (
+        min(cx for cx, _ in corners) + x, min(cy for _, cy in corners) + y,
+        max(cx for cx, _ in corners) + x, max(cy for _, cy in corners) + y
+    )
+
+class SymbolTable:
+    """
+    Pins and bounding box of one symbol, scanned once and shared by every
+    instance of it. The R0/R90/R180/R270 variants, plain and mirrored, are
+    precomputed, so placing an instance's pins or box is a lookup plus
+    additions. Other angles fall back to computing them per call.
+    """
+
+    ANGLES = (0, 90, 180, 270)
+
+    def __init__(self, symbol):
+        self.pins = get_pins_from_symbol(symbol)
+        self.pin_names = [pin['name'] for pin in self.pins]
+        self.bbox = compute_symbol_bbox(symbol)
+        self.pin_offsets = {}  # {(angle, mirrored): [(dx, dy), ...]} in pin order
+        self.bboxes = {}  # {(angle, mirrored): (min_x, min_y, max_x, max_y)} around the origin
+        for angle in self.ANGLES:
+            for mirrored in (False, True):
+                rotation = attributes.Rotation(angle, mirrored)
+                self.pin_offsets[(angle, mirrored)] = [
+                    compute_absolute_position(0, 0, rotation, pin['x'], pin['y']) for pin in self.pins
+                ]
+                self.bboxes[(angle, mirrored)] = _rotated_bbox(self.bbox, rotation)
+
+    def pin_positions(self, instance):
+        """Return ``[(pin_name, (x, y))]`` of the instance's pins on the sheet."""
+        rotation = instance.rotation
+        offsets = self.pin_offsets.get((rotation.angle, bool(rotation.mirrored)))
+        if offsets is None:
+            return [
+                (pin['name'], compute_absolute_position(instance.x, instance.y, rotation, pin['x'], pin['y']))
+                for pin in self.pins
+            ]
+        x, y = instance.x, instance.y
+        return [(name, (x + dx, y + dy)) for name, (dx, dy) in zip(self.pin_names, offsets)]
+
+    def instance_bbox(self, instance):
+        rotation = instance.rotation
+        bbox = self.bboxes.get((rotation.angle, bool(rotation.mirrored)))
+        if bbox is None:
+            return _rotated_bbox(self.bbox, rotation, instance.x, instance.y)
+        x, y = instance.x, instance.y
+        return (bbox[0] + x, bbox[1] + y, bbox[2] + x, bbox[3] + y)
+
+def symbol_table(symbol):
+    """The ``SymbolTable`` of a symbol, built on first use and kept on the symbol."""
+    table = getattr(symbol, 'table', None)
+    if table is None:
+        table = symbol.table = SymbolTable(symbol)
+    return table
+
+def compute_instance_footprint(instance):
+    """Bounding box of an instance with its pins, relative to the instance origin."""
+    table = symbol_table(instance.gate.symbol)
+    min_x, min_y, max_x, max_y = table.instance_bbox(instance)
+    min_x, min_y, max_x, max_y = min_x - instance.x, min_y - instance.y, max_x - instance.x, max_y - instance.y
+    for _, (x, y) in table.pin_positions(instance):
+        x, y = x - instance.x, y - instance.y
+        min_x, min_y, max_x, max_y = min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y)
     return (min_x, min_y, max_x, max_y)
 
+def compute_pin_positions(instances):
+    """
+    Return ``(keys, positions)`` for every pin of the EAGLE ``instances``:
+    its ``(part, pin)`` key and its sheet position, in the same order, so a
+    key's index serves as its integer id.
+
+    With NumPy the instances sharing a symbol are done as one block: their
+    rotation matrices are built as an array and applied to the symbol's pin
+    offsets in a single vectorized step. Otherwise each instance goes
+    through its ``SymbolTable``. Keys come grouped by symbol.
+    """
+    keys = []
+    if numpy is None:
+        positions = []
+        for inst in instances:
+            part_name = inst.part.name
+            for pin_name, position in symbol_table(inst.gate.symbol).pin_positions(inst):
+                keys.append((part_name, pin_name))
+                positions.append(position)
+        return keys, positions
+
+    # Instances grouped by symbol, so each group is one (instances, pins) block
+    groups = defaultdict(list)
+    for inst in instances:
+        groups[id(inst.gate.symbol)].append(inst)
+    positions = []
+    for group in groups.values():
+        table = symbol_table(group[0].gate.symbol)
+        if not table.pins:
+            continue
+        keys.extend(product([inst.part.name for inst in group], table.pin_names))
+        offsets = numpy.array([(pin['x'], pin['y']) for pin in table.pins], dtype=float)
+        origins = numpy.array([(inst.x, inst.y) for inst in group], dtype=float)
+        degrees = numpy.array([inst.rotation.angle for inst in group], dtype=float)
+        mirror = numpy.where([bool(inst.rotation.mirrored) for inst in group], -1.0, 1.0)
+        cos, sin = numpy.cos(numpy.radians(degrees)), numpy.sin(numpy.radians(degrees))
+        quarter = numpy.remainder(degrees, 90) == 0
+        cos[quarter], sin[quarter] = numpy.rint(cos[quarter]), numpy.rint(sin[quarter])
+        matrices = numpy.stack([mirror * cos, -sin, mirror * sin, cos], axis=1).reshape(-1, 2, 2)
+        block = numpy.einsum('nij,pj->npi', matrices, offsets) + origins[:, None, :]
+        flat = block.ravel().tolist()
+        positions.extend(zip(flat[0::2], flat[1::2]))
+    return keys, positions
+
+def assign_tracks(ranges):
+    """
+    Assign each ``(x0, x1)`` range, taken in start order, to the lowest track
+    that is free at ``x0``. Ranges may touch but not overlap on a track.
+
+    Tracks in use sit in a heap by end position and are moved to a heap of
+    free track indices once the sweep passes their end, so this is
+    O(n log n). Returns ``(tracks, count)`` with one track index per range.
+    """
+    order = sorted(range(len(ranges)), key=lambda i: ranges[i][0])
+    tracks = [0] * len(ranges)
+    busy = []  # (end, track)
+    free = []  # track indices
+    count = 0
+    for i in order:
+        x0, x1 = ranges[i]
+        while busy and busy[0][0] <= x0:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+        if free:
+            track = heapq.heappop(free)
+        else:
+            track = count
+            count += 1
+        tracks[i] = track
+        heapq.heappush(busy, (x1, track))
+    return tracks, count
+
+def _merge_intervals(intervals, stops):
+    """Join overlapping or touching ``(a, b)`` intervals of one line, then split them at ``stops``."""
+    intervals.sort()
+    runs = []
+    for a, b in intervals:
+        if runs and a <= runs[-1][1]:
+            if b > runs[-1][1]:
+                runs[-1][1] = b
+        else:
+            runs.append([a, b])
+    stops = sorted(set(stops))
+    split = []
+    j = 0
+    for a, b in runs:
+        while j < len(stops) and stops[j] <= a:
+            j += 1
+        while j < len(stops) and stops[j] < b:
+            split.append((a, stops[j]))
+            a = stops[j]
+            j += 1
+        split.append((a, b))
+    return split
+
+def _strictly_inside(runs, points):
+    """Map each of the sorted ``points`` to whether it lies strictly inside one of the sorted disjoint ``runs``."""
+    inside = {}
+    i = 0
+    for p in points:
+        while i < len(runs) and runs[i][1] <= p:
+            i += 1
+        inside[p] = i < len(runs) and runs[i][0] < p
+    return inside
+
+def coalesce_wires(segments, anchors=(), digits=6):
+    """
+    Clean up the ``((x1, y1), (x2, y2))`` wire segments of one net. Zero
+    length and duplicate segments are dropped. Horizontal and vertical
+    segments that overlap or touch on the same line are joined into one run,
+    which is split again at ``anchors`` (the net's pin positions) so that
+    every pin stays on a wire end. Coordinates are compared after rounding
+    to ``digits`` decimals.
+
+    Returns ``(segments, junctions)``, with a junction point wherever three
+    or more wire ends or runs meet, e.g. where a wire ends on another one.
+
+    Each line is merged by sorting its intervals and sweeping them once, and
+    the wire ends are matched against the runs of their lines the same way,
+    so this is O(n log n).
+    """
+    horizontal = defaultdict(list)  # y -> [(x0, x1)]
+    vertical = defaultdict(list)  # x -> [(y0, y1)]
+    diagonal = {}  # Kept as they are, once each
+    for (x1, y1), (x2, y2) in segments:
+        x1, y1, x2, y2 = round(x1, digits), round(y1, digits), round(x2, digits), round(y2, digits)
+        if y1 == y2 and x1 != x2:
+            horizontal[y1].append((min(x1, x2), max(x1, x2)))
+        elif x1 == x2 and y1 != y2:
+            vertical[x1].append((min(y1, y2), max(y1, y2)))
+        elif (x1, y1) != (x2, y2):
+            diagonal.setdefault(tuple(sorted(((x1, y1), (x2, y2)))), None)
+
+    stops_x = defaultdict(list)  # y -> anchor x on that row
+    stops_y = defaultdict(list)  # x -> anchor y on that column
+    for x, y in anchors:
+        x, y = round(x, digits), round(y, digits)
+        stops_x[y].append(x)
+        stops_y[x].append(y)
+
+    rows = {y: _merge_intervals(intervals, stops_x[y]) for y, intervals in sorted(horizontal.items())}
+    columns = {x: _merge_intervals(intervals, stops_y[x]) for x, intervals in sorted(vertical.items())}
+    merged = [((x0, y), (x1, y)) for y, runs in rows.items() for x0, x1 in runs]
+    merged += [((x, y0), (x, y1)) for x, runs in columns.items() for y0, y1 in runs]
+    merged += list(diagonal)
+
+    # A wire end counts once where it lies, a run passing through counts twice
+    ends = defaultdict(int)
+    for start, end in merged:
+        ends[start] += 1
+        ends[end] += 1
+    degree = dict(ends)
+    by_row = defaultdict(list)
+    by_column = defaultdict(list)
+    for x, y in sorted(ends):
+        by_row[y].append(x)
+        by_column[x].append(y)
+    for y, xs in by_row.items():
+        for x, inside in _strictly_inside(rows.get(y, ()), xs).items():
+            degree[(x, y)] += 2 * inside
+    for x, ys in by_column.items():
+        for y, inside in _strictly_inside(columns.get(x, ()), ys).items():
+            degree[(x, y)] += 2 * inside
+    junctions = sorted(point for point, count in degree.items() if count >= 3)
+    return merged, junctions
+
 class UnionFind:
+    """
+    Disjoint sets over hashable keys, with union by size and full path
+    compression. Keys are mapped to integer ids once and the forest is kept in
+    flat lists, so ``find`` is amortized near-constant.
+    """
+
     def __init__(self):
-        self.parent = {}
+        self.ids = {}  # key -> id
+        self.keys = []  # id -> key
+        self.parent = []  # id -> parent id
+        self.size = []  # id -> set size, valid at roots
+
+    def id(self, x):
+        i = self.ids.get(x)
+        if i is None:
+            i = self.ids[x] = len(self.keys)
+            self.keys.append(x)
+            self.parent.append(i)
+            self.size.append(1)
+        return i
+
+    def find_id(self, i):
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
 
     def find(self, x):
-        if x not in self.parent:
-            self.parent[x] = x
-        if self.parent[x] != x:
-            self.parent[x] = self.parent[self.parent[x]]
-            x = self.parent[x]
-        return x
+        return self.keys[self.find_id(self.id(x))]
+
+    def union_ids(self, i, j):
+        i, j = self.find_id(i), self.find_id(j)
+        if i == j:
+            return i
+        if self.size[i] > self.size[j]:
+            i, j = j, i
+        self.parent[i] = j
+        self.size[j] += self.size[i]
+        return j
 
     def union(self, x, y):
-        self.parent[self.find(x)] = self.find(y)
+        return self.keys[self.union_ids(self.id(x), self.id(y))]
+
+    def groups(self):
+        """Return ``{root key: [member keys]}`` in insertion order, in one pass."""
+        groups = defaultdict(list)
+        for i, key in enumerate(self.keys):
+            groups[self.keys[self.find_id(i)]].append(key)
+        return groups
+
+def connection_graph(instances):
+    """
+    Return the ``(i, j)`` edges between wired instances, by index, and the
+    clusters of instances wired together, as ``Placer.place`` takes them.
+    Wires to other instances, e.g. on other sheets, are left out.
+    """
+    index = {id(instance): i for i, instance in enumerate(instances)}
+    uf = UnionFind()
+    edges = []
+    for i, instance in enumerate(instances):
+        uf.id(i)
+        for target_instance, _ in instance.connections.values():
+            j = index.get(id(target_instance))
+            if j is None:
+                continue
+            edges.append((i, j))
+            uf.union(i, j)
+    return edges, list(uf.groups().values())
+
+# Length of the stub drawn from a pin wired to another sheet, to its label
+STUB_LENGTH = 5.08
+LABEL_SIZE = 1.778
+
+def pin_direction(instance, pin_name):
+    """
+    Unit vector pointing away from the symbol at a pin of an EAGLE instance,
+    on the sheet. EAGLE pins run from their connection point into the symbol.
+    """
+    for item in instance.gate.symbol.items:
+        if isinstance(item, Pin) and item.name == pin_name:
+            a, _, c, _ = rotation_matrix(item.rotation)
+            return compute_absolute_position(0, 0, instance.rotation, -a, -c)
+    raise ValueError(f"Symbol {instance.gate.symbol.name} has no pin {pin_name}")
+
+def draw_nets(instances, nets, route=True, processes=None, coalesce=True):
+    """
+    Draw the nets of one sheet and return their ``Net`` objects.
+
+    :param instances: The EAGLE instances on the sheet.
+    :param nets: The ``(name, connections, stubs)`` of each net on the sheet:
+        its connections between pins on the sheet, and its ``(part, pin)``
+        pins wired to other sheets. Those get a short stub with a
+        cross-reference label, which joins them to the net of the same name
+        on the other sheets.
+    :param route: See ``Schematic.wire_up``.
+    :param processes: See ``Schematic.wire_up``.
+    :param coalesce: See ``Schematic.wire_up``.
+    """
+    # Compute pin positions
+    pin_positions = dict(zip(*compute_pin_positions(instances)))
+
+    connections = [conn for _, net_conns, _ in nets for conn in net_conns]
+    for conn in connections:
+        conn['start_pos'] = pin_positions[(conn['start_part'], conn['start_pin'])]
+        conn['end_pos'] = pin_positions[(conn['end_part'], conn['end_pin'])]
+
+    # Route each net around the instances
+    if route and connections:
+        router = GridRouter([compute_instance_bbox(inst) for inst in instances])
+        net_conns = [conns for _, conns, _ in nets if conns]
+        paths = route_nets(
+            router, [[(c['start_pos'], c['end_pos']) for c in conns] for conns in net_conns], processes
+        )
+        for conns, net_paths in zip(net_conns, paths):
+            for conn, path in zip(conns, net_paths):
+                conn['path'] = path
+
+    # Assign tracks to the horizontal connections left unrouted
+    horizontal_conns = [
+        conn for conn in connections
+        if conn.get('path') is None and conn['start_pos'][0] != conn['end_pos'][0]
+    ]
+    x_ranges = [
+        (min(conn['start_pos'][0], conn['end_pos'][0]), max(conn['start_pos'][0], conn['end_pos'][0]))
+        for conn in horizontal_conns
+    ]
+    for conn, track in zip(horizontal_conns, assign_tracks(x_ranges)[0]):
+        conn['track'] = track
+
+    # Define track positions
+    track_spacing = 2
+    max_y = max(inst.y for inst in instances) if instances else 0
+    y_base = max_y + 5
+
+    # Route wires for each net
+    by_part = {inst.part.name: inst for inst in instances}
+    drawn = []
+    for net_name, net_conns, stubs in nets:
+        lines = []
+        pin_refs = {}  # Keyed by (part, pin) so each pin is referenced once, in order
+        for conn in net_conns:
+            sx, sy = conn['start_pos']
+            ex, ey = conn['end_pos']
+            for part, pin in ((conn['start_part'], conn['start_pin']), (conn['end_part'], conn['end_pin'])):
+                if (part, pin) not in pin_refs:
+                    pin_refs[(part, pin)] = PinRef(part=part, gate="G$1", pin=pin)
+            path = conn.get('path')
+            if path is not None:
+                lines.extend(zip(path, path[1:]))
+            elif sx == ex:
+                lines.append(((sx, sy), (ex, ey)))
+            else:
+                track = conn.get('track')
+                if track is not None:
+                    y_track = y_base + track * track_spacing
+                    lines.extend([
+                        ((sx, sy), (sx, y_track)),
+                        ((sx, y_track), (ex, y_track)),
+                        ((ex, y_track), (ex, ey))
+                    ])
+
+        # Pins wired to other sheets: a stub away from the symbol, labeled with the net
+        labels = []
+        for part, pin in stubs:
+            if (part, pin) not in pin_refs:
+                pin_refs[(part, pin)] = PinRef(part=part, gate="G$1", pin=pin)
+            x, y = pin_positions[(part, pin)]
+            dx, dy = pin_direction(by_part[part], pin)
+            end = (x + dx * STUB_LENGTH, y + dy * STUB_LENGTH)
+            lines.append(((x, y), end))
+            angle = round(math.degrees(math.atan2(dy, dx))) % 360
+            labels.append(Label(
+                x=end[0], y=end[1], size=LABEL_SIZE, layer=constants.LAYERS.NAMES, xref=True,
+                rotation=attributes.Rotation(angle)
+            ))
+
+        junctions = []
+        if coalesce:
+            lines, junctions = coalesce_wires(lines, [pin_positions[key] for key in pin_refs])
+        wires = [Wire(x1=x1, y1=y1, x2=x2, y2=y2, width=0.2) for (x1, y1), (x2, y2) in lines]
+        segment = Segment(
+            items=list(pin_refs.values()) + wires + [Junction(x, y) for x, y in junctions] + labels
+        )
+        net = Net(name=net_name, net_class=0)
+        net.segments.append(segment)
+        drawn.append(net)
+    return drawn
+
+def _build_sheet(job):
+    """Place, draw and serialize one sheet in a worker; return the positions and the XML of each net."""
+    instances, edges, clusters, placer, nets, route, coalesce = job
+    footprints = [compute_instance_footprint(instance) for instance in instances]
+    positions = placer.place(footprints, edges, clusters)
+    for instance, (x, y) in zip(instances, positions):
+        instance.x, instance.y = x, y
+    section = etree_utils.Deferred_Section(Net)
+    for net in draw_nets(instances, nets, route, None, coalesce):
+        section.append_object(net)
+    return positions, section.chunks
 
 class Schematic:
-    def __init__(self):
+    def __init__(self, library_index=None, resolver=None):
         self.grid = Grid(distance=0.1, unit_dist="inch", unit="inch", style="lines", multiple=1, display=False)
         self.layers = default_layers.get_layers()
         self.sheet = Sheet()
-        self.eagle_schematic = EagleSchematic(sheets=[self.sheet])
+        self.sheets = [self.sheet]  # Shared with eagle_schematic
+        self.eagle_schematic = EagleSchematic(sheets=self.sheets)
         self.drawing = Drawing(grid=self.grid, layers=self.layers, document=self.eagle_schematic)
         self.libraries = {}
         self.device_sets = {}
+        self.device_set_libraries = {}
         self.devices = {}
         self.parts = {}
         self.instances = []
         self.part_counters = {}
-
-    def _parse_rc_file(self):
-        rc_path = os.path.expanduser("~/Library/Application Support/Eagle/lbr/libraries.rc")
-        library_paths = {}
-        with open(rc_path, 'r') as f:
-            for line in f:
-                m = re.match(r'Lbr\.Managed\.(\d+)\.path\s*=\s*"(.+)"', line)
-                if m:
-                    library_paths[m.group(1)] = m.group(2)
-        return library_paths
+        self.layout = RowLayout()
+        self.library_index = library_index or default_index
+        if resolver is None:
+            resolver = default_resolver if library_index is None else LibraryResolver(index=library_index)
+        self.resolver = resolver
 
     def _find_library_path(self, name):
-        lib_paths = self._parse_rc_file().values()
-        for path in lib_paths:
-            if name.lower() in path.lower():
-                return path
-        raise ValueError(f"Library {name} not found")
+        return self.resolver.resolve(name)
 
     def _parse_symbol(self, lbr_path, symbol_name):
-        tree = ET.parse(lbr_path)
-        root = tree.getroot()
-        for symbol_elem in root.findall(".//symbol"):
-            if symbol_elem.attrib.get("name") == symbol_name:
-                items = []
-                for wire_elem in symbol_elem.findall(".//wire"):
-                    items.append(Wire(
-                        x1=float(wire_elem.attrib["x1"]),
-                        y1=float(wire_elem.attrib["y1"]),
-                        x2=float(wire_elem.attrib["x2"]),
-                        y2=float(wire_elem.attrib["y2"]),
-                        width=float(wire_elem.attrib["width"]),
-                        layer=int(wire_elem.attrib["layer"])
-                    ))
-                for pin_elem in symbol_elem.findall(".//pin"):
-                    items.append(Pin(
-                        name=pin_elem.attrib["name"],
-                        x=float(pin_elem.attrib["x"]),
-                        y=float(pin_elem.attrib["y"]),
-                        visible=pin_elem.attrib.get("visible", "off"),
-                        length=pin_elem.attrib.get("length", "short"),
-                        direction=pin_elem.attrib.get("direction", "pas"),
-                        rotation=attributes.ATTR_ROT.parse(pin_elem.attrib.get("rot", "R0"))
-                    ))
-                symbol = EagleSymbol(name=symbol_name, items=items)
-                symbol.bounding_box = compute_symbol_bbox(symbol)
-                return symbol
+        symbol = self.library_index.symbol(lbr_path, symbol_name)
+        if symbol is not None:
+            symbol.bounding_box = symbol_table(symbol).bbox
+        return symbol
 
     def init_libraries(self, *names):
         for name in names:
@@ -210,6 +623,7 @@ class Schematic:
         lib.device_sets.append(ds)
         lib.symbols.append(symbol)
         self.device_sets[name] = ds
+        self.device_set_libraries[name] = lib
         return ds
 
     def init_device(self, ds, name, package=None):
@@ -223,7 +637,7 @@ class Schematic:
         self.part_counters[prefix] += 1
         full_part_name = f"{prefix}{self.part_counters[prefix]}"
         ds = self.device_sets[device_set_name]
-        lib = next(lib for lib in self.libraries.values() if ds in lib.device_sets)
+        lib = self.device_set_libraries[device_set_name]
         part = EaglePart(name=full_part_name, library=lib, device_set=ds, device=ds.devices[part_name])
         self.parts[full_part_name] = part
         self.eagle_schematic.parts.append(part)
@@ -233,39 +647,195 @@ class Schematic:
         instance = Instance(eagle_instance, self, device_set_name, part_name, prefix)
         self.instances.append(instance)
         self.sheet.instances.append(eagle_instance)
-        self._organize_components()
+        self.layout.place(eagle_instance)
+        self._apply_bounds(self.layout.bounds())
         return instance
 
     def _organize_components(self):
-        bounds = organize_components([i.eagle_instance for i in self.instances])
-        self.sheet.width = bounds['width']
-        self.sheet.height = bounds['height']
-        self.sheet.x = bounds['x']
-        self.sheet.y = bounds['y']
-
-    def wire_up(self):
-        # Compute pin positions
-        pin_positions = {}
+        # Full relayout, only needed if instances were moved by hand or to other sheets
+        layouts = [RowLayout() for _ in self.sheets]
+        for instance in self.instances:
+            layouts[instance.sheet].place(instance.eagle_instance)
+        for sheet, layout in zip(self.sheets, layouts):
+            self._apply_bounds(layout.bounds(), sheet)
+        self.layout = layouts[0]
+
+    def partition(self, max_instances=250, blocks=None):
+        """
+        Split the instances across sheets of about ``max_instances`` each,
+        cutting as few wires between sheets as possible, see
+        ``partition_graph``. Call it once every instance is added and wired,
+        before ``place`` and ``wire_up`` or ``build``. Sheets are numbered in
+        the order of their first instance.
+
+        :param max_instances: Instances per sheet to aim for.
+        :param blocks: Lists of instances to keep on one sheet, e.g. one per
+            hierarchy block such as a full adder. Other instances are
+            assigned one by one.
+        """
+        index = {id(instance): i for i, instance in enumerate(self.instances)}
+        nodes = [None] * len(self.instances)
+        weights = []
+        for block in blocks or ():
+            for instance in block:
+                nodes[index[id(instance)]] = len(weights)
+            weights.append(len(block))
+        for i, node in enumerate(nodes):
+            if node is None:
+                nodes[i] = len(weights)
+                weights.append(1)
+        edges, _ = connection_graph(self.instances)
+        count = max(1, math.ceil(len(self.instances) / max_instances))
+        parts = partition_graph(weights, [(nodes[i], nodes[j]) for i, j in edges], count)
+
+        numbers = {}
+        for instance, node in zip(self.instances, nodes):
+            instance.sheet = numbers.setdefault(parts[node], len(numbers))
+        self.sheets[:] = [Sheet() for _ in range(max(1, len(numbers)))]
         for instance in self.instances:
-            inst = instance.eagle_instance
-            for pin in get_pins_from_symbol(inst.gate.symbol):
-                abs_pos = compute_absolute_position(inst.x, inst.y, inst.rotation, pin['x'], pin['y'])
-                pin_positions[(inst.part.name, pin['name'])] = abs_pos
+            self.sheets[instance.sheet].instances.append(instance.eagle_instance)
+        self.sheet = self.sheets[0]
+        self._organize_components()
 
-        # Collect all direct connections and group into nets
+    def place(self, placer=None):
+        """
+        Lay the instances out by connectivity instead of in rows, clustered
+        by the wires between them, each sheet on its own. Call it once every
+        instance is added and wired, before ``wire_up``.
+
+        :param placer: A configured ``Placer``, or None for the defaults.
+        """
+        placer = placer or Placer()
+        layouts = []
+        for sheet, instances in zip(self.sheets, self._sheet_instances()):
+            footprints = [compute_instance_footprint(instance.eagle_instance) for instance in instances]
+            positions = placer.place(footprints, *connection_graph(instances))
+
+            layout = RowLayout()
+            for instance, (x, y) in zip(instances, positions):
+                instance.eagle_instance.x, instance.eagle_instance.y = x, y
+                layout.include(instance.eagle_instance)
+            self._apply_bounds(layout.bounds(), sheet)
+            layouts.append(layout)
+        self.layout = layouts[0]
+
+    def _apply_bounds(self, bounds, sheet=None):
+        sheet = self.sheet if sheet is None else sheet
+        sheet.width = bounds['width']
+        sheet.height = bounds['height']
+        sheet.x = bounds['x']
+        sheet.y = bounds['y']
+
+    def wire_up(self, route=True, processes=None, coalesce=True):
+        """
+        Group the wired pins into nets and draw them, sheet by sheet. A net
+        spanning sheets is drawn on each with the same name, see ``draw_nets``.
+
+        :param route: Route around instances with ``GridRouter``. Otherwise,
+            and for any connection the router gives up on, draw doglegs down
+            to shared tracks below the instances.
+        :param processes: Worker processes to route nets in parallel.
+        :param coalesce: Merge the overlapping wires of each net and add
+            junctions, see ``coalesce_wires``.
+        """
+        for sheet, instances, nets in zip(self.sheets, self._sheet_instances(), self._sheet_nets()):
+            sheet.nets.extend(
+                draw_nets([instance.eagle_instance for instance in instances], nets, route, processes, coalesce)
+            )
+
+    def build(self, placer=None, route=True, coalesce=True, processes=None):
+        """
+        ``place`` and ``wire_up`` every sheet, each in a worker process of its
+        own that also serializes the sheet's nets, so a design split by
+        ``partition`` is generated in parallel. The nets are kept as XML, in a
+        ``Deferred_Section``, and parsed only if read before saving or saved
+        with ``snap_to_grid``.
+
+        :param placer: A configured ``Placer``, or None for the defaults.
+        :param route: See ``wire_up``.
+        :param coalesce: See ``wire_up``.
+        :param processes: Worker processes, at most one per sheet. With a
+            single sheet this is ``place`` then ``wire_up``, with the processes
+            routing nets instead.
+        """
+        if len(self.sheets) < 2 or not processes or processes <= 1:
+            self.place(placer)
+            self.wire_up(route, processes, coalesce)
+            return
+        placer = placer or Placer()
+        sheet_instances = self._sheet_instances()
+        jobs = [
+            ([instance.eagle_instance for instance in instances], *connection_graph(instances), placer,
+             nets, route, coalesce)
+            for instances, nets in zip(sheet_instances, self._sheet_nets())
+        ]
+        layouts = []
+        with multiprocessing.Pool(min(processes, len(jobs))) as pool:
+            results = pool.imap(_build_sheet, jobs)
+            for sheet, instances, (positions, chunks) in zip(self.sheets, sheet_instances, results):
+                layout = RowLayout()
+                for instance, (x, y) in zip(instances, positions):
+                    instance.eagle_instance.x, instance.eagle_instance.y = x, y
+                    layout.include(instance.eagle_instance)
+                self._apply_bounds(layout.bounds(), sheet)
+                layouts.append(layout)
+                sheet.nets = etree_utils.Deferred_Section(Net, chunks)
+        self.layout = layouts[0]
+
+    def _sheet_instances(self):
+        """The instances on each sheet, in the order they were added."""
+        groups = [[] for _ in self.sheets]
+        for instance in self.instances:
+            groups[instance.sheet].append(instance)
+        return groups
+
+    def _sheet_nets(self):
+        """
+        Split the nets by sheet: the ``(name, connections, stubs)`` of each
+        net on each sheet, in net order, as ``draw_nets`` takes them.
+        """
+        _, nets, _, names = self._nets()
+        sheet_of = {instance.eagle_instance.part.name: instance.sheet for instance in self.instances}
+        sheet_nets = [[] for _ in self.sheets]
+        for net_root, net_conns in nets.items():
+            by_sheet = {}
+            stubbed = set()
+            for conn in net_conns:
+                start = (conn['start_part'], conn['start_pin'])
+                end = (conn['end_part'], conn['end_pin'])
+                start_sheet, end_sheet = sheet_of[start[0]], sheet_of[end[0]]
+                for sheet in (start_sheet, end_sheet):
+                    if sheet not in by_sheet:
+                        by_sheet[sheet] = (names[net_root], [], [])
+                        sheet_nets[sheet].append(by_sheet[sheet])
+                if start_sheet == end_sheet:
+                    by_sheet[start_sheet][1].append(conn)
+                    continue
+                # Wired across sheets: a labeled stub on each side
+                for sheet, pin in ((start_sheet, start), (end_sheet, end)):
+                    if pin not in stubbed:
+                        stubbed.add(pin)
+                        by_sheet[sheet][2].append(pin)
+        return sheet_nets
+
+    def _nets(self):
+        """
+        Collect the direct connections and group them into nets.
+
+        :returns: ``(connections, nets, members, names)``: every connection,
+            then the connections, the ``(part, pin)`` pins and the name of each
+            net by its ``UnionFind`` root.
+        """
         uf = UnionFind()
         connections = []
         for instance in self.instances:
             for pin, (target_instance, target_pin) in instance.connections.items():
                 start = (instance.eagle_instance.part.name, pin)
                 end = (target_instance.eagle_instance.part.name, target_pin)
-                start_pos = pin_positions[start]
-                end_pos = pin_positions[end]
                 uf.union(start, end)
                 connections.append({
                     'start_part': start[0], 'start_pin': start[1],
-                    'end_part': end[0], 'end_pin': end[1],
-                    'start_pos': start_pos, 'end_pos': end_pos
+                    'end_part': end[0], 'end_pin': end[1]
                 })
 
         nets = defaultdict(list)
@@ -273,41 +843,16 @@ class Schematic:
             root = uf.find((conn['start_part'], conn['start_pin']))
             nets[root].append(conn)
 
-        # Assign tracks to horizontal connections
-        horizontal_conns = [
-            conn for conn in connections
-            if conn['start_pos'][0] != conn['end_pos'][0]
-        ]
-        horizontal_conns.sort(key=lambda c: min(c['start_pos'][0], c['end_pos'][0]))
-        tracks = []
-        for conn in horizontal_conns:
-            x_range = (min(conn['start_pos'][0], conn['end_pos'][0]), 
-                      max(conn['start_pos'][0], conn['end_pos'][0]))
-            assigned = False
-            for i, track in enumerate(tracks):
-                if not any(x_range[0] < t[1] and x_range[1] > t[0] for t in track):
-                    track.append(x_range)
-                    conn['track'] = i
-                    assigned = True
-                    break
-            if not assigned:
-                tracks.append([x_range])
-                conn['track'] = len(tracks) - 1
-
-        # Define track positions
-        track_spacing = 2
-        max_y = max(inst.eagle_instance.y for inst in self.instances) if self.instances else 0
-        y_base = max_y + 5
-
-        # Route wires for each net
+        # Every (part, pin) of each net, built in one pass
+        members = uf.groups()
+
+        # Unique net names, after the parts on each net
+        names = {}
         existing_net_names = set()
-        for net_root, net_conns in nets.items():
-            # Generate unique net name
-            parts = {p for p, _ in list(uf.parent.items()) if uf.find((p, None)) == net_root}
-            
+        for net_root in nets:
             counts = defaultdict(int)
-            for p in parts:
-                counts[p[0]] += 1
+            for part, _ in members[net_root]:
+                counts[part] += 1
             name_parts = [f"{t}{counts[t]}" for t in sorted(counts.keys())]
             base_name = "net_" + "_".join(name_parts)
             net_name = base_name
@@ -316,35 +861,23 @@ class Schematic:
                 net_name = f"{base_name}_{suffix}"
                 suffix += 1
             existing_net_names.add(net_name)
+            names[net_root] = net_name
+        return connections, nets, members, names
 
-            # Route wires
-            wires = []
-            pin_refs = set()
-            for conn in net_conns:
-                sx, sy = conn['start_pos']
-                ex, ey = conn['end_pos']
-                pin_refs.add(PinRef(part=conn['start_part'], gate="G$1", pin=conn['start_pin']))
-                pin_refs.add(PinRef(part=conn['end_part'], gate="G$1", pin=conn['end_pin']))
-                if sx == ex:
-                    wires.append(Wire(x1=sx, y1=sy, x2=ex, y2=ey, width=0.2))
-                else:
-                    track = conn.get('track')
-                    if track is not None:
-                        y_track = y_base + track * track_spacing
-                        wires.extend([
-                            Wire(x1=sx, y1=sy, x2=sx, y2=y_track, width=0.2),
-                            Wire(x1=sx, y1=y_track, x2=ex, y2=y_track, width=0.2),
-                            Wire(x1=ex, y1=y_track, x2=ex, y2=ey, width=0.2)
-                        ])
-
-            segment = Segment(items=list(pin_refs) + wires)
-            net = Net(name=net_name, net_class=0)
-            net.segments.append(segment)
-            self.eagle_schematic.sheets[0].nets.append(net)
+    def netlist(self):
+        """
+        Group the wired pins into nets, named as ``wire_up`` names them.
 
-    def save(self, filename):
+        :returns: ``{name: [(part, pin), ...]}``, in the order of the first
+            connection of each net.
+        """
+        _, nets, members, names = self._nets()
+        return {names[root]: members[root] for root in nets}
+
+    def save(self, filename, snap_to_grid=False):
         eagle = Eagle(drawing=self.drawing)
-        eagle.save(Path(filename))
+        eagle.save(Path(filename), snap_to_grid=snap_to_grid)
+        self.library_index.save()  # No-op unless the index persists to disk
         print(f"Schematic saved to {filename}")
 
 class Descriptor:
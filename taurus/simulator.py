@@ -8,6 +8,9 @@ from gates.Gates import Gate
 from utils.navbar import Menu
 from gates.Input import Input
 from gates.Output import Output
+from gates.Netlist import Netlist
+from gates.Optimizer import optimize, format_report
+from gates.Timing import TimedSimulator, critical_path
 from utils.colors import COLORS
 
 # Loading images
@@ -19,6 +22,13 @@ images = {
     "NOR" : pygame.image.load("./img/NOR.svg"),
     "XOR" : pygame.image.load("./img/XOR.svg"),
     "XNOR" : pygame.image.load("./img/XNOR.svg"),
+    "SPLIT" : pygame.image.load("./img/SPLIT.svg"),
+    "MERGE" : pygame.image.load("./img/MERGE.svg"),
+    "ADD" : pygame.image.load("./img/ADD.svg"),
+    "CMP" : pygame.image.load("./img/CMP.svg"),
+    "MUX" : pygame.image.load("./img/MUX.svg"),
+    "DEC" : pygame.image.load("./img/DEC.svg"),
+    "REG" : pygame.image.load("./img/REG.svg"),
     "INPUT" : pygame.image.load("./img/input.png"),
     "OUTPUT" : pygame.transform.flip(pygame.image.load("./img/input.png"), 1, 0)
 }
@@ -26,7 +36,7 @@ images = {
 # Setting variables
 pygame.display.set_caption("Taurus Logical Simulator")
 screen = pygame.display.set_mode((900, 600), pygame.RESIZABLE)
-gates_list = ["AND", "OR", "NOT", "NAND", "NOR", "XOR", "XNOR"]
+gates_list = ["AND", "OR", "NOT", "NAND", "NOR", "XOR", "XNOR", "SPLIT", "MERGE", "ADD", "CMP", "MUX", "DEC", "REG"]
 font = pygame.font.SysFont("arial", 10)
 port_font = pygame.font.SysFont("arial", 20, 1)
 
@@ -62,6 +72,15 @@ outputs[0].port.connected_from = gates[0].output
 for key in images:
     menu.add_child(key, images[key])
 
+# Compiled netlist, rebuilt whenever the circuit structure changes
+netlist = None
+netlist_key = None
+
+# Timed mode (Ctrl+T) runs the unoptimized netlist with per-gate delays
+timed_mode = False
+timed = None
+TICKS_PER_FRAME = 10
+
 # Zoom and panning variables
 zoom_level = 1.0
 min_zoom = 0.25
@@ -130,6 +149,7 @@ def load_project(filename):
 
         for uuid in ports:
             ports[uuid].solve_connections(ports)
+        compile_circuit(verbose=True)
 
 
         # Restore zoom level and pan offset
@@ -140,33 +160,62 @@ def load_project(filename):
     except Exception as e:
         print(f"Error loading project: {e}")
 
+def circuit_key():
+    return (
+        tuple(id(input_obj) for input_obj in inputs),
+        tuple(id(output.port.connected_from) for output in outputs),
+        tuple(
+            (id(gate), gate.type, gate.output.bits, gate.offset, tuple(id(port.connected_from) for port in gate.input))
+            for gate in gates
+        ),
+    )
+
+def compile_circuit(verbose=False):
+    global netlist, netlist_key, timed
+    netlist = optimize(Netlist.from_circuit(inputs, outputs, gates))
+    netlist_key = circuit_key()
+    timed = None
+    if timed_mode:
+        # Every gate keeps its own node, and so its own delay
+        timed = TimedSimulator(Netlist.from_circuit(inputs, outputs, gates))
+        delay, path = critical_path(timed.net)
+        print(f"Critical path: {delay} time units, {' -> '.join(timed.net.ops[node] for node in path)}")
+    if verbose:
+        print(f"Optimized netlist: {format_report(netlist.report)}")
+
 def calculate_output():
-    visited = {}  # port: value
-    def dfs(obj):
-        if type(obj) == Input:
-            return obj.port.value
-        if obj in visited:
-            return obj.output.value
-        visited[obj] = 0
-        for input in obj.input:
-            if input in visited:
-                input.value = visited[input]
-            else:
-                input.value = dfs(input.connected_from.gate) if input.connected_from else 0
-                visited[input] = input.value
-        obj.calculate()
-        return obj.output.value
+    if netlist is None or circuit_key() != netlist_key:
+        compile_circuit()
+    values = [input_obj.port.value for input_obj in inputs]
+    if timed:
+        timed.set_inputs(values)
+        timed.run(until=timed.time + TICKS_PER_FRAME)
+        pygame.display.set_caption(
+            f"Taurus Logical Simulator - t={timed.time} glitches={len(timed.glitches)}"
+        )
+        source = timed.net
+    else:
+        netlist.evaluate(values)
+        source = netlist
 
-    for output in outputs:
-        cur = output.port.connected_from if output.port.connected_from else None
-        output.port.value = dfs(cur.gate) if cur else 0
-        output.calculate()
+    for gate in gates:
+        literal = source.gate_lits.get(gate)
+        if literal is None:
+            # Not observable from any output: settle one step per frame as before
+            gate.calculate(update=True)
+        else:
+            gate.output.value = source.value(literal, gate.output.bits)
+            if gate.type == "REG":
+                gate.clock = source.clocks[literal >> 1]  # Keep the edge state across recompiles
 
     for input in inputs:
         for connection in input.port.connected_to:
             connection.value = input.port.value
-    for obj in gates + outputs:
-        obj.calculate(update=True)
+    for gate in gates:
+        for port in gate.input:
+            port.value = port.connected_from.value if port.connected_from else 0
+    for output in outputs:
+        output.calculate()
 
 def draw_bg():
     screen.fill(COLORS["GREY"])
@@ -219,6 +268,10 @@ while running:
                 save_project("project.json")
             elif event.key == pygame.K_o and pygame.key.get_mods() & pygame.KMOD_CTRL:  # Ctrl+O to load
                 load_project("project.json")
+            elif event.key == pygame.K_t and pygame.key.get_mods() & pygame.KMOD_CTRL:  # Ctrl+T for timed mode
+                timed_mode = not timed_mode
+                netlist_key = None
+                pygame.display.set_caption("Taurus Logical Simulator")
 
         # Zoom handling
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 4:  # Scroll up
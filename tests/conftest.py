@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The simulator modules import each other as top-level ``gates``/``utils``,
+# the way simulator.py runs them from the taurus directory
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "taurus"))
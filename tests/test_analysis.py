@@ -0,0 +1,21 @@
+from gates.Analysis import analyze, format_analysis
+
+from test_timing import nor_latch
+
+
+def test_feedback_circuit_report():
+    net, a, _ = nor_latch()
+    report = analyze(net)
+    assert report["loops"] == 1
+    (output,) = report["outputs"]
+    assert output["cone"] == 2
+    assert len(output["path"]) == len(set(output["path"]))
+    assert "Critical path" in format_analysis(report)
+
+
+def test_cones_limit():
+    net, a, b = nor_latch()
+    net.outputs.append(b << 1)
+    net.output_bits.append(1)
+    report = analyze(net, cones=1)
+    assert sum(output["cone"] is not None for output in report["outputs"]) == 1
@@ -0,0 +1,42 @@
+from taurus import schematic
+from taurus.eaglepy.eagle import Eagle
+
+
+def build_schematic():
+    sch = schematic.Schematic()
+    sch.init_libraries("transistor-npn", "resistor-power")
+    transistors = sch.init_device_set("BJT_", "Q")
+    sch.init_device(transistors, "NPN")
+    resistors = sch.init_device_set("R_", "R")
+    sch.init_device(resistors, "RES")
+    q1 = sch.add_instance("BJT_", "NPN", "Q")
+    q2 = sch.add_instance("BJT_", "NPN", "Q")
+    r1 = sch.add_instance("R_", "RES", "R")
+    q1.wire("C", r1, "1")
+    q1.wire("E", q2, "C")
+    r1.wire("2", q2, "E")
+    sch.wire_up()
+    return sch
+
+
+def test_load_save_round_trip(tmp_path):
+    first = tmp_path / "first.sch"
+    second = tmp_path / "second.sch"
+    build_schematic().save(first)
+
+    eagle = Eagle.load(str(first))
+    sheet = eagle.drawing.document.sheets[0]
+    assert len(sheet.instances) == 3
+    assert len(sheet.nets) == 3
+
+    eagle.save(str(second))
+    assert second.read_text() == first.read_text()
+
+
+def test_lazy_nets_round_trip(tmp_path):
+    first = tmp_path / "first.sch"
+    second = tmp_path / "second.sch"
+    build_schematic().save(first)
+
+    Eagle.load(str(first), lazy=("nets",)).save(str(second))
+    assert second.read_text() == first.read_text()
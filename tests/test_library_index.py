@@ -0,0 +1,18 @@
+import os
+
+from taurus.library_index import BUNDLED_DIR, LibraryIndex, LibraryResolver
+
+
+def test_prebuild_indexes_every_library(tmp_path):
+    cache_file = tmp_path / "index.json"
+    index = LibraryIndex(str(cache_file))
+    resolver = LibraryResolver(rc_files=[], index=index)
+    count = resolver.prebuild()
+
+    bundled = [name for name in os.listdir(BUNDLED_DIR) if name.endswith(".lbr")]
+    assert count == len(bundled)
+    assert set(index.libraries) == {resolver.resolve(os.path.splitext(name)[0]) for name in bundled}
+    assert cache_file.exists()
+
+    # A later run loads the index instead of parsing
+    assert set(LibraryIndex(str(cache_file)).libraries) == set(index.libraries)
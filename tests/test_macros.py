@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from gates.Netlist import Netlist
+
+
+def word(net, bits, prefix):
+    inputs = [net.add_input(f"{prefix}{i}") for i in range(bits)]
+    return net.add_node("MERGE", inputs, width=bits) << 1
+
+
+@pytest.mark.parametrize("carry", ["lookahead", "ripple"])
+@pytest.mark.parametrize("bits", [1, 3, 4, 5, 9])
+def test_lowered_adder_matches_native(bits, carry):
+    net = Netlist()
+    a, b = word(net, bits, "a"), word(net, bits, "b")
+    carry_in = net.add_input("c")
+    net.outputs.append(net.add_node("ADD", [a, b, carry_in], width=bits + 1, param=bits) << 1)
+    net.output_bits.append(bits + 1)
+    expanded = net.expand(carry)
+    assert "ADD" not in expanded.ops
+
+    rng = random.Random(bits)
+    for _ in range(64):
+        vector = [rng.randint(0, 1) for _ in net.inputs]
+        assert expanded.evaluate(vector) == net.evaluate(vector)
+
+
+def test_lookahead_is_shallower():
+    net = Netlist()
+    a, b = word(net, 16, "a"), word(net, 16, "b")
+    net.outputs.append(net.add_node("ADD", [a, b, 0], width=17, param=16) << 1)
+    net.output_bits.append(17)
+    depth = {
+        carry: max(net.expand(carry).levelize()[1]) for carry in ("lookahead", "ripple")
+    }
+    assert depth["lookahead"] < depth["ripple"]
@@ -0,0 +1,84 @@
+import random
+from functools import reduce
+from operator import and_, or_, xor
+
+import pytest
+
+from gates.Netlist import Netlist
+from gates.Optimizer import optimize
+
+OPS = ["AND", "OR", "NOT", "NAND", "NOR", "XOR", "XNOR"]
+
+
+def random_circuit(rng, inputs=6, gates=40, outputs=5):
+    net = Netlist()
+    literals = [net.add_input(f"i{i}") for i in range(inputs)]
+    for _ in range(gates):
+        op = rng.choice(OPS)
+        count = 1 if op == "NOT" else rng.choice([2, 2, 3, 4])
+        # Unconnected inputs (literal 0) read 0, like an open gate port
+        fanins = [rng.choice(literals + [0]) for _ in range(count)]
+        literals.append(net.add_node(op, fanins) << 1)
+    for literal in rng.sample(literals[inputs:], outputs):
+        net.outputs.append(literal)
+        net.output_bits.append(1)
+    return net
+
+
+def reference(net, vector):
+    """Evaluate gate by gate, the way ``Gate.calculate`` does."""
+    values = [0] * len(net.ops)
+    for node, value in zip(net.inputs, vector):
+        values[node] = value
+    for node in range(len(net.ops)):
+        op = net.ops[node]
+        if op not in OPS:
+            continue
+        ins = [values[literal >> 1] ^ (literal & 1) for literal in net.fanins[node]]
+        if op in ("AND", "NAND"):
+            value = reduce(and_, ins, 1)
+        elif op in ("OR", "NOR"):
+            value = reduce(or_, ins, 0)
+        elif op in ("XOR", "XNOR"):
+            value = reduce(xor, ins, 0)
+        else:
+            value = ins[0]
+        if op in ("NOT", "NAND", "NOR", "XNOR"):
+            value ^= 1
+        values[node] = value
+    return [values[literal >> 1] ^ (literal & 1) for literal in net.outputs]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_optimize_matches_reference(seed):
+    rng = random.Random(seed)
+    net = random_circuit(rng)
+    optimized = optimize(net)
+    assert optimized.gate_count() <= net.gate_count()
+    for _ in range(32):
+        vector = [rng.randint(0, 1) for _ in net.inputs]
+        expected = reference(net, vector)
+        assert net.evaluate(vector) == expected
+        assert optimized.evaluate(vector) == expected
+
+
+def test_optimize_folds_double_inversion():
+    net = Netlist()
+    x = net.add_input("x")
+    inner = net.add_node("NOT", [x]) << 1
+    net.outputs.append(net.add_node("NOT", [inner]) << 1)
+    net.output_bits.append(1)
+    optimized = optimize(net)
+    assert optimized.gate_count() == 0
+    assert optimized.evaluate([1]) == [1]
+
+
+def test_constants_tie_inputs():
+    net = Netlist()
+    x = net.add_input("x")
+    y = net.add_input("y")
+    net.outputs.append(net.add_node("AND", [x, y]) << 1)
+    net.output_bits.append(1)
+    optimized = optimize(net, constants={1: 0})
+    assert optimized.gate_count() == 0
+    assert optimized.evaluate([1, 1]) == [0]
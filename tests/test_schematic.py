@@ -0,0 +1,71 @@
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from taurus import schematic
+from taurus.eaglepy import attributes, etree_utils
+
+GRID = 2.54  # The schematic grid, 0.1 inch, in mm
+
+
+def build_chain(count):
+    sch = schematic.Schematic()
+    sch.init_libraries("transistor-npn", "resistor-power")
+    transistors = sch.init_device_set("BJT_", "Q")
+    sch.init_device(transistors, "NPN")
+    resistors = sch.init_device_set("R_", "R")
+    sch.init_device(resistors, "RES")
+    previous = None
+    for _ in range(count):
+        q = sch.add_instance("BJT_", "NPN", "Q")
+        r = sch.add_instance("R_", "RES", "R")
+        q.wire("C", r, "1")
+        if previous is not None:
+            previous.wire("E", q, "B")
+        previous = q
+    return sch
+
+
+def off_grid(path):
+    root = ET.parse(path).getroot()
+    coordinates = [
+        float(wire.get(name))
+        for sheet in root.iter("sheet")
+        for wire in sheet.iter("wire")
+        for name in ("x1", "y1", "x2", "y2")
+    ]
+    assert coordinates
+    return [value for value in coordinates if abs(value / GRID - round(value / GRID)) > 1e-6]
+
+
+def test_parallel_build_snaps_deferred_nets(tmp_path):
+    sch = build_chain(6)
+    sch.partition(max_instances=4)
+    assert len(sch.sheets) > 1
+    sch.build(processes=2)
+    for sheet in sch.sheets:
+        section = type(sheet).nets.peek(sheet)
+        assert isinstance(section, etree_utils.Deferred_Section)
+        # Knock the worker-generated wires off the grid
+        section.chunks = [re.sub(rb'x1="([-\d.]+)"', rb'x1="\g<1>1"', chunk) for chunk in section.chunks]
+    sch.save(tmp_path / "chain.sch", snap_to_grid=True)
+    assert off_grid(tmp_path / "chain.sch") == []
+
+
+def test_pin_positions_match_without_numpy(monkeypatch):
+    if schematic.numpy is None:
+        pytest.skip("numpy is not installed")
+    sch = build_chain(4)
+    for instance, rot in zip(sch.instances, ["R0", "R90", "MR180", "R270", "MR0", "R45", "MR90", "R180"]):
+        instance.eagle_instance.rotation = attributes.ATTR_ROT.parse(rot)
+        instance.eagle_instance.x += 1.27
+    instances = [instance.eagle_instance for instance in sch.instances]
+    keys, positions = schematic.compute_pin_positions(instances)
+    monkeypatch.setattr(schematic, "numpy", None)
+    fallback_keys, fallback_positions = schematic.compute_pin_positions(instances)
+
+    assert sorted(keys) == sorted(fallback_keys)
+    expected = dict(zip(fallback_keys, fallback_positions))
+    for key, (x, y) in zip(keys, positions):
+        assert (x, y) == pytest.approx(expected[key])
@@ -0,0 +1,64 @@
+from gates.Netlist import Netlist
+from gates.Timing import TimedSimulator, arrival_times, critical_path
+
+
+def nor_latch():
+    # a = NOR(i0, b), b = NOR(a, i1), output a
+    net = Netlist()
+    i0 = net.add_input("i0")
+    i1 = net.add_input("i1")
+    a = net.add_node("NOR", [i0, 0], "a")
+    b = net.add_node("NOR", [a << 1, i1], "b")
+    net.fanins[a][1] = b << 1
+    net.outputs.append(a << 1)
+    net.output_bits.append(1)
+    return net, a, b
+
+
+def test_latch_arrival_has_no_cycle():
+    net, a, b = nor_latch()
+    _, previous = arrival_times(net)
+    for node in (a, b):
+        seen = set()
+        while node is not None:
+            assert node not in seen
+            seen.add(node)
+            node = previous[node]
+
+
+def test_latch_critical_path_terminates():
+    net, a, b = nor_latch()
+    delay, path = critical_path(net)
+    assert path[-1] == a
+    assert len(path) == len(set(path))
+    assert delay > 0
+
+
+def test_simultaneous_inputs_do_not_glitch():
+    net = Netlist()
+    x = net.add_input("x")
+    y = net.add_input("y")
+    net.outputs.append(net.add_node("AND", [x, y]) << 1)
+    net.output_bits.append(1)
+    sim = TimedSimulator(net)
+    sim.set_inputs([0, 1])
+    sim.run()
+    sim.set_inputs([1, 0])
+    sim.run()
+    assert sim.glitches == []
+    assert net.value(net.outputs[0]) == 0
+
+
+def test_latch_holds_state():
+    net, a, b = nor_latch()
+    sim = TimedSimulator(net)
+    sim.set_inputs([0, 1])  # Reset
+    sim.run(max_events=1000)
+    sim.set_inputs([0, 0])
+    sim.run(max_events=1000)
+    assert net.values[a] == 1
+    sim.set_inputs([1, 0])  # Set
+    sim.run(max_events=1000)
+    sim.set_inputs([0, 0])
+    sim.run(max_events=1000)
+    assert net.values[a] == 0
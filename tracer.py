@@ -1,4 +1,5 @@
 from taurus import schematic
+from taurus.board import Board
 
 # Initialize the schematic
 sch = schematic.Schematic()
@@ -114,6 +115,11 @@ for i in range(4):
 for i in range(3):
     adders[i]["carry_out"].wire("C", adders[i + 1]["carry_in"], "B")
 
-# Generate and save the schematic
+# Generate and save the schematic and its board
+sch.place()
 sch.wire_up()
-sch.save("4bit_adder.sch")
\ No newline at end of file
+board = Board(sch)  # Gives the devices packages, so before saving the schematic
+board.place()
+board.wire_up()
+sch.save("4bit_adder.sch")
+board.save("4bit_adder.brd")
\ No newline at end of file